@@ -0,0 +1,9 @@
+"""
+Throughput benchmarks for hygge home × store pairs.
+
+Run from the repository root:
+
+    python -m benchmarks.run
+
+See benchmarks/README.md for scenarios, options and the baseline workflow.
+"""
@@ -0,0 +1,127 @@
+"""
+Local stand-in for an ADLS Gen2 / OneLake filesystem.
+
+Implements the part of the Azure Data Lake `FileSystemClient` surface that
+hygge's ADLSOperations uses, backed by a local directory. The real
+ADLSStore, OneLakeStore and ADLSOperations code runs unchanged, so the
+benchmark measures everything except the network.
+"""
+
+import io
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
+from unittest import mock
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+from hygge.stores.adls import ADLSStore
+
+
+class LocalLakeFileSystem:
+    """FileSystemClient look-alike rooted at a local directory."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def resolve(self, path: str) -> Path:
+        return self.root / str(path).strip("/")
+
+    def get_file_client(self, path: str) -> "LocalLakeFile":
+        return LocalLakeFile(self, str(path))
+
+    def get_directory_client(self, path: str) -> "LocalLakeDirectory":
+        return LocalLakeDirectory(self, str(path))
+
+    def create_directory(self, path: str, **kwargs) -> None:
+        self.resolve(path).mkdir(parents=True, exist_ok=True)
+
+    def get_paths(self, path: str, recursive: bool = True, **kwargs):
+        base = self.resolve(path)
+        entries = base.rglob("*") if recursive else base.glob("*")
+        for entry in sorted(entries):
+            yield SimpleNamespace(
+                name=entry.relative_to(self.root).as_posix(),
+                is_directory=entry.is_dir(),
+            )
+
+
+class LocalLakeFile:
+    """DataLakeFileClient look-alike."""
+
+    def __init__(self, fs: LocalLakeFileSystem, path: str):
+        self.fs = fs
+        self.path = fs.resolve(path)
+
+    def create_file(self, **kwargs) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(b"")
+
+    def append_data(self, data: bytes, offset: int, length: int = None, **kwargs):
+        with open(self.path, "r+b") as f:
+            f.seek(offset)
+            f.write(data[:length] if length is not None else data)
+
+    def flush_data(self, offset: int, **kwargs) -> None:
+        with open(self.path, "r+b") as f:
+            f.truncate(offset)
+
+    def upload_data(self, data: bytes, overwrite: bool = False, **kwargs) -> None:
+        if self.path.exists() and not overwrite:
+            raise ResourceExistsError(f"{self.path} already exists")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(data)
+
+    def get_file_properties(self, **kwargs):
+        if not self.path.is_file():
+            raise ResourceNotFoundError(f"{self.path} not found")
+        return SimpleNamespace(size=self.path.stat().st_size)
+
+    def download_file(self, **kwargs) -> "_Download":
+        self.get_file_properties()
+        return _Download(self.path.read_bytes())
+
+    def rename_file(self, new_name: str, **kwargs) -> None:
+        target = self.fs.resolve(new_name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self.path.replace(target)
+
+    def delete_file(self, **kwargs) -> None:
+        self.path.unlink()
+
+
+class _Download(io.BytesIO):
+    """StorageStreamDownloader look-alike (read() and readall())."""
+
+    def readall(self) -> bytes:
+        return self.read()
+
+
+class LocalLakeDirectory:
+    """DataLakeDirectoryClient look-alike."""
+
+    def __init__(self, fs: LocalLakeFileSystem, path: str):
+        self.path = fs.resolve(path)
+
+    def exists(self, **kwargs) -> bool:
+        return self.path.is_dir()
+
+    def create_directory(self, **kwargs) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def delete_directory(self, **kwargs) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+@contextmanager
+def local_lake(root: Path) -> Iterator[LocalLakeFileSystem]:
+    """Point every ADLS-based store (adls, onelake, ...) at a local directory."""
+    fs = LocalLakeFileSystem(root)
+    with (
+        mock.patch.object(ADLSStore, "_get_file_system_client", lambda self: fs),
+        mock.patch.object(ADLSStore, "_get_service_client", lambda self: None),
+    ):
+        yield fs
@@ -0,0 +1,259 @@
+"""
+Run the throughput benchmarks and compare them with the baseline.
+
+Each scenario runs in its own process through the real Coordinator and
+Flow, so peak RSS belongs to that scenario alone. Results are compared with
+benchmarks/baseline.json; a scenario that is slower or larger than the
+baseline by more than the tolerance is reported as a regression and the
+run exits non-zero.
+
+Usage:
+    python -m benchmarks.run                       # Default suite
+    python -m benchmarks.run -s parquet-wide -s sqlite-narrow
+    python -m benchmarks.run --rows 2000000 --output results.json
+    python -m benchmarks.run --update-baseline     # Accept current numbers
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from .scenarios import DEFAULT_SCENARIOS, SHAPES, STORES, parse_scenario
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_ROWS = 500_000
+DEFAULT_TOLERANCE = 0.25
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def write_workspace(workdir: Path, scenario: str, rows: int) -> Path:
+    """Write a one-flow hygge workspace for `scenario`; returns hygge.yml."""
+    store, shape = parse_scenario(scenario)
+    flow_dir = workdir / "flows" / "bench"
+    flow_dir.mkdir(parents=True, exist_ok=True)
+
+    flow = {
+        "name": "bench",
+        "home": {"type": "synthetic", "rows": rows, **SHAPES[shape]},
+        "store": STORES[store](workdir / "out"),
+        "entities": ["bench"],
+    }
+    (flow_dir / "flow.yml").write_text(yaml.safe_dump(flow, sort_keys=False))
+
+    hygge_yml = workdir / "hygge.yml"
+    workspace = {
+        "name": "benchmarks",
+        "flows_dir": "flows",
+        "options": {"concurrency": 1, "timings_file": False},
+    }
+    hygge_yml.write_text(yaml.safe_dump(workspace, sort_keys=False))
+    return hygge_yml
+
+
+async def run_scenario(scenario: str, rows: int, workdir: Path) -> Dict[str, Any]:
+    """Run one scenario in this process and return its measurements."""
+    # Registers the synthetic home type and the local ADLS stand-in
+    from hygge import Coordinator
+
+    from .local_lake import local_lake
+    from .synthetic import SyntheticHome  # noqa: F401
+
+    hygge_yml = write_workspace(workdir, scenario, rows)
+    with local_lake(workdir / "lake"):
+        coordinator = Coordinator(str(hygge_yml))
+        await coordinator.run()
+
+    result = coordinator.flow_results[0]
+    duration = result["duration"]
+    return {
+        "rows": result["rows"],
+        "seconds": round(duration, 3),
+        "rows_per_second": round(result["rows"] / duration) if duration else 0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "stages": {
+            stage: totals["seconds"] for stage, totals in result["timings"].items()
+        },
+    }
+
+
+def run_in_subprocess(scenario: str, rows: int) -> Dict[str, Any]:
+    """Run one scenario in a fresh interpreter and collect its result."""
+    with tempfile.TemporaryDirectory(prefix="hygge-bench-") as tmp:
+        result_file = Path(tmp) / "result.json"
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(REPO_ROOT), env.get("PYTHONPATH")) if p
+        )
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.run",
+            "--child",
+            scenario,
+            "--rows",
+            str(rows),
+            "--workdir",
+            tmp,
+            "--output",
+            str(result_file),
+        ]
+        completed = subprocess.run(
+            command, cwd=tmp, env=env, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            output = (completed.stdout + completed.stderr).strip().splitlines()
+            raise RuntimeError(
+                f"Scenario {scenario} failed:\n" + "\n".join(output[-20:])
+            )
+        return json.loads(result_file.read_text())
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Optional[Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Only scenarios present in both, measured at the same row count, are
+    compared.
+
+    Returns:
+        One message per regression (empty when everything is within tolerance)
+    """
+    if not baseline:
+        return []
+
+    regressions = []
+    for scenario, result in results.items():
+        base = baseline.get("scenarios", {}).get(scenario)
+        if not base or base.get("rows") != result["rows"]:
+            continue
+        floor = base["rows_per_second"] * (1 - tolerance)
+        if result["rows_per_second"] < floor:
+            regressions.append(
+                f"{scenario}: {result['rows_per_second']:,} rows/s is below "
+                f"baseline {base['rows_per_second']:,} rows/s"
+            )
+        ceiling = base["peak_rss_mb"] * (1 + tolerance)
+        if result["peak_rss_mb"] > ceiling:
+            regressions.append(
+                f"{scenario}: peak RSS {result['peak_rss_mb']:,.0f} MB is above "
+                f"baseline {base['peak_rss_mb']:,.0f} MB"
+            )
+    return regressions
+
+
+def format_table(
+    results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]]
+) -> str:
+    """Human-readable results, with change against the baseline."""
+    scenarios = (baseline or {}).get("scenarios", {})
+    lines = [
+        f"{'scenario':<20} {'rows/s':>12} {'vs base':>8} {'peak MB':>9}  top stages",
+    ]
+    for scenario, result in results.items():
+        base = scenarios.get(scenario)
+        change = ""
+        if base and base.get("rows") == result["rows"] and base["rows_per_second"]:
+            ratio = result["rows_per_second"] / base["rows_per_second"] - 1
+            change = f"{ratio:+.0%}"
+        top = sorted(result["stages"].items(), key=lambda s: s[1], reverse=True)[:3]
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in top)
+        lines.append(
+            f"{scenario:<20} {result['rows_per_second']:>12,} {change:>8} "
+            f"{result['peak_rss_mb']:>9,.0f}  {stages}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        help=f"<store>-<shape> to run (default: {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    # Internal: run one scenario in this process (used by the parent run)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        result = asyncio.run(run_scenario(args.child, args.rows, args.workdir))
+        args.output.write_text(json.dumps(result))
+        return 0
+
+    scenarios = args.scenario or DEFAULT_SCENARIOS
+    for scenario in scenarios:
+        parse_scenario(scenario)
+
+    results = {}
+    for scenario in scenarios:
+        print(f"Running {scenario} ({args.rows:,} rows)...", flush=True)
+        results[scenario] = run_in_subprocess(scenario, args.rows)
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    print()
+    print(format_table(results, baseline))
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.update_baseline:
+        if baseline:
+            # Keep scenarios that were not re-run
+            report["scenarios"] = {**baseline.get("scenarios", {}), **results}
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Benchmark scenarios: a synthetic table shape paired with a store.
+
+Every store that can run on one machine is covered. ADLS and OneLake run
+against a local directory (see local_lake.py); MSSQL and Open Mirroring
+need real services and are left to the integration tests.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Synthetic table shapes (SyntheticHomeConfig fields)
+SHAPES: Dict[str, Dict[str, Any]] = {
+    "narrow": {
+        "columns": {"int": 2, "float": 1, "string": 2, "timestamp": 1},
+        "string_width": 16,
+    },
+    "wide": {
+        "columns": {"int": 10, "float": 10, "string": 10, "timestamp": 5},
+        "string_width": 32,
+    },
+}
+
+# Store configs, given a scratch directory for their output
+STORES: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    "parquet": lambda out: {"type": "parquet", "path": str(out / "parquet")},
+    "local_csv": lambda out: {
+        "type": "local",
+        "path": str(out / "csv"),
+        "format": "csv",
+    },
+    "local_ndjson": lambda out: {
+        "type": "local",
+        "path": str(out / "ndjson"),
+        "format": "ndjson",
+    },
+    "sqlite": lambda out: {
+        "type": "sqlite",
+        "path": str(out / "bench.db"),
+        "table": "bench",
+    },
+    "adls": lambda out: {
+        "type": "adls",
+        "account_url": "https://bench.dfs.core.windows.net",
+        "filesystem": "bench",
+        "path": "data/{entity}/",
+    },
+    "onelake": lambda out: {
+        "type": "onelake",
+        "account_url": "https://onelake.dfs.fabric.microsoft.com",
+        "filesystem": "bench",
+    },
+}
+
+# Default suite: every store on the narrow shape, plus wide rows where
+# encoding dominates
+DEFAULT_SCENARIOS = [f"{store}-narrow" for store in STORES] + [
+    "parquet-wide",
+    "adls-wide",
+]
+
+
+def parse_scenario(name: str) -> tuple:
+    """Split 'store-shape' into (store, shape), validating both."""
+    store, _, shape = name.rpartition("-")
+    if store not in STORES or shape not in SHAPES:
+        raise ValueError(
+            f"Unknown scenario '{name}'. Use <store>-<shape> with store in "
+            f"{sorted(STORES)} and shape in {sorted(SHAPES)}"
+        )
+    return store, shape
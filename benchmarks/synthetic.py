@@ -0,0 +1,132 @@
+"""
+Synthetic in-memory Home for benchmarks.
+
+Generates deterministic batches of a configurable shape, so every store can
+be measured against the same source without reading files or a database.
+
+```yaml
+home:
+  type: synthetic
+  rows: 1000000
+  batch_size: 50000
+  columns:
+    int: 2
+    float: 1
+    string: 2
+    timestamp: 1
+  string_width: 16
+```
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+import polars as pl
+from pydantic import BaseModel, Field, field_validator
+
+from hygge.core.home import Home, HomeConfig
+
+COLUMN_KINDS = ("int", "float", "string", "timestamp")
+_EPOCH = datetime(2024, 1, 1)
+
+
+def synthetic_batch(
+    offset: int, rows: int, columns: Dict[str, int], string_width: int
+) -> pl.DataFrame:
+    """
+    Build rows [offset, offset + rows) of the synthetic table.
+
+    Values are derived from the row id, so the same range always produces
+    the same data, and vary enough that encoders cannot collapse them.
+    """
+    ids = pl.int_range(offset, offset + rows, eager=True, dtype=pl.Int64).alias("id")
+    row_id = pl.col("id")
+    exprs = []
+    for i in range(columns.get("int", 0)):
+        exprs.append(((row_id * (2_654_435_761 + i)) % 1_000_003).alias(f"int_{i}"))
+    for i in range(columns.get("float", 0)):
+        exprs.append((((row_id * (i + 7)) % 10_007) / 97.0).alias(f"float_{i}"))
+    for i in range(columns.get("string", 0)):
+        exprs.append(
+            ((row_id * (i + 31)) % 999_983)
+            .cast(pl.String)
+            .str.pad_start(string_width, "x")
+            .alias(f"string_{i}")
+        )
+    for i in range(columns.get("timestamp", 0)):
+        exprs.append(
+            (pl.lit(_EPOCH) + pl.duration(seconds=row_id * (i + 1))).alias(
+                f"timestamp_{i}"
+            )
+        )
+    return pl.DataFrame(ids).with_columns(exprs)
+
+
+class SyntheticHome(Home, home_type="synthetic"):
+    """
+    Home that generates `rows` rows in `batch_size` batches.
+
+    Example:
+        ```python
+        config = SyntheticHomeConfig(rows=100_000, columns={"int": 4})
+        home = SyntheticHome("bench", config)
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: "SyntheticHomeConfig",
+        entity_name: Optional[str] = None,
+    ):
+        super().__init__(name, config.get_merged_options())
+        self.config = config
+        self.entity_name = entity_name
+
+    async def _get_batches(self) -> AsyncIterator[pl.DataFrame]:
+        offset = 0
+        while offset < self.config.rows:
+            # Read at the start of every batch so adaptive batching applies
+            batch_size = self.options.get("batch_size", self.config.batch_size)
+            rows = min(batch_size, self.config.rows - offset)
+            yield synthetic_batch(
+                offset, rows, self.config.columns, self.config.string_width
+            )
+            offset += rows
+            await asyncio.sleep(0)  # Let consumers run between batches
+
+
+class SyntheticHomeConfig(HomeConfig, BaseModel, config_type="synthetic"):
+    """Configuration for a SyntheticHome."""
+
+    type: str = Field(default="synthetic", description="Home type")
+    rows: int = Field(default=1_000_000, ge=0, description="Total rows to generate")
+    batch_size: int = Field(default=50_000, ge=1, description="Rows per batch")
+    columns: Dict[str, int] = Field(
+        default_factory=lambda: {"int": 2, "float": 1, "string": 2, "timestamp": 1},
+        description="Number of columns of each kind (int, float, string, timestamp)",
+    )
+    string_width: int = Field(default=16, ge=1, description="Characters per string")
+    options: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional home options"
+    )
+
+    @field_validator("columns")
+    @classmethod
+    def validate_columns(cls, v):
+        """Only known column kinds, with non-negative counts."""
+        unknown = set(v) - set(COLUMN_KINDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown column kinds {sorted(unknown)}; use {list(COLUMN_KINDS)}"
+            )
+        if any(count < 0 for count in v.values()):
+            raise ValueError("Column counts cannot be negative")
+        return v
+
+    def get_merged_options(self) -> Dict[str, Any]:
+        """Get all options including defaults."""
+        options = {"batch_size": self.batch_size}
+        options.update(self.options)
+        return options
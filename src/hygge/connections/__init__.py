@@ -8,6 +8,7 @@ Key components:
 - BaseConnection: Interface for database connection factories
 - ConnectionPool: Async connection pool using asyncio.Queue
 - MssqlConnection: MS SQL Server connection factory (Azure AD support)
+- ThreadPoolEngine / CpuEngine: Shared pools for driver calls and CPU work
 """
 
 from .base import BaseConnection
@@ -21,13 +22,14 @@ from .constants import (
     get_mssql_home_defaults,
     get_mssql_store_defaults,
 )
-from .execution import ThreadPoolEngine, get_engine, register_engine
+from .execution import CpuEngine, ThreadPoolEngine, get_engine, register_engine
 from .mssql import MssqlConnection
 from .pool import ConnectionPool
 
 __all__ = [
     "BaseConnection",
     "ConnectionPool",
+    "CpuEngine",
     "MssqlConnection",
     "ThreadPoolEngine",
     "get_engine",
@@ -5,6 +5,8 @@ This module contains configuration models for default values used across differe
 connection types to ensure consistency, validation, and avoid duplication.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -22,6 +24,10 @@ class MssqlConnectionDefaults(BaseModel):
         default="Yes", description="Trust server certificate for SQL Server connections"
     )
     timeout: int = Field(default=30, ge=1, description="Connection timeout in seconds")
+    reader: Literal["pyodbc", "arrow_odbc"] = Field(
+        default="pyodbc",
+        description="Extraction path: pyodbc rows, or arrow-odbc columnar batches",
+    )
 
 
 class MssqlHomeBatchingDefaults(BaseModel):
@@ -4,12 +4,15 @@ Database execution engines for different execution strategies.
 Provides flexible execution strategies for different database types:
 - ThreadPoolEngine: For synchronous drivers (PYODBC) needing true parallelism
 - SimpleEngine: For simple operations using asyncio.to_thread()
+- CpuEngine: For CPU-bound data work (parquet encoding, polishing)
 
 hygge philosophy: Simple, focused abstraction with smart defaults.
 """
 
 import asyncio
 import concurrent.futures
+import os
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, Callable, Dict, Optional, TypeVar
 
@@ -147,26 +150,41 @@ class ThreadPoolEngine(ExecutionEngine):
         queue = asyncio.Queue(maxsize=5)  # Small buffer for smooth flow
         loop = asyncio.get_event_loop()
         exception_holder = {"exception": None}
+        # Set when the consumer stops early; the thread quits at the next batch
+        stop = threading.Event()
 
         def extract_to_queue():
             """Extract batches in thread, put in queue."""
+            batches = None
             try:
-                for batch in extract_func(*args):
+                batches = extract_func(*args)
+                for batch in batches:
+                    if stop.is_set():
+                        return
                     # Put batch in queue from thread
                     # Use run_coroutine_threadsafe to schedule async put
                     # .result() blocks thread until put completes (handles backpressure)
                     future = asyncio.run_coroutine_threadsafe(queue.put(batch), loop)
                     future.result()  # Wait for put, handles queue full case
+                    if stop.is_set():
+                        return
 
                 # Signal end of extraction
                 asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
             except Exception as e:
                 exception_holder["exception"] = e
                 # Signal end even on error
-                try:
-                    asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
-                except Exception:
-                    pass  # Queue might be full, that's ok
+                if not stop.is_set():
+                    try:
+                        asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+                    except Exception:
+                        pass  # Loop may be gone; nothing is waiting then
+            finally:
+                # Close the generator here so its cursor is released on this
+                # thread before the caller reuses the connection
+                close = getattr(batches, "close", None)
+                if close is not None:
+                    close()
 
         # Start extraction in thread pool
         extraction_task = cls._executor.submit(extract_to_queue)
@@ -184,15 +202,13 @@ class ThreadPoolEngine(ExecutionEngine):
 
                 yield batch
         finally:
-            # Ensure extraction thread completes (might already be done)
-            # Exceptions are already handled via exception_holder and raised above
-            try:
-                extraction_task.result(timeout=1.0)  # Wait for completion
-            except concurrent.futures.TimeoutError:
-                # Thread still running, that's ok - it will complete when queue drains
-                pass
-            # Note: Any other exception from result() would be unexpected since
-            # exceptions from extract_to_queue are caught and stored in exception_holder
+            # Stop the thread and free any put it is blocked on, then wait
+            # (without blocking the loop) until it has let go of its inputs,
+            # e.g. a connection the caller is about to release
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait({asyncio.wrap_future(extraction_task)})
 
     @classmethod
     def shutdown(cls) -> None:
@@ -209,6 +225,100 @@ class ThreadPoolEngine(ExecutionEngine):
         return cls._executor is not None
 
 
+class CpuEngine(ExecutionEngine):
+    """
+    Execution engine for CPU-bound data work.
+
+    Encoding a batch to parquet or polishing it can take seconds. Run inline
+    in an async method, that blocks the event loop and stalls every other
+    concurrent flow. Stores hand that work to this shared pool instead.
+
+    Polars and PyArrow release the GIL while they encode and evaluate
+    expressions, so a thread pool spreads the work across cores without
+    copying batches between processes. The pool is separate from
+    ThreadPoolEngine so long encodes never tie up database workers.
+
+    Sized by `options.cpu_workers` in hygge.yml (default: one per core).
+    """
+
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _pool_size: int = 0
+
+    @classmethod
+    def default_pool_size(cls) -> int:
+        """One worker per available core."""
+        return os.cpu_count() or 4
+
+    @classmethod
+    def initialize(cls, pool_size: Optional[int] = None) -> None:
+        """
+        Initialize shared CPU pool.
+
+        Args:
+            pool_size: Number of worker threads (default: one per core)
+        """
+        if cls._executor is None:
+            pool_size = pool_size or cls.default_pool_size()
+            cls._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=pool_size, thread_name_prefix="hygge-cpu"
+            )
+            cls._pool_size = pool_size
+            logger.debug(f"Initialized CpuEngine with {pool_size} workers")
+        else:
+            logger.warning("CpuEngine already initialized")
+
+    @classmethod
+    async def execute(cls, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a CPU-bound function in the shared pool.
+
+        Args:
+            func: Synchronous function to execute
+            *args, **kwargs: Arguments to pass to function
+
+        Returns:
+            Result of function execution
+        """
+        if cls._executor is None:
+            cls.initialize()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._executor, lambda: func(*args, **kwargs))
+
+    @classmethod
+    def execute_streaming(
+        cls, extract_func: Callable[..., Any], *args
+    ) -> AsyncIterator:
+        """
+        Not supported: CpuEngine only runs per-batch callables.
+
+        A generator would pin a CPU worker for the whole stream, and
+        collecting it up front would hold every batch in memory. Stream
+        from a source with ThreadPoolEngine and hand each batch to execute().
+
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError(
+            "CpuEngine only runs per-batch callables; use CpuEngine.execute() "
+            "for each batch, or ThreadPoolEngine.execute_streaming() to stream"
+        )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shutdown CPU pool."""
+        if cls._executor:
+            logger.debug("Shutting down CpuEngine")
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+            logger.debug("CpuEngine shutdown complete")
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        """Check if CPU pool is initialized."""
+        return cls._executor is not None
+
+
 class SimpleEngine(ExecutionEngine):
     """
     Simple execution engine using asyncio.to_thread().
@@ -295,3 +405,4 @@ def get_engine(name: str) -> ExecutionEngine:
 # Register default engines
 register_engine("thread_pool", ThreadPoolEngine())
 register_engine("simple", SimpleEngine())
+register_engine("cpu", CpuEngine())
@@ -6,22 +6,30 @@ Ports proven pattern from elk2 with improvements:
 - Instance-based token caching (thread-safe)
 - Implements BaseConnection interface
 - Cleaner API (no env var dependencies, direct parameters)
+
+Reads and writes can also bypass pyodbc's per-row Python objects:
+`read_arrow_batches` fetches result sets straight into columnar Arrow
+buffers and `insert_arrow` binds Arrow columns as parameter arrays, both via
+arrow-odbc (in the `mssql` extra, `pip install "hygge[mssql]"`).
 """
 
 import asyncio
 import struct
 import time
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 import pyodbc
 from azure.core.credentials import AccessToken
 from azure.identity import DefaultAzureCredential
 
 from hygge.messages import get_logger
-from hygge.utility.exceptions import HomeConnectionError, HomeError
+from hygge.utility.exceptions import HomeConnectionError, HomeError, StoreError
 
 from .base import BaseConnection
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class MssqlConnection(BaseConnection):
     """
@@ -70,6 +78,11 @@ class MssqlConnection(BaseConnection):
                 - encrypt: Enable encryption (default: "Yes")
                 - trust_cert: Trust server certificate (default: "Yes")
                 - timeout: Connection timeout in seconds (default: 30)
+                - reader: "pyodbc" (default) or "arrow_odbc" for homes
+                  reading through this connection
+                - authentication: ODBC Authentication keyword for arrow-odbc
+                  reads and loads (e.g. "ActiveDirectoryMsi")
+                - max_text_size: Cap for (MAX) text columns with arrow_odbc
         """
         super().__init__(server, database, options)
 
@@ -84,6 +97,7 @@ class MssqlConnection(BaseConnection):
         self.encrypt = self.options.get("encrypt", "Yes")
         self.trust_cert = self.options.get("trust_cert", "Yes")
         self.timeout = self.options.get("timeout", 30)
+        self.reader = self.options.get("reader", "pyodbc")
 
         # Logging
         self.logger = get_logger("hygge.connections.mssql")
@@ -223,8 +237,14 @@ class MssqlConnection(BaseConnection):
         # Convert token to MS Windows byte string
         token_bytes = self._convert_token_to_bytes(token)
 
-        # Build connection string
-        conn_str = (
+        # Attributes to pass before connection
+        attrs_before = {self.SQL_COPT_SS_ACCESS_TOKEN: token_bytes}
+
+        return self._base_connection_string(), attrs_before
+
+    def _base_connection_string(self) -> str:
+        """ODBC connection string without credentials."""
+        return (
             f"DRIVER={self.driver};"
             f"SERVER={self.server};"
             f"DATABASE={self.database};"
@@ -233,10 +253,54 @@ class MssqlConnection(BaseConnection):
             f"Timeout={self.timeout}"
         )
 
-        # Attributes to pass before connection
-        attrs_before = {self.SQL_COPT_SS_ACCESS_TOKEN: token_bytes}
+    def _arrow_connection_string(self) -> str:
+        """
+        ODBC connection string for arrow-odbc.
+
+        arrow-odbc opens its own ODBC connection and cannot take the access
+        token pyodbc passes before connecting, so the driver authenticates
+        itself via the `authentication` option (e.g. ActiveDirectoryMsi).
+        """
+        conn_str = self._base_connection_string()
+        authentication = self.options.get("authentication")
+        if authentication:
+            conn_str += f";Authentication={authentication}"
+        return conn_str
+
+    def read_arrow_batches(
+        self, query: str, batch_size: int
+    ) -> Iterator["pa.RecordBatch"]:
+        """
+        Stream a query's result as Arrow record batches via arrow-odbc.
 
-        return conn_str, attrs_before
+        The driver fills columnar buffers `batch_size` rows at a time, so no
+        Python object is built per row or value. Blocking: run it on a
+        worker thread (e.g. ThreadPoolEngine.execute_streaming).
+
+        Args:
+            query: SQL query to execute
+            batch_size: Rows per batch
+
+        Yields:
+            pyarrow RecordBatches
+
+        Raises:
+            HomeError: If arrow-odbc is not installed
+        """
+        read_arrow_batches_from_odbc = self._arrow_odbc(
+            "read_arrow_batches_from_odbc", HomeError
+        )
+
+        self.logger.debug(
+            f"Reading {self._mask_server()}.{self.database} via arrow-odbc"
+        )
+        yield from read_arrow_batches_from_odbc(
+            query=query,
+            connection_string=self._arrow_connection_string(),
+            batch_size=batch_size,
+            max_text_size=self.options.get("max_text_size"),
+            login_timeout_sec=self.timeout,
+        )
 
     def _convert_token_to_bytes(self, token: AccessToken) -> bytes:
         """
@@ -262,3 +326,80 @@ class MssqlConnection(BaseConnection):
         if "." in self.server:
             return self.server.split(".")[0]
         return self.server
+
+    def connect_arrow(self) -> Any:
+        """
+        Open an arrow-odbc connection to reuse across `insert_arrow` calls.
+
+        Every connection is a full ODBC login (an Azure AD one with
+        `authentication`), so callers inserting many chunks should hold one
+        rather than open one per insert. It closes once dropped. Blocking:
+        run it on a worker thread.
+
+        Returns:
+            arrow_odbc Connection (autocommit)
+
+        Raises:
+            StoreError: If arrow-odbc is not installed
+        """
+        connect = self._arrow_odbc("connect", StoreError)
+        return connect(
+            connection_string=self._arrow_connection_string(),
+            login_timeout_sec=self.timeout,
+        )
+
+    def insert_arrow(
+        self,
+        table: str,
+        data: "pa.Table",
+        chunk_size: int,
+        connection: Any = None,
+    ) -> None:
+        """
+        Insert an Arrow table via arrow-odbc.
+
+        Columns are bound as ODBC parameter arrays straight from the Arrow
+        buffers, `chunk_size` rows per round trip, so no Python tuple is
+        built per row. Commits on success. Blocking: run it on a worker
+        thread.
+
+        Args:
+            table: Target table (quoted as needed)
+            data: Rows to insert; column names must match the table's
+            chunk_size: Rows sent per round trip
+            connection: Connection from connect_arrow() to insert on;
+                without one, a new connection is opened for this insert
+
+        Raises:
+            StoreError: If arrow-odbc is not installed
+        """
+        import pyarrow as pa
+
+        reader = pa.RecordBatchReader.from_batches(
+            data.schema, data.to_batches(max_chunksize=chunk_size)
+        )
+        if connection is not None:
+            connection.insert_into_table(
+                reader=reader, chunk_size=chunk_size, table=table
+            )
+            return
+
+        insert_into_table = self._arrow_odbc("insert_into_table", StoreError)
+        insert_into_table(
+            reader=reader,
+            chunk_size=chunk_size,
+            table=table,
+            connection_string=self._arrow_connection_string(),
+            login_timeout_sec=self.timeout,
+        )
+
+    @staticmethod
+    def _arrow_odbc(name: str, error: type) -> Any:
+        """A function from arrow-odbc, or `error` saying how to install it."""
+        try:
+            import arrow_odbc
+        except ImportError as e:
+            raise error(
+                "This needs arrow-odbc. Install with: pip install arrow-odbc"
+            ) from e
+        return getattr(arrow_odbc, name)
@@ -196,6 +196,39 @@ class ConnectionPool:
             f"(queue size: {self._connections.qsize()})"
         )
 
+    async def discard(self, conn: Any) -> None:
+        """
+        Close a connection that must not be reused and replace it.
+
+        For connections left in an unknown state (e.g. mid-transaction after
+        a failed write). A fresh connection takes its place in the pool; if
+        one can't be opened now, the closed connection goes back instead and
+        acquire() replaces it once its health check fails.
+
+        Args:
+            conn: Connection to discard
+
+        Raises:
+            RuntimeError: If pool is not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError(f"Pool {self.name} not initialized")
+
+        try:
+            await self.connection_factory.close_connection(conn)
+        except Exception as e:
+            self.logger.warning(f"Error closing discarded connection: {str(e)}")
+
+        if self._closed:
+            return
+
+        try:
+            conn = await self.connection_factory.get_connection()
+        except Exception as e:
+            self.logger.warning(f"Could not replace discarded connection yet: {str(e)}")
+        await self._connections.put(conn)
+        self.logger.debug(f"Discarded connection from pool '{self.name}'")
+
     async def close(self) -> None:
         """
         Close all connections in the pool and shut down.
@@ -0,0 +1,54 @@
+"""
+Helpers for the Arrow batch lane.
+
+Homes normally yield Polars DataFrames. A Home that produces pyarrow record
+batches natively sets `supports_arrow`; a Store whose writers take Arrow sets
+`accepts_arrow`. When both are true and nothing is polished, a Flow moves
+the Arrow batches end to end instead of building a DataFrame per batch
+(see `Flow._use_arrow_lane`). These helpers let the shared plumbing (buffers,
+format writers) handle either kind of batch.
+
+pyarrow is imported only when Arrow data is actually in play: Polars does not
+load it, and it adds noticeably to every process's memory.
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, List, Union
+
+import polars as pl
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ArrowBatch = Union["pa.RecordBatch", "pa.Table"]
+
+
+def is_arrow(data: Any) -> bool:
+    """Whether `data` is a pyarrow RecordBatch or Table."""
+    # If pyarrow was never imported, nothing can be an Arrow batch
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(data, (pa.RecordBatch, pa.Table))
+
+
+def as_table(data: ArrowBatch) -> "pa.Table":
+    """Wrap a RecordBatch as a Table (zero-copy); Tables pass through."""
+    import pyarrow as pa
+
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    return data
+
+
+def concat_tables(parts: List[ArrowBatch]) -> "pa.Table":
+    """Combine Arrow batches into one Table over the same buffers."""
+    import pyarrow as pa
+
+    tables = [as_table(part) for part in parts]
+    return tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+
+
+def as_frame(data: Union[pl.DataFrame, ArrowBatch]) -> pl.DataFrame:
+    """Convert Arrow data to a Polars DataFrame; DataFrames pass through."""
+    if is_arrow(data):
+        return pl.from_arrow(as_table(data))
+    return data
@@ -0,0 +1,142 @@
+"""
+Chunked row buffer for Store batching.
+
+Stores receive data in whatever batch sizes the Home yields, but flush in
+their own `batch_size`. Concatenating every incoming frame onto one growing
+DataFrame copies the whole buffer on every write, which gets quadratic on
+large entities. BatchBuffer keeps incoming frames as an ordered list of
+chunks instead, and cuts exact-size batches across chunk boundaries using
+zero-copy slices. Arrow record batches and tables (from the Arrow lane,
+see core/arrow.py) are buffered and sliced the same way.
+
+Following hygge's philosophy:
+- **Comfort**: Stores get exact batch sizes without thinking about chunking
+- **Reliability**: Row order is preserved exactly as data arrived
+- **Natural flow**: Memory stays proportional to what is actually buffered
+"""
+
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Union
+
+import polars as pl
+
+from .arrow import ArrowBatch, concat_tables, is_arrow
+
+Chunk = Union[pl.DataFrame, ArrowBatch]
+
+
+class BatchBuffer:
+    """
+    Ordered buffer of DataFrame chunks with exact-size batch slicing.
+
+    Frames are appended as-is. `take(n)` returns the first `n` rows as a
+    single DataFrame whose columns reference the original chunk memory
+    (concatenated with `rechunk=False`), and leaves the remainder of a split
+    chunk in place as a zero-copy slice. Arrow chunks come back as one
+    `pyarrow.Table` over the same buffers.
+
+    Example:
+        ```python
+        buffer = BatchBuffer()
+        buffer.append(df_25k)
+        buffer.append(df_25k)
+        batch = buffer.take(40_000)  # 25k + first 15k of the second chunk
+        buffer.rows  # 10_000
+        ```
+
+    Args:
+        chunks: Optional initial frames to buffer (in order)
+    """
+
+    def __init__(self, chunks: Optional[Iterable[Chunk]] = None):
+        self._chunks: Deque[Chunk] = deque()
+        self.rows = 0
+        for chunk in chunks or []:
+            self.append(chunk)
+
+    def __len__(self) -> int:
+        """Number of buffered chunks."""
+        return len(self._chunks)
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    @property
+    def chunks(self) -> List[Chunk]:
+        """Buffered chunks in arrival order."""
+        return list(self._chunks)
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Estimated in-memory size of all buffered chunks."""
+        return sum(
+            chunk.nbytes if is_arrow(chunk) else chunk.estimated_size()
+            for chunk in self._chunks
+        )
+
+    def append(self, df: Chunk) -> None:
+        """Add a frame to the end of the buffer."""
+        self._chunks.append(df)
+        self.rows += len(df)
+
+    def take(self, n: int) -> Chunk:
+        """
+        Remove and return the first `n` rows from the buffer.
+
+        Whole chunks are handed over without copying; a chunk that straddles
+        the cut is split with `slice()`, which shares the underlying memory.
+        If fewer than `n` rows are buffered, everything is returned.
+
+        Args:
+            n: Number of rows to take
+
+        Returns:
+            DataFrame with up to `n` rows, in arrival order
+        """
+        if n >= self.rows:
+            return self.take_all()
+
+        parts: List[Chunk] = []
+        needed = n
+        while needed > 0:
+            head = self._chunks[0]
+            head_rows = len(head)
+            if head_rows <= needed:
+                parts.append(self._chunks.popleft())
+                needed -= head_rows
+            else:
+                parts.append(head.slice(0, needed))
+                self._chunks[0] = head.slice(needed)
+                needed = 0
+
+        self.rows -= n
+        return self._combine(parts)
+
+    def take_all(self) -> Optional[Chunk]:
+        """Remove and return every buffered row (None if nothing is buffered)."""
+        if not self._chunks:
+            return None
+        parts = list(self._chunks)
+        self.clear()
+        return self._combine(parts)
+
+    def to_frame(self) -> Optional[Chunk]:
+        """Return all buffered rows as one DataFrame without consuming them."""
+        if not self._chunks:
+            return None
+        return self._combine(list(self._chunks))
+
+    def clear(self) -> None:
+        """Drop all buffered chunks."""
+        self._chunks.clear()
+        self.rows = 0
+
+    @staticmethod
+    def _combine(parts: List[Chunk]) -> Chunk:
+        if is_arrow(parts[0]):
+            # A Table over the original buffers; nothing is copied
+            return concat_tables(parts)
+        if len(parts) == 1:
+            return parts[0]
+        # rechunk=False keeps each part's column memory instead of copying
+        return pl.concat(parts, rechunk=False)
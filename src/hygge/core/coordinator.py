@@ -31,6 +31,8 @@ from hygge.utility.run_id import generate_run_id
 
 from .flow import Entity, Flow, FlowFactory
 from .journal import Journal, JournalConfig
+from .memory import MemoryBudget, resolve_memory_budget
+from .timings import write_timings_report
 from .workspace import Workspace, WorkspaceConfig
 
 # Alias for backward compatibility - WorkspaceConfig is the canonical name
@@ -95,6 +97,8 @@ class Coordinator:
         self.flow_overrides = flow_overrides or {}  # CLI overrides for flow configs
         self.flow_filter = flow_filter or []  # List of flow names to execute
         self._concurrency: Optional[int] = None  # Resolved once, used everywhere
+        # Shared byte budget across flows (options.memory_budget, off by default)
+        self._memory_budget: Optional[MemoryBudget] = None
         self.logger = get_logger("hygge.coordinator")
         # Workspace instance (for loading config)
         self._workspace: Optional[Workspace] = None
@@ -183,6 +187,7 @@ class Coordinator:
 
         # Resolve concurrency once — single source of truth for all parallelism
         self._concurrency = self._resolve_concurrency()
+        self._memory_budget = resolve_memory_budget(self.options.get("memory_budget"))
 
         # Initialize connection pools (skip for dry-run preview)
         if not skip_connection_pools:
@@ -293,7 +298,7 @@ class Coordinator:
 
     async def _initialize_connection_pools(self) -> None:
         """Initialize connection pools and execution engines from configuration."""
-        from hygge.connections import ThreadPoolEngine
+        from hygge.connections import CpuEngine, ThreadPoolEngine
 
         concurrency = self._concurrency
 
@@ -301,6 +306,17 @@ class Coordinator:
         ThreadPoolEngine.initialize(pool_size=concurrency)
         self.logger.debug(f"Initialized ThreadPoolEngine with {concurrency} workers")
 
+        # CPU pool (encoding, polish): options.cpu_workers, default one per core
+        cpu_workers = self.options.get("cpu_workers")
+        if cpu_workers is not None:
+            if not str(cpu_workers).isdigit() or int(cpu_workers) < 1:
+                raise ConfigError(
+                    f"cpu_workers must be a positive integer, got '{cpu_workers}'"
+                )
+            cpu_workers = int(cpu_workers)
+        if not CpuEngine.is_initialized():
+            CpuEngine.initialize(pool_size=cpu_workers)
+
         if not self.config or not self.config.connections:
             self.logger.debug("No connections configured, skipping pool initialization")
             return
@@ -330,6 +346,9 @@ class Coordinator:
                                 "trust_cert", defaults.trust_cert
                             ),
                             "timeout": timeout,
+                            "reader": conn_config.get("reader", defaults.reader),
+                            "authentication": conn_config.get("authentication"),
+                            "max_text_size": conn_config.get("max_text_size"),
                         },
                     )
                 else:
@@ -375,11 +394,13 @@ class Coordinator:
 
     async def _cleanup_connection_pools(self) -> None:
         """Clean up all connection pools and execution engines."""
-        # Shutdown ThreadPoolEngine
-        from hygge.connections import ThreadPoolEngine
+        # Shutdown execution engines
+        from hygge.connections import CpuEngine, ThreadPoolEngine
 
         if ThreadPoolEngine.is_initialized():
             ThreadPoolEngine.shutdown()
+        if CpuEngine.is_initialized():
+            CpuEngine.shutdown()
 
         if not self.connection_pools:
             return
@@ -516,6 +537,11 @@ class Coordinator:
         self.logger.info(
             f"Running {len(self.flows)} flows with max concurrency of {max_concurrent}"
         )
+        if self._memory_budget:
+            self.logger.info(
+                "Sharing a memory budget of "
+                f"{self._memory_budget.limit_bytes / 1_048_576:,.0f} MB across flows"
+            )
 
         # Create semaphore to limit concurrent flow execution
         semaphore = asyncio.Semaphore(max_concurrent)
@@ -560,6 +586,7 @@ class Coordinator:
         # Generate and log hygge-style summary BEFORE checking for failures
         # This ensures the summary is always shown, even when flows fail
         self.summary.generate_summary(self.flow_results, self.run_start_time)
+        self._write_timings_report()
 
         # Note: Mirror publishing happens per successful entity in _run_flow()
         # after flow.start() returns — outside the flow's retry/timeout boundary
@@ -572,6 +599,31 @@ class Coordinator:
             # Re-raise the first exception that was stored
             raise failed_flows[0]["_exception"]
 
+    def _write_timings_report(self) -> None:
+        """
+        Write per-entity stage timings as JSON (options.timings_file).
+
+        Off unless `timings_file` is set. A `{run_id}` in the path is replaced
+        with the coordinator run id, so each run keeps its own report. A
+        failed write is logged, never raised.
+        """
+        timings_file = self.options.get("timings_file")
+        if not timings_file:
+            return
+        timings_file = str(timings_file).replace(
+            "{run_id}", self.coordinator_run_id or "run"
+        )
+        try:
+            path = write_timings_report(
+                timings_file,
+                self.flow_results,
+                coordinator_run_id=self.coordinator_run_id,
+                coordinator_name=self.coordinator_name,
+            )
+            self.logger.debug(f"Stage timings written to {path}")
+        except OSError as e:
+            self.logger.warning(f"Could not write stage timings: {str(e)}")
+
     async def _run_flow_with_semaphore(
         self,
         flow: Flow,
@@ -584,6 +636,9 @@ class Coordinator:
         The semaphore is released early when extraction completes (before
         store.finish()), so other entities can start extracting while this
         entity waits for Open Mirroring to process folder deletion (~120s).
+
+        When a memory budget is configured, a flow is only admitted once the
+        budget has headroom, and then draws on it through its own account.
         """
         released = False
 
@@ -594,6 +649,9 @@ class Coordinator:
                 released = True
 
         await semaphore.acquire()
+        if self._memory_budget:
+            await self._memory_budget.wait_for_headroom()
+            flow.memory = self._memory_budget.account(flow.name)
         flow.on_extraction_complete = release_slot
         try:
             await self._run_flow(flow, flow_num, total_flows)
@@ -604,6 +662,8 @@ class Coordinator:
         """Run a single flow with error handling and hygge-style logging."""
         flow_result = {
             "name": flow.name,
+            "flow": flow.base_flow_name,
+            "entity": flow.entity_name,
             "status": None,  # "pass", "fail", "skip"
             "rows": 0,
             "duration": 0.0,
@@ -672,6 +732,7 @@ class Coordinator:
             flow_result["_exception"] = e
 
         # Track result for summary (always, even if we're about to raise)
+        flow_result["timings"] = flow.timings.as_dict()
         self.flow_results.append(flow_result)
 
         # Don't re-raise here - let _run_flows handle exception propagation
@@ -0,0 +1,81 @@
+"""
+Byte-budgeted queue between a Flow's producer and consumer.
+
+asyncio.Queue bounds the number of queued batches, but batch memory depends
+on row width: ten batches of a narrow table are a few MB, ten batches of a
+wide MSSQL table can be several GB. BatchQueue adds an optional byte budget
+on top of the batch count, measured with `DataFrame.estimated_size()`, so
+memory stays predictable whatever the row width.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+
+class BatchQueue(asyncio.Queue):
+    """
+    asyncio.Queue bounded by batch count and, optionally, by bytes.
+
+    `put()` waits while adding the batch would push `queued_bytes` over
+    `max_bytes`. A single batch larger than the whole budget is still
+    accepted when the queue is empty, so an oversized batch slows the flow
+    down instead of deadlocking it. Sentinels (None) cost zero bytes and are
+    never held back by the budget.
+
+    Args:
+        maxsize: Maximum number of queued batches (0 = unbounded)
+        max_bytes: Maximum estimated bytes queued at once (None = unbounded)
+    """
+
+    def __init__(self, maxsize: int = 0, max_bytes: Optional[int] = None):
+        super().__init__(maxsize)
+        self.max_bytes = max_bytes
+        self.queued_bytes = 0
+        self._bytes_freed = asyncio.Event()
+
+    @staticmethod
+    def item_bytes(item: Any) -> int:
+        """Estimated in-memory size of a queued item."""
+        if item is None:
+            return 0
+        if hasattr(item, "estimated_size"):
+            return int(item.estimated_size())
+        return int(getattr(item, "nbytes", 0))
+
+    def has_room(self, nbytes: int) -> bool:
+        """Whether an item of `nbytes` fits in the byte budget right now."""
+        if self.max_bytes is None or nbytes == 0 or self.queued_bytes == 0:
+            return True
+        return self.queued_bytes + nbytes <= self.max_bytes
+
+    async def put(self, item: Any) -> None:
+        """Put an item, waiting for both a free slot and byte headroom."""
+        nbytes = self.item_bytes(item)
+        while not self.has_room(nbytes):
+            self._bytes_freed.clear()
+            await self._bytes_freed.wait()
+        await super().put(item)
+
+    def put_nowait(self, item: Any) -> None:
+        super().put_nowait(item)
+        self.queued_bytes += self.item_bytes(item)
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        nbytes = self.item_bytes(item)
+        if nbytes:
+            self.queued_bytes -= nbytes
+            self._bytes_freed.set()
+        return item
+
+    def describe(self) -> str:
+        """Short queue status for debug logging."""
+        status = f"{self.qsize()}/{self.maxsize} batches"
+        if self.max_bytes is not None:
+            status += (
+                f", {self.queued_bytes / 1_048_576:,.1f}/"
+                f"{self.max_bytes / 1_048_576:,.1f} MB"
+            )
+        else:
+            status += f", {self.queued_bytes / 1_048_576:,.1f} MB"
+        return status
@@ -0,0 +1,169 @@
+"""
+Adaptive batch sizing from observed throughput.
+
+Home and Store `batch_size` defaults are a guess: 25k rows of a narrow
+lookup table is a few MB, 25k rows of a wide fact table can be hundreds.
+BatchSizer watches what a stage actually does — bytes per row and rows per
+second — and steers the batch size toward a target batch size in bytes and
+a target time per batch, within configured row bounds.
+
+Following hygge's philosophy:
+- **Comfort**: Sensible batch sizes without hand-tuning every entity
+- **Reliability**: Bounded steps and hard min/max limits, never wild swings
+- **Natural flow**: Each run starts from what the last run learned
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from hygge.utility.exceptions import ConfigError
+
+from ..memory import parse_bytes
+
+
+class AdaptiveBatchConfig(BaseModel):
+    """
+    Bounds and targets for adaptive batch sizing.
+
+    ```yaml
+    # flows/users_to_lake/flow.yml
+    adaptive_batching:
+      min_rows: 5000
+      max_rows: 500000
+      target_batch_bytes: 64MB
+      target_seconds: 2
+    ```
+
+    `adaptive_batching: true` uses the defaults below.
+    """
+
+    min_rows: int = Field(default=1_000, ge=1, description="Smallest batch size")
+    max_rows: int = Field(default=1_000_000, ge=1, description="Largest batch size")
+    target_batch_bytes: int = Field(
+        default=64 * 1024**2,
+        ge=1,
+        description="Aim for batches of about this many bytes (e.g. 64MB)",
+    )
+    target_seconds: float = Field(
+        default=2.0, gt=0, description="Aim for batches that take about this long"
+    )
+
+    @field_validator("target_batch_bytes", mode="before")
+    @classmethod
+    def parse_target_batch_bytes(cls, v):
+        """Accept sizes like '64MB' as well as plain byte counts."""
+        try:
+            return parse_bytes(v)
+        except ConfigError as e:
+            raise ValueError(str(e)) from e
+
+    @model_validator(mode="after")
+    def validate_bounds(self):
+        """Ensure min_rows does not exceed max_rows."""
+        if self.min_rows > self.max_rows:
+            raise ValueError(
+                f"adaptive_batching min_rows ({self.min_rows}) cannot exceed "
+                f"max_rows ({self.max_rows})"
+            )
+        return self
+
+
+class BatchSizer:
+    """
+    Steers one stage's batch size toward byte and latency targets.
+
+    Each `observe()` feeds in one batch: its rows, estimated bytes and the
+    time the stage spent on it. Bytes per row and rows per second are
+    smoothed (recent batches weigh most), and the next size is the smaller
+    of the size that hits `target_batch_bytes` and the size that hits
+    `target_seconds`. Sizes change by at most 2x per step, are clamped to
+    [min_rows, max_rows], and small adjustments (under 10%) are ignored so
+    the size settles.
+
+    Example:
+        ```python
+        sizer = BatchSizer(25_000, AdaptiveBatchConfig())
+        new_size = sizer.observe(rows=25_000, nbytes=180_000_000, seconds=4.2)
+        ```
+
+    Args:
+        initial_rows: Starting batch size
+        config: Bounds and targets
+    """
+
+    SMOOTHING = 0.3  # Decay applied to older observations
+    MAX_STEP = 2.0  # Largest growth/shrink factor per observation
+    DEADBAND = 0.1  # Ignore relative changes smaller than this
+
+    def __init__(self, initial_rows: int, config: AdaptiveBatchConfig):
+        self.config = config
+        self.rows = self._clamp(initial_rows)
+        # Smoothed totals; ratios of these weight each batch by its size, so
+        # a stage whose cost lands on every Nth call (a Store flush) still
+        # gets a sensible rate.
+        self._rows_seen = 0.0
+        self._bytes_seen = 0.0
+        self._seconds_seen = 0.0
+
+    @property
+    def bytes_per_row(self) -> Optional[float]:
+        """Smoothed estimated bytes per row (None before any observation)."""
+        return self._bytes_seen / self._rows_seen if self._rows_seen else None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        """Smoothed stage throughput (None until time has been observed)."""
+        return self._rows_seen / self._seconds_seen if self._seconds_seen else None
+
+    def observe(self, rows: int, nbytes: int, seconds: float) -> int:
+        """
+        Record one batch and return the batch size to use next.
+
+        Args:
+            rows: Rows in the batch
+            nbytes: Estimated in-memory size of the batch
+            seconds: Time the stage spent on the batch
+
+        Returns:
+            The (possibly unchanged) batch size in rows
+        """
+        if rows <= 0:
+            return self.rows
+
+        keep = 1 - self.SMOOTHING
+        self._rows_seen = keep * self._rows_seen + rows
+        self._bytes_seen = keep * self._bytes_seen + nbytes
+        self._seconds_seen = keep * self._seconds_seen + max(seconds, 0.0)
+
+        targets = []
+        if self.bytes_per_row:
+            targets.append(self.config.target_batch_bytes / self.bytes_per_row)
+        if self.rows_per_second:
+            targets.append(self.config.target_seconds * self.rows_per_second)
+        if not targets:
+            return self.rows
+
+        target = min(targets)
+        target = min(max(target, self.rows / self.MAX_STEP), self.rows * self.MAX_STEP)
+        target = self._clamp(int(target))
+
+        if abs(target - self.rows) >= self.rows * self.DEADBAND:
+            self.rows = target
+        return self.rows
+
+    def _clamp(self, rows: int) -> int:
+        return max(self.config.min_rows, min(self.config.max_rows, rows))
+
+
+def resolve_adaptive_batching(
+    value: Union[None, bool, Dict[str, Any], AdaptiveBatchConfig],
+) -> Optional[AdaptiveBatchConfig]:
+    """Resolve the `adaptive_batching` option (None/False = disabled)."""
+    if value is None or value is False:
+        return None
+    if value is True:
+        return AdaptiveBatchConfig()
+    if isinstance(value, AdaptiveBatchConfig):
+        return value
+    return AdaptiveBatchConfig(**value)
@@ -13,9 +13,13 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
+from hygge.utility.exceptions import ConfigError
+
 from ..home import Home, HomeConfig
 from ..journal import JournalConfig
+from ..memory import parse_bytes
 from ..store import Store, StoreConfig
+from .batch_sizer import AdaptiveBatchConfig, resolve_adaptive_batching
 
 # Default configuration type for string-based home/store paths
 DEFAULT_CONFIG_TYPE = "parquet"
@@ -69,6 +73,47 @@ class FlowConfig(BaseModel):
     queue_size: int = Field(
         default=10, ge=1, le=100, description="Size of internal queue"
     )
+    queue_max_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Cap on estimated bytes held in the internal queue (e.g. 256MB). "
+            "Bounds memory for wide tables where queue_size batches would be "
+            "too large."
+        ),
+    )
+    consumers: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description=(
+            "Consumer workers writing to the store. Above 1, batches are "
+            "prepared (polish, row markers) in parallel on worker threads."
+        ),
+    )
+    adaptive_batching: Optional[AdaptiveBatchConfig] = Field(
+        default=None,
+        description=(
+            "Tune home and store batch sizes from observed throughput. "
+            "true for defaults, or min_rows/max_rows/target_batch_bytes/"
+            "target_seconds."
+        ),
+    )
+    arrow_passthrough: bool = Field(
+        default=True,
+        description=(
+            "Move Arrow record batches from home to store without converting "
+            "to Polars when both support it and nothing is polished."
+        ),
+    )
+    file_manifest: Optional[bool] = Field(
+        default=None,
+        description=(
+            "For file homes, record ingested files beside the journal and read "
+            "only new or changed files on incremental runs. Unset: on for "
+            "incremental runs and for full runs of entities with a manifest."
+        ),
+    )
     timeout: int = Field(default=300, ge=1, description="Operation timeout in seconds")
     options: Dict[str, Any] = Field(
         default_factory=dict, description="Additional flow options"
@@ -172,6 +217,23 @@ class FlowConfig(BaseModel):
             # Don't validate completeness - that happens when FlowInstance is created
         return v
 
+    @field_validator("adaptive_batching", mode="before")
+    @classmethod
+    def validate_adaptive_batching(cls, v):
+        """Parse adaptive_batching into AdaptiveBatchConfig (false/None = off)."""
+        return resolve_adaptive_batching(v)
+
+    @field_validator("queue_max_bytes", mode="before")
+    @classmethod
+    def parse_queue_max_bytes(cls, v):
+        """Accept sizes like '256MB' as well as plain byte counts."""
+        if v is None:
+            return None
+        try:
+            return parse_bytes(v)
+        except ConfigError as e:
+            raise ValueError(str(e)) from e
+
     @field_validator("journal", mode="before")
     @classmethod
     def validate_journal(cls, v):
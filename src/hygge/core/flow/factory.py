@@ -446,8 +446,15 @@ class FlowFactory:
             {
                 "queue_size": flow_config.queue_size,
                 "timeout": flow_config.timeout,
+                "consumers": flow_config.consumers,
+                "arrow_passthrough": flow_config.arrow_passthrough,
+                "file_manifest": flow_config.file_manifest,
             }
         )
+        if flow_config.queue_max_bytes is not None:
+            flow_options["queue_max_bytes"] = flow_config.queue_max_bytes
+        if flow_config.adaptive_batching is not None:
+            flow_options["adaptive_batching"] = flow_config.adaptive_batching
         return flow_options
 
     @staticmethod
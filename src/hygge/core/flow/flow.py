@@ -14,10 +14,12 @@ Following hygge's philosophy, Flow prioritizes:
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 import polars as pl
 
+from hygge.connections.execution import CpuEngine
 from hygge.messages import get_logger
 from hygge.utility.exceptions import (
     FlowConnectionError,
@@ -33,7 +35,13 @@ from hygge.utility.retry import with_retry
 
 from ..home import Home
 from ..journal import Journal
+from ..manifest import FileEntry, plan_files
+from ..memory import MemoryAccount
+from ..timings import StageTimings
 from ..watermark import Watermark
+from .batch_queue import BatchQueue
+from .batch_sizer import BatchSizer, resolve_adaptive_batching
+from .turnstile import Turnstile
 
 
 class Flow:
@@ -60,7 +68,27 @@ class Flow:
         store: Destination to write data to (any Store implementation)
         options: Optional configuration options:
             - queue_size: Size of batch queue (default: 10)
+            - queue_max_bytes: Optional cap on estimated bytes held in the
+              batch queue (default: unbounded)
             - timeout: Operation timeout in seconds (default: 300)
+            - consumers: Number of consumer workers (default: 1). With more
+              than one, `store.prepare_batch()` runs on the CPU pool in
+              parallel; writes stay in queue order for stores that set
+              `requires_ordered_writes` and run concurrently otherwise.
+            - adaptive_batching: AdaptiveBatchConfig (or dict/True) to tune
+              home and store batch sizes from observed throughput. Store
+              sizes change mid-run; home sizes apply from the next read.
+              Chosen sizes are journaled and seed the next run.
+            - arrow_passthrough: Move pyarrow record batches from home to
+              store without converting to Polars, when the home supports
+              Arrow, the store accepts it and nothing is polished or
+              watermarked (default: True)
+            - file_manifest: For homes that read files, record each ingested
+              file (path, size, mtime, content hash) beside the journal, and
+              read only new or changed files on incremental runs. Default
+              (None): on for incremental runs, and for full runs of entities
+              that already have a manifest; True/False force it (needs a
+              journal)
     """
 
     def __init__(
@@ -85,7 +113,11 @@ class Flow:
 
         # Default settings
         self.queue_size = self.options.get("queue_size", 10)
+        self.queue_max_bytes = self.options.get("queue_max_bytes")
         self.timeout = self.options.get("timeout", 300)
+        self.consumers = max(1, int(self.options.get("consumers", 1)))
+        self.arrow_passthrough = self.options.get("arrow_passthrough", True)
+        self.file_manifest = self.options.get("file_manifest")
 
         # Journal integration
         self.journal = journal
@@ -113,6 +145,8 @@ class Flow:
 
         self.initial_watermark_info: Optional[Dict[str, Any]] = None
         self.watermark_message: Optional[str] = None
+        # Manifest entries to record once this run succeeds (file homes)
+        self.manifest_entries: Optional[List[FileEntry]] = None
 
         # Track if watermark schema has been validated
         self._watermark_schema_validated = False
@@ -124,10 +158,35 @@ class Flow:
         self.end_time = None
         self.duration: float = 0.0
         self.entity_start_time: Optional[datetime] = None
+        self.queue: Optional[BatchQueue] = None
+        # Whether the current run moves Arrow batches (decided per attempt)
+        self.arrow_lane = False
 
         # Progress callback for coordinator-level tracking
         self.progress_callback = None
 
+        # Share of the coordinator-wide memory budget (set by Coordinator)
+        self.memory: Optional[MemoryAccount] = None
+
+        # Per-stage timings, shared with home and store so each records its
+        # own stages into one set of totals for this entity
+        self.timings = StageTimings()
+        self.home.timings = self.timings
+        self.store.timings = self.timings
+
+        # Adaptive batch sizing (off unless adaptive_batching is configured)
+        self.home_sizer: Optional[BatchSizer] = None
+        self.store_sizer: Optional[BatchSizer] = None
+        adaptive_config = resolve_adaptive_batching(
+            self.options.get("adaptive_batching")
+        )
+        if adaptive_config:
+            home_rows = self.home.options.get("batch_size", self.home.batch_size)
+            self.home_sizer = BatchSizer(home_rows, adaptive_config)
+            if getattr(self.store, "batch_size", None):
+                self.store_sizer = BatchSizer(self.store.batch_size, adaptive_config)
+        self._batch_sizes_restored = False
+
         # Extraction-complete callback for early semaphore release
         # Called after producer/consumer finish but before store.finish()
         self.on_extraction_complete: Optional[Callable[[], None]] = None
@@ -263,12 +322,20 @@ class Flow:
             before_sleep_func=self._cleanup_before_retry,
         )(self._execute_flow)
 
-        await retry_decorated()
+        try:
+            await retry_decorated()
+        except BaseException:
+            self._release_memory()
+            raise
 
         # Post-extraction: runs outside timeout boundary
         # store.finish() may include a 120s wait for Open Mirroring (full_drop only)
         try:
-            await self.store.finish()
+            with self.timings.span("finish"):
+                await self.store.finish()
+            if self.store_sizer:
+                # The last flushes still inform the size the next run starts at
+                self._observe_saves()
 
             # Capture final timing
             self.end_time = asyncio.get_event_loop().time()
@@ -279,7 +346,8 @@ class Flow:
                 f"{self.total_rows:,} rows in {self.duration:.1f}s ({rate:.0f} rows/s)"
             )
 
-            # Record entity run in journal (if enabled)
+            # Record ingested files, then the entity run (if journal enabled)
+            await self._record_file_manifest()
             await self._record_entity_run(
                 status="success", message=self.watermark_message
             )
@@ -293,6 +361,13 @@ class Flow:
             raise FlowExecutionError(
                 f"Flow post-extraction failed: {self.name}, error: {e}"
             ) from e
+        finally:
+            self._release_memory()
+
+    def _release_memory(self) -> None:
+        """Return all memory-budget credit held by this flow."""
+        if self.memory:
+            self.memory.close()
 
     async def _execute_flow(self) -> None:
         """Execute a single attempt of the extraction (producer + consumer only)."""
@@ -301,10 +376,12 @@ class Flow:
         self.entity_start_time = datetime.now(timezone.utc)
 
         producer = None
-        consumer = None
+        consumers: List[asyncio.Task] = []
+        self.queue = None
 
         try:
-            queue = asyncio.Queue(maxsize=self.queue_size)
+            queue = BatchQueue(maxsize=self.queue_size, max_bytes=self.queue_max_bytes)
+            self.queue = queue
             producer_done = asyncio.Event()
 
             # Reset watermark tracker for new run
@@ -312,7 +389,11 @@ class Flow:
                 self.watermark.reset()
                 self._watermark_schema_validated = False
 
+            self._prepare_read_ahead()
             await self._prepare_incremental_context()
+            await self._prepare_file_manifest()
+            await self._prepare_batch_sizes()
+            self.arrow_lane = self._use_arrow_lane()
 
             # Log narrative journey context at DEBUG level
             self._log_journey_start()
@@ -321,19 +402,39 @@ class Flow:
             producer = asyncio.create_task(
                 self._producer(queue, producer_done), name=f"{self.name}_producer"
             )
-            consumer = asyncio.create_task(
-                self._consumer(queue, producer_done), name=f"{self.name}_consumer"
-            )
-
-            # Wait for producer to finish
-            await producer
+            # Ordered stores with several consumers write in queue order
+            turnstile = None
+            if self.consumers > 1 and getattr(
+                self.store, "requires_ordered_writes", False
+            ):
+                turnstile = Turnstile()
+            consumers = [
+                asyncio.create_task(
+                    self._consumer(queue, producer_done, turnstile),
+                    name=f"{self.name}_consumer"
+                    + (f"_{i}" if self.consumers > 1 else ""),
+                )
+                for i in range(self.consumers)
+            ]
 
-            # Wait for consumer to finish - this will either complete or raise
+            # Wait for producer and consumers to finish - the first failure
+            # stops waiting; anything still running is cancelled below
+            await asyncio.wait(
+                [producer, *consumers], return_when=asyncio.FIRST_EXCEPTION
+            )
             consumer_exception = None
-            try:
-                await consumer
-            except Exception as e:
-                consumer_exception = e
+            for task in consumers:
+                if not task.done():
+                    continue
+                if task.cancelled():
+                    raise asyncio.CancelledError()
+                if task.exception() is not None:
+                    consumer_exception = task.exception()
+                    break
+
+            # Surface a producer failure (consumers stop on its end marker)
+            if consumer_exception is None:
+                await producer
 
             # If consumer had an exception, don't wait for queue.join()
             # since the consumer failed and task_done() may not have been called
@@ -368,28 +469,46 @@ class Flow:
             # Record entity run in journal (if enabled) with failure status
             await self._record_entity_run(status="fail", message=str(e))
 
-            # Cancel tasks if they're still running
-            if producer and not producer.done():
-                producer.cancel()
-            if consumer and not consumer.done():
-                consumer.cancel()
-
-            # Wait for cancellation to complete
-            if producer:
-                try:
-                    await producer
-                except asyncio.CancelledError:
-                    pass
-            if consumer:
-                try:
-                    await consumer
-                except asyncio.CancelledError:
-                    pass
+            # Home and store errors from the producer/consumers keep their
+            # type, so transient connection errors are retried
+            if isinstance(e, (HomeError, StoreError)):
+                raise
 
             # CRITICAL: Use 'from e' to preserve exception context
             raise FlowExecutionError(
                 f"Flow failed: {self.name}, error: {str(e)}"
             ) from e
+        finally:
+            # Stop the producer and any sibling consumers before a retry (or
+            # the caller) touches the store again
+            await self._stop_tasks(producer, consumers)
+
+    @staticmethod
+    async def _stop_tasks(
+        producer: Optional[asyncio.Task], consumers: List[asyncio.Task]
+    ) -> None:
+        """Cancel any producer/consumer tasks still running and wait for them."""
+        tasks = [task for task in [producer, *consumers] if task is not None]
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _use_arrow_lane(self) -> bool:
+        """
+        Whether to move pyarrow record batches end to end.
+
+        Needs a home that can yield Arrow, a store that writes it without
+        per-batch preparation (no polish), and no watermark, since watermark
+        tracking reads Polars batches.
+        """
+        return bool(
+            self.arrow_passthrough
+            and getattr(self.home, "supports_arrow", False) is True
+            and getattr(self.store, "arrow_passthrough", False) is True
+            and self.watermark is None
+        )
 
     def _should_retry_flow_error(self, exception: Exception) -> bool:
         """
@@ -440,6 +559,9 @@ class Flow:
                 f"{str(reset_error)}"
             )
 
+        # The failed attempt's queue and buffers are gone; return their credit
+        self._release_memory()
+
         # Reset flow state for retry
         self.total_rows = 0
         self.rows_written = 0
@@ -450,24 +572,56 @@ class Flow:
             self.watermark.reset()
             self._watermark_schema_validated = False
 
-    async def _producer(
-        self, queue: asyncio.Queue, producer_done: asyncio.Event
-    ) -> None:
+    def _prepare_read_ahead(self) -> None:
+        """
+        Bring the home's read-ahead under this flow's memory limits.
+
+        Batches the home reads ahead are charged to the flow's memory
+        account as they are queued, and without an explicit
+        `prefetch_bytes` the read-ahead is capped like the flow's own queue.
+        """
+        self.home.memory = self.memory
+        if self.home.prefetch_bytes is None and self.queue_max_bytes:
+            self.home.prefetch_bytes = self.queue_max_bytes
+
+    @property
+    def queued_bytes(self) -> int:
+        """Estimated bytes currently waiting in the batch queue."""
+        return self.queue.queued_bytes if self.queue is not None else 0
+
+    async def _producer(self, queue: BatchQueue, producer_done: asyncio.Event) -> None:
         """Read batches from Home and put them in queue."""
         try:
             self.logger.debug(f"Starting producer for {self.name}")
+            loop = asyncio.get_running_loop()
+            read_started = loop.time()
             async for batch in self._iterate_home_batches():
                 if batch is not None:
-                    await queue.put(batch)
+                    read_seconds = loop.time() - read_started
+                    self.timings.add("read", read_seconds)
+                    if self.home_sizer:
+                        self._observe_read(batch, read_seconds)
+
+                    # Wait for room in the shared memory budget before queueing
+                    # (a batch read ahead already holds its credit)
+                    with self.timings.span("queue_wait"):
+                        if self.memory:
+                            await self.memory.acquire(
+                                BatchQueue.item_bytes(batch)
+                                - self.home.take_read_credit()
+                            )
+                        await queue.put(batch)
                     self.logger.debug(
-                        f"Queued batch of {len(batch)} rows, "
-                        f"queue size: {queue.qsize()}/{queue.maxsize}"
+                        f"Queued batch of {len(batch)} rows, queue: {queue.describe()}"
                     )
+                # Time only the read, not waiting on a full queue
+                read_started = loop.time()
 
             # Signal that producer is done before sending end signal
             producer_done.set()
-            # Signal end of data
-            await queue.put(None)
+            # Signal end of data (one end signal per consumer)
+            for _ in range(self.consumers):
+                await queue.put(None)
             self.logger.debug("Producer completed, sent end signal")
 
         except HomeConnectionError:
@@ -484,7 +638,10 @@ class Flow:
 
     async def _iterate_home_batches(self) -> AsyncIterator[pl.DataFrame]:
         """Yield batches from the home, applying watermark filtering when available."""
-        if self.initial_watermark_info and hasattr(self.home, "read_with_watermark"):
+        if self.arrow_lane:
+            async for batch in self.home.read_arrow():
+                yield batch
+        elif self.initial_watermark_info and hasattr(self.home, "read_with_watermark"):
             async for batch in self.home.read_with_watermark(
                 self.initial_watermark_info
             ):
@@ -500,6 +657,34 @@ class Flow:
             async for batch in self.home.read():
                 yield batch
 
+    def _observe_read(self, batch: pl.DataFrame, seconds: float) -> None:
+        """Feed a home batch to the read-side sizer."""
+        before = self.home_sizer.rows
+        rows = self.home_sizer.observe(
+            len(batch), BatchQueue.item_bytes(batch), seconds
+        )
+        if rows != before:
+            self._resize_home(rows)
+            self.logger.debug(f"Home batch size {before:,} → {rows:,} rows")
+
+    def _observe_saves(self) -> None:
+        """
+        Feed the store's finished saves to the write-side sizer.
+
+        Only flushes count: a write that just buffered rows took no write
+        time worth learning from.
+        """
+        before = self.store_sizer.rows
+        rows = before
+        for save_rows, nbytes, seconds in self.store.take_completed_saves():
+            if self.store.saves_in_background:
+                # The time is a queue wait; size by bytes only
+                seconds = 0.0
+            rows = self.store_sizer.observe(save_rows, nbytes, seconds)
+        if rows != before:
+            self.store.batch_size = rows
+            self.logger.debug(f"Store batch size {before:,} → {rows:,} rows")
+
     def _log_journey_start(self) -> None:
         """Log data journey start at DEBUG level."""
         # Try common path attributes with fallback to generic labels
@@ -515,6 +700,8 @@ class Flow:
         )
 
         self.logger.debug(f"🏠 Journey: {home_path} → {store_path}")
+        if self.arrow_lane:
+            self.logger.debug("   🏹 Arrow lane: batches pass through unconverted")
 
         if self.run_type == "incremental" and self.initial_watermark_info:
             wm = self.initial_watermark_info.get("watermark")
@@ -560,8 +747,119 @@ class Flow:
                 f"Failed to retrieve watermark for {self.name}: {str(exc)}"
             )
 
+    async def _prepare_file_manifest(self) -> None:
+        """
+        Decide which files a file home reads, using the journal's manifest.
+
+        Incremental runs read only files that are new or whose content
+        changed since they were recorded. Full loads read everything. Either
+        way, the manifest entries for this run's files are kept and recorded
+        once the run succeeds.
+
+        Unless `file_manifest` is set, full loads of entities with no
+        manifest yet skip it: nothing would use the hashes, and hashing a
+        whole landing directory costs about as much as reading it. A full
+        reload of an incremental entity still refreshes its manifest.
+        """
+        self.manifest_entries = None
+        if (
+            self.file_manifest is False
+            or not self.journal
+            or getattr(self.home, "reads_files", False) is not True
+        ):
+            return
+
+        self.home.selected_files = None
+        try:
+            known = await self.journal.get_file_manifest(
+                self.base_flow_name, self.entity_name
+            )
+            if (
+                self.file_manifest is None
+                and self.run_type != "incremental"
+                and not known
+            ):
+                return
+            paths = self.home.get_batch_paths()
+            with self.timings.span("manifest"):
+                to_read, entries = await asyncio.to_thread(
+                    plan_files, paths, Path(self.home.get_data_path()), known
+                )
+        except HomeError:
+            # Missing or empty path: the read itself reports it
+            return
+        except Exception as e:
+            # Reading everything is always safe
+            self.logger.warning(f"File manifest unavailable, reading all files: {e}")
+            return
+        self.manifest_entries = entries
+
+        if self.run_type == "incremental":
+            self.home.selected_files = to_read
+            self.logger.debug(
+                f"Manifest: {len(to_read)} new or changed of {len(paths)} files"
+            )
+
+    async def _record_file_manifest(self) -> None:
+        """Record this run's files in the manifest (non-blocking on failure)."""
+        if not self.manifest_entries:
+            return
+        try:
+            with self.timings.span("journal"):
+                await self.journal.record_file_manifest(
+                    self.base_flow_name,
+                    self.entity_name,
+                    self.manifest_entries,
+                    replace=self.run_type != "incremental",
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to record file manifest: {str(e)}. "
+                "The next incremental run may read these files again."
+            )
+
+    async def _prepare_batch_sizes(self) -> None:
+        """Seed adaptive batch sizes from the journal and apply them."""
+        if not self.home_sizer and not self.store_sizer:
+            return
+
+        if not self._batch_sizes_restored and self.journal:
+            self._batch_sizes_restored = True
+            try:
+                sizes = await self.journal.get_batch_sizes(
+                    self.base_flow_name, entity=self.entity_name
+                )
+            except Exception as exc:
+                sizes = None
+                self.logger.warning(
+                    f"Failed to retrieve batch sizes for {self.name}: {str(exc)}"
+                )
+            if sizes:
+                if self.home_sizer and sizes.get("home_batch_size"):
+                    self.home_sizer = BatchSizer(
+                        sizes["home_batch_size"], self.home_sizer.config
+                    )
+                if self.store_sizer and sizes.get("store_batch_size"):
+                    self.store_sizer = BatchSizer(
+                        sizes["store_batch_size"], self.store_sizer.config
+                    )
+                self.logger.debug(f"Starting from journaled batch sizes {sizes}")
+
+        if self.home_sizer:
+            self._resize_home(self.home_sizer.rows)
+        if self.store_sizer:
+            self.store.batch_size = self.store_sizer.rows
+
+    def _resize_home(self, rows: int) -> None:
+        """Set the home batch size (homes pick it up when a read starts)."""
+        self.home.batch_size = rows
+        self.home.options["batch_size"] = rows
+
     async def _consumer(
-        self, queue: asyncio.Queue, producer_done: asyncio.Event
+        self,
+        queue: BatchQueue,
+        producer_done: asyncio.Event,
+        turnstile: Optional[Turnstile] = None,
     ) -> None:
         """Process batches from queue and write to Store."""
         try:
@@ -574,6 +872,10 @@ class Flow:
                     queue.task_done()
                     break
 
+                # Take a place in line before any await, so tickets follow
+                # queue order
+                ticket = turnstile.take() if turnstile else None
+
                 try:
                     # Validate watermark schema on first batch (fail fast)
                     if self.watermark and not self._watermark_schema_validated:
@@ -581,7 +883,15 @@ class Flow:
                         self._watermark_schema_validated = True
 
                     # Write to store
-                    await self.store.write(batch)
+                    await self._write_batch(batch, turnstile, ticket)
+                    if self.store_sizer:
+                        self._observe_saves()
+
+                    # Batch is now owned by the store: trade its in-flight
+                    # credit for whatever the store still keeps buffered
+                    if self.memory:
+                        self.memory.release(BatchQueue.item_bytes(batch))
+                        self.memory.track(getattr(self.store, "buffered_bytes", 0))
 
                     # Update watermark tracker if configured
                     if self.watermark:
@@ -634,6 +944,46 @@ class Flow:
             # CRITICAL: Use 'from e' to preserve exception context
             raise FlowError(f"Consumer failed: {str(e)}") from e
 
+    async def _write_batch(
+        self,
+        batch: pl.DataFrame,
+        turnstile: Optional[Turnstile] = None,
+        ticket: Optional[int] = None,
+    ) -> None:
+        """
+        Write one batch to the store.
+
+        With a single consumer the store prepares the batch itself. With
+        several, `store.prepare_batch()` runs on the CPU pool so batches are
+        prepared in parallel, and a turnstile (ordered stores only)
+        keeps the writes themselves in queue order. Arrow-lane batches, and
+        batches for stores with nothing to prepare, skip the CPU pool.
+        """
+        if self.consumers == 1:
+            await self.store.write(batch)
+            return
+
+        served = False
+        try:
+            if (
+                self.arrow_lane
+                or getattr(self.store, "prepares_batches", True) is False
+            ):
+                prepared = batch
+            else:
+                with self.timings.span("polish"):
+                    prepared = await CpuEngine.execute(self.store.prepare_batch, batch)
+            if turnstile:
+                await turnstile.wait(ticket)
+                served = True
+            await self.store.write(prepared, prepared=True)
+        finally:
+            if turnstile:
+                if served:
+                    turnstile.advance()
+                else:
+                    turnstile.release(ticket)
+
     async def _record_entity_run(
         self, status: str, message: Optional[str] = None
     ) -> None:
@@ -690,24 +1040,29 @@ class Flow:
 
             # Record in journal
             finish_time = datetime.now(timezone.utc)
-            await self.journal.record_entity_run(
-                coordinator_run_id=self.coordinator_run_id,
-                flow_run_id=self.flow_run_id,
-                coordinator=self.coordinator_name or "unknown",
-                flow=self.base_flow_name,
-                entity=entity,
-                start_time=self.entity_start_time or datetime.now(timezone.utc),
-                finish_time=finish_time,
-                status=final_status,
-                run_type=self.run_type,
-                row_count=self.total_rows if self.total_rows > 0 else None,
-                duration=self.duration,
-                primary_key=primary_key,
-                watermark_column=watermark_column,
-                watermark_type=watermark_type,
-                watermark=watermark_value,
-                message=final_message,
-            )
+            with self.timings.span("journal"):
+                await self.journal.record_entity_run(
+                    coordinator_run_id=self.coordinator_run_id,
+                    flow_run_id=self.flow_run_id,
+                    coordinator=self.coordinator_name or "unknown",
+                    flow=self.base_flow_name,
+                    entity=entity,
+                    start_time=self.entity_start_time or datetime.now(timezone.utc),
+                    finish_time=finish_time,
+                    status=final_status,
+                    run_type=self.run_type,
+                    row_count=self.total_rows if self.total_rows > 0 else None,
+                    duration=self.duration,
+                    primary_key=primary_key,
+                    watermark_column=watermark_column,
+                    watermark_type=watermark_type,
+                    watermark=watermark_value,
+                    message=final_message,
+                    home_batch_size=self.home_sizer.rows if self.home_sizer else None,
+                    store_batch_size=self.store_sizer.rows
+                    if self.store_sizer
+                    else None,
+                )
 
         except JournalWriteError as e:
             # Log error clearly but don't break flow
@@ -0,0 +1,68 @@
+"""
+Ticket-ordered gate for a Flow's consumer workers.
+
+With several consumers, batches are prepared in parallel but some stores
+need them written in the order they were read (Open Mirroring sequence
+numbers, for example). Each consumer takes a ticket when it dequeues a
+batch and waits at the Turnstile until its ticket is called, so writes
+happen in queue order while the work before them overlaps.
+"""
+
+import asyncio
+from typing import Set
+
+
+class Turnstile:
+    """
+    Let tasks through one at a time, in the order they took tickets.
+
+    Example:
+        ```python
+        ticket = turnstile.take()  # When the batch is dequeued
+        ...  # Parallel work
+        await turnstile.wait(ticket)
+        try:
+            await store.write(batch)
+        finally:
+            turnstile.advance()
+        ```
+    """
+
+    def __init__(self):
+        self._next_ticket = 0
+        self.serving = 0
+        self._released: Set[int] = set()
+        self._advanced = asyncio.Event()
+
+    def take(self) -> int:
+        """Take the next ticket."""
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return ticket
+
+    async def wait(self, ticket: int) -> None:
+        """Wait until `ticket` is being served."""
+        while self.serving != ticket:
+            self._advanced.clear()
+            await self._advanced.wait()
+
+    def advance(self) -> None:
+        """Finish the current ticket and call the next one."""
+        self.serving += 1
+        self._skip_released()
+
+    def release(self, ticket: int) -> None:
+        """
+        Give up `ticket` without being served (e.g. its batch failed).
+
+        Later tickets are not held up waiting for it.
+        """
+        if ticket >= self.serving:
+            self._released.add(ticket)
+            self._skip_released()
+
+    def _skip_released(self) -> None:
+        while self.serving in self._released:
+            self._released.discard(self.serving)
+            self.serving += 1
+        self._advanced.set()
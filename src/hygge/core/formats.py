@@ -1,26 +1,59 @@
 """
-File format layer: read/write Polars DataFrames by format (parquet, csv, ndjson).
+File format layer: read/write Polars DataFrames by format (parquet, csv, ndjson,
+arrow).
 
 Separates "what format" from "where". Used by LocalHome/LocalStore and can be
 reused by GDrive/OneDrive. No registry—simple dispatch by format name.
+CSV and NDJSON may also be read gzip or zstd compressed (.gz, .zst).
+
+Writers also take pyarrow Tables/RecordBatches from the Arrow lane. They are
+wrapped as DataFrames (zero-copy for most types) and written by Polars, whose
+encoders are faster than pyarrow's.
 """
 
+import operator
+from functools import reduce
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, List, Optional, TypeVar, Union
 
 import polars as pl
 
+from .arrow import ArrowBatch, as_frame
+
+Frame = TypeVar("Frame", pl.DataFrame, pl.LazyFrame)
+
 # Format → file extension for globbing and generated filenames
 FORMAT_SUFFIX: dict[str, str] = {
     "parquet": ".parquet",
     "csv": ".csv",
     "ndjson": ".ndjson",
+    "arrow": ".arrow",  # Arrow IPC file (Feather v2)
+    "ipc": ".arrow",
 }
 
+# Arrow IPC is stored as Arrow's in-memory layout, so there is nothing to
+# encode or decode: hops between our own flows (staging to staging) write and
+# read it at close to copy speed. Buffers may be LZ4 or ZSTD compressed via
+# format_options.compression ("lz4", "zstd"; default uncompressed).
+_IPC_FORMATS = ("arrow", "ipc")
+
 # Single source of truth for valid format names (used by config validators)
 VALID_FORMATS: tuple[str, ...] = tuple(FORMAT_SUFFIX.keys())
 
+# Compressed file suffix → codec. Text formats (csv, ndjson) may be read
+# compressed: Polars 2.0+ decompresses them as a stream while scanning, so
+# a .csv.gz never lands on disk or in memory uncompressed. Older Polars
+# inflates the whole file first, so there it is read eagerly and sliced.
+# Parquet compresses inside the file instead.
+COMPRESSION_SUFFIX: dict[str, str] = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+_COMPRESSIBLE_FORMATS = ("csv", "ndjson")
+_STREAMS_COMPRESSED = int(pl.__version__.split(".")[0]) >= 2
+
 
 def format_to_suffix(format_name: str) -> str:
     """Return the file extension for a format (e.g. parquet -> .parquet)."""
@@ -32,6 +65,23 @@ def format_to_suffix(format_name: str) -> str:
     return suffix
 
 
+def compression_of(path: Path | str) -> Optional[str]:
+    """Codec of a compressed file by its suffix (e.g. x.csv.gz -> gzip)."""
+    return COMPRESSION_SUFFIX.get(Path(path).suffix.lower())
+
+
+def file_patterns(format_name: str) -> list[str]:
+    """
+    Glob patterns for a format's files: plain, plus compressed for text
+    formats (csv -> *.csv, *.csv.gz, *.csv.zst, *.csv.zstd).
+    """
+    suffix = format_to_suffix(format_name)
+    patterns = [f"*{suffix}"]
+    if format_name.lower() in _COMPRESSIBLE_FORMATS:
+        patterns += [f"*{suffix}{ext}" for ext in COMPRESSION_SUFFIX]
+    return patterns
+
+
 def default_file_pattern(format_name: str) -> str:
     """Default output file naming pattern (e.g. {sequence:020d}.parquet)."""
     return "{sequence:020d}" + format_to_suffix(format_name)
@@ -41,100 +91,208 @@ def read(
     path: Path | str,
     format_name: str,
     batch_size: int = 50_000,
+    columns: Optional[List[str]] = None,
+    predicate: Optional[pl.Expr] = None,
     **options: Any,
 ) -> Iterator[pl.DataFrame]:
     """
     Read file(s) at path in batches by format. Always yields batches.
 
-    Parquet: scan_parquet + slice + collect(engine="streaming").
-    CSV: scan_csv + slice + collect(engine="streaming").
-    NDJSON: read in chunks (batch_size lines).
+    Every format is scanned lazily and streamed in one pass (collect_batches):
+    parquet by row group, CSV and NDJSON in large blocks split on record
+    boundaries and parsed on Polars' thread pool. Batches come back in file
+    order and memory stays at a few batches however large the file.
+
+    `columns` and `predicate` are pushed into the scan, so parquet skips
+    unread columns and row groups whose statistics rule the predicate out.
+
+    Plain local files are memory-mapped by the scan, so parsing works on the
+    OS page cache rather than a copy. For uncompressed Arrow IPC there is no
+    parsing at all: batches are the file's buffers. Compressed CSV and NDJSON
+    (.gz, .zst) are decompressed as a stream in the same pass on Polars 2.0+,
+    and read whole then sliced into batches on older Polars.
     """
     path = Path(path)
     fmt = format_name.lower()
+    codec = compression_of(path)
+    if codec and fmt not in _COMPRESSIBLE_FORMATS:
+        raise ValueError(
+            f"{codec} compressed {format_name} is not supported: {path}. "
+            f"Compressed files must be one of: {', '.join(_COMPRESSIBLE_FORMATS)}"
+        )
 
-    if fmt == "parquet":
-        yield from _read_parquet(path, batch_size, **options)
+    if codec and not _STREAMS_COMPRESSED:
+        batches = _read_decompressed(
+            path, fmt, batch_size, columns, predicate, **options
+        )
+    elif fmt == "parquet":
+        batches = _read_scanned(
+            lambda: pl.scan_parquet(path, **options), batch_size, columns, predicate
+        )
     elif fmt == "csv":
-        yield from _read_csv(path, batch_size, **options)
+        batches = _read_scanned(
+            lambda: pl.scan_csv(path, **options), batch_size, columns, predicate
+        )
+    elif fmt in _IPC_FORMATS:
+        batches = _read_scanned(
+            lambda: pl.scan_ipc(path, **options), batch_size, columns, predicate
+        )
     elif fmt == "ndjson":
-        yield from _read_ndjson(path, batch_size, **options)
+        batches = _read_scanned(
+            lambda: _scan_ndjson(path, batch_size, **options),
+            batch_size,
+            columns,
+            predicate,
+        )
     else:
         raise ValueError(
             f"Unknown format: {format_name}. Known: {', '.join(VALID_FORMATS)}"
         )
 
-
-def _read_scanned(
-    path: Path,
-    batch_size: int,
-    scan_fn,  # callable returning LazyFrame, e.g. lambda: pl.scan_parquet(path, **opts)
-) -> Iterator[pl.DataFrame]:
-    """Stream batches from LazyFrame via slice + collect(engine='streaming')."""
-    lf = scan_fn()
-    total_rows = lf.select(pl.len()).collect().item()
-    if total_rows == 0:
-        return
-    num_batches = (total_rows + batch_size - 1) // batch_size
-    for batch_idx in range(num_batches):
-        offset = batch_idx * batch_size
-        batch_df = lf.slice(offset, batch_size).collect(engine="streaming")
+    for batch_df in batches:
         if len(batch_df) > 0:
             yield batch_df
 
 
-def _read_parquet(
-    path: Path,
-    batch_size: int,
-    **options: Any,
-) -> Iterator[pl.DataFrame]:
-    """Parquet: streaming via scan_parquet + slice + collect(engine='streaming')."""
-    yield from _read_scanned(path, batch_size, lambda: pl.scan_parquet(path, **options))
+def build_predicate(
+    filter_sql: Optional[str] = None, *extra: pl.Expr
+) -> Optional[pl.Expr]:
+    """
+    Combine a SQL filter (e.g. "region = 'EU' AND amount > 0") with extra
+    conditions into one predicate for `read`. None when there is nothing to
+    filter on.
+    """
+    conditions = list(extra)
+    if filter_sql:
+        conditions.insert(0, pl.sql_expr(filter_sql))
+    return reduce(operator.and_, conditions) if conditions else None
 
 
-def _read_csv(
-    path: Path,
+def _narrow(
+    frame: Frame,
+    columns: Optional[List[str]],
+    predicate: Optional[pl.Expr],
+) -> Frame:
+    """Apply a row predicate, then a column selection (either may be None)."""
+    if predicate is not None:
+        frame = frame.filter(predicate)
+    if columns:
+        frame = frame.select(columns)
+    return frame
+
+
+def _read_scanned(
+    scan_fn: Callable[[], pl.LazyFrame],  # e.g. lambda: pl.scan_parquet(path)
     batch_size: int,
-    **options: Any,
+    columns: Optional[List[str]] = None,
+    predicate: Optional[pl.Expr] = None,
 ) -> Iterator[pl.DataFrame]:
-    """CSV: streaming via scan_csv + slice + collect(engine='streaming')."""
-    yield from _read_scanned(path, batch_size, lambda: pl.scan_csv(path, **options))
+    """
+    Stream batches from a LazyFrame in one pass (collect_batches).
+
+    The streaming engine walks the file once and hands back batch_size-row
+    chunks as they fill, so memory stays at a few batches and there is no
+    separate count pass. (Slicing per batch re-planned the scan and decoded
+    the skipped rows again for every batch.)
+    """
+    yield from stream_batches(_narrow(scan_fn(), columns, predicate), batch_size)
+
+
+def stream_batches(lf: pl.LazyFrame, batch_size: int) -> Iterator[pl.DataFrame]:
+    """
+    Stream a LazyFrame in batch_size-row chunks (collect_batches).
+
+    Polars 1.x runs the query on a background thread and, when it fails,
+    just ends the iteration: the error stays on the thread's future. It is
+    re-raised here once the batches run out, so a corrupt file fails the
+    read instead of looking empty.
+    """
+    batches = lf.collect_batches(chunk_size=batch_size, engine="streaming")
+    yield from batches
+    background = getattr(batches, "_fut", None)  # Polars 1.x only
+    if background is not None:
+        background.result()
 
 
-def _read_ndjson(
+def _read_decompressed(
     path: Path,
+    fmt: str,
     batch_size: int,
+    columns: Optional[List[str]] = None,
+    predicate: Optional[pl.Expr] = None,
     **options: Any,
 ) -> Iterator[pl.DataFrame]:
-    """NDJSON: chunked read (batch_size lines per batch)."""
+    """
+    Read a compressed CSV/NDJSON file whole, then yield it in slices.
+
+    For Polars before 2.0, whose scans inflate compressed text into memory
+    anyway: one eager read costs the same memory and keeps the batches
+    identical to a streamed read.
+    """
+    if fmt == "csv":
+        df = pl.read_csv(path, **options)
+    else:
+        options.setdefault("infer_schema_length", batch_size)
+        df = pl.read_ndjson(path, **options)
+    yield from _narrow(df, columns, predicate).iter_slices(batch_size)
+
+
+def _scan_ndjson(path: Path, batch_size: int, **options: Any) -> pl.LazyFrame:
+    """
+    Lazily scan an NDJSON file (blank lines are skipped).
+
+    The schema is inferred once, from the first batch_size lines by default,
+    and holds for the whole file. (Polars' own default of 100 lines would
+    silently drop fields that first appear further down.)
+    """
     if not path.is_file():
         raise FileNotFoundError(f"NDJSON path must be a file: {path}")
-    with open(path, "rb") as f:
-        batch_lines: list[bytes] = []
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            batch_lines.append(line)
-            if len(batch_lines) >= batch_size:
-                yield pl.read_ndjson(BytesIO(b"\n".join(batch_lines)), **options)
-                batch_lines = []
-        if batch_lines:
-            yield pl.read_ndjson(BytesIO(b"\n".join(batch_lines)), **options)
+    options.setdefault("infer_schema_length", batch_size)
+    return pl.scan_ndjson(path, **options)
+
+
+def encode(
+    df: Union[pl.DataFrame, ArrowBatch], format_name: str, **options: Any
+) -> bytes:
+    """
+    Encode a single DataFrame (or Arrow data) to bytes in the given format.
+
+    Used for uploads. CPU-bound; async callers run it via CpuEngine.
+    """
+    buffer = BytesIO()
+    fmt = format_name.lower()
+    df = as_frame(df)
+
+    if fmt == "parquet":
+        df.write_parquet(buffer, **options)
+    elif fmt == "csv":
+        df.write_csv(buffer, **options)
+    elif fmt == "ndjson":
+        df.write_ndjson(buffer, **options)
+    elif fmt in _IPC_FORMATS:
+        df.write_ipc(buffer, **options)
+    else:
+        raise ValueError(
+            f"Unknown format: {format_name}. Known: {', '.join(VALID_FORMATS)}"
+        )
+    return buffer.getvalue()
 
 
 def write(
-    df: pl.DataFrame,
+    df: Union[pl.DataFrame, ArrowBatch],
     path: Path | str,
     format_name: str,
     **options: Any,
 ) -> None:
     """
-    Write a single DataFrame to path in the given format.
+    Write a single DataFrame (or Arrow data) to path in the given format.
+
+    CPU-bound; async callers run it via CpuEngine.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     fmt = format_name.lower()
+    df = as_frame(df)
 
     if fmt == "parquet":
         df.write_parquet(path, **options)
@@ -142,6 +300,8 @@ def write(
         df.write_csv(path, **options)
     elif fmt == "ndjson":
         df.write_ndjson(path, **options)
+    elif fmt in _IPC_FORMATS:
+        df.write_ipc(path, **options)
     else:
         raise ValueError(
             f"Unknown format: {format_name}. Known: {', '.join(VALID_FORMATS)}"
@@ -7,6 +7,18 @@ all Home implementations follow, ensuring consistent, reliable data access.
 
 hygge is built on Polars + PyArrow for efficient data movement. All homes
 yield Polars DataFrames for fast, columnar data processing that feels natural.
+Homes that can also yield pyarrow record batches set `supports_arrow` and
+implement `_get_arrow_batches()`, so Flows can skip conversion when the
+Store writes Arrow directly.
+
+Every read runs a few batches ahead of its caller (`prefetch`, and optionally
+`prefetch_bytes`): the home's generator runs in a background task, so the
+next batch is being read while the flow polishes and writes the current one.
+Homes that do blocking work per batch hand it to a worker thread (see
+`hygge.core.parallel_read`) so the event loop stays free while they read.
+When a Flow runs under a memory budget, batches read ahead take their credit
+from the flow's MemoryAccount before they are queued, and hand it on to the
+flow with the batch (`take_read_credit()`).
 
 Following hygge's philosophy, Homes prioritize:
 - **Comfort**: Simple, intuitive interface for reading data
@@ -25,12 +37,43 @@ Example:
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, Optional, Type, Union
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 import polars as pl
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from hygge.messages import get_logger
+from hygge.utility.exceptions import ConfigError
+
+from .flow.batch_queue import BatchQueue
+from .memory import parse_bytes
+from .timings import StageTimings
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .memory import MemoryAccount
+
+# End of a read-ahead stream (None is not used: it costs nothing to queue, but
+# a home could in principle yield it)
+_END = object()
+
+
+class _ReadFailed:
+    """Carries a home's exception from the read-ahead task to the reader."""
+
+    def __init__(self, error: Exception):
+        self.error = error
 
 
 class Home(ABC):
@@ -57,6 +100,15 @@ class Home(ABC):
 
     _registry: Dict[str, Type["Home"]] = {}
 
+    # Whether `read_arrow()` can yield pyarrow record batches. Flows use it
+    # for the Arrow lane when the store accepts Arrow and nothing is polished.
+    supports_arrow: bool = False
+
+    # Whether this home reads discrete files: it lists them with
+    # `get_batch_paths()` and, when `selected_files` is set, reads only
+    # those. Flows use it to skip files already ingested (the file manifest).
+    reads_files: bool = False
+
     def __init_subclass__(cls, home_type: str = None):
         super().__init_subclass__()
         if home_type:
@@ -97,8 +149,18 @@ class Home(ABC):
         self.options = options or {}
         self.batch_size = self.options.get("batch_size", 10_000)
         self.row_multiplier = self.options.get("row_multiplier", 300_000)
+        # Batches (and bytes, when set) read ahead of the caller; 0 turns it off
+        self.prefetch = self.options.get("prefetch", 2)
+        self.prefetch_bytes = self.options.get("prefetch_bytes")
+        # Budget read-ahead is charged to (set by the Flow; None: unbudgeted)
+        self.memory: Optional["MemoryAccount"] = None
+        self._read_credit = 0
         self.start_time = None
+        # Files to read instead of the full listing (file homes; None: all)
+        self.selected_files: Optional[List[Path]] = None
         self.logger = get_logger(f"hygge.home.{self.__class__.__name__}")
+        # Stage timings (a Flow replaces this with its own shared instance)
+        self.timings = StageTimings()
 
     async def read(self) -> AsyncIterator[pl.DataFrame]:
         """
@@ -112,14 +174,32 @@ class Home(ABC):
         Yields:
             Polars DataFrame batches from the underlying data source
         """
+        async for df in self._track(self._get_batches()):
+            yield df
+
+    async def read_arrow(self) -> AsyncIterator["pa.RecordBatch"]:
+        """
+        Read data from this home as pyarrow record batches.
+
+        Only available when `supports_arrow` is True. Progress tracking and
+        error handling match `read()`.
+
+        Yields:
+            pyarrow RecordBatches from the underlying data source
+        """
+        async for batch in self._track(self._get_arrow_batches()):
+            yield batch
+
+    async def _track(self, batches: AsyncIterator) -> AsyncIterator:
+        """Pass batches through with progress logging and error handling."""
         try:
             total_rows = 0
             self.start_time = asyncio.get_event_loop().time()
 
-            async for df in self._get_batches():
-                total_rows += len(df)
+            async for batch in self._read_ahead(batches):
+                total_rows += len(batch)
                 self._log_progress(total_rows)
-                yield df
+                yield batch
 
             self._log_completion(total_rows)
 
@@ -127,6 +207,80 @@ class Home(ABC):
             self.logger.error(f"Error reading from {self.name}: {str(e)}")
             raise
 
+    def take_read_credit(self) -> int:
+        """
+        Memory-budget credit already taken for the batch just yielded.
+
+        Read-ahead acquires a batch's bytes from `memory` before queueing
+        it. The caller takes over that credit with the batch (and returns
+        it once the batch is written) instead of acquiring it again.
+
+        Returns:
+            Bytes acquired for the last batch (0 if none, or already taken)
+        """
+        credit, self._read_credit = self._read_credit, 0
+        return credit
+
+    async def _read_ahead(self, batches: AsyncIterator) -> AsyncIterator:
+        """
+        Pass batches through, reading up to `prefetch` batches ahead.
+
+        `batches` is drained by a background task into a queue bounded by
+        `prefetch` batches and, when set, `prefetch_bytes`. With a memory
+        account, each batch waits for budget headroom before it is queued.
+        Errors surface here, in order, after the batches read before them.
+        """
+        self._read_credit = 0
+        if self.prefetch <= 0:
+            async for batch in batches:
+                yield batch
+            return
+
+        queue = BatchQueue(maxsize=self.prefetch, max_bytes=self.prefetch_bytes)
+        memory = self.memory
+
+        async def pump() -> None:
+            try:
+                async for batch in batches:
+                    nbytes = BatchQueue.item_bytes(batch) if memory else 0
+                    if nbytes:
+                        await memory.acquire(nbytes)
+                    try:
+                        await queue.put(batch)
+                    except asyncio.CancelledError:
+                        if nbytes:
+                            memory.release(nbytes)
+                        raise
+            except Exception as e:
+                await queue.put(_ReadFailed(e))
+            await queue.put(_END)
+
+        task = asyncio.create_task(pump(), name=f"{self.name}_read_ahead")
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    break
+                if isinstance(item, _ReadFailed):
+                    raise item.error
+                if memory:
+                    self._read_credit = BatchQueue.item_bytes(item)
+                yield item
+        finally:
+            # Stopped early (or failed): stop reading and let the home's
+            # generator clean up (close connections, files) right away
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if hasattr(batches, "aclose"):
+                await batches.aclose()
+            # Batches read ahead but never handed over give their credit back
+            if memory:
+                memory.release(self.take_read_credit())
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not _END and not isinstance(item, _ReadFailed):
+                        memory.release(BatchQueue.item_bytes(item))
+
     @abstractmethod
     async def _get_batches(self) -> AsyncIterator[pl.DataFrame]:
         """
@@ -140,6 +294,23 @@ class Home(ABC):
         """
         pass
 
+    async def _get_arrow_batches(self) -> AsyncIterator["pa.RecordBatch"]:
+        """
+        Get pyarrow record batches from the underlying data source.
+
+        Homes that set `supports_arrow` implement this alongside
+        `_get_batches()`, yielding the same rows without building DataFrames.
+
+        Yields:
+            pyarrow RecordBatches from the underlying data source
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support Arrow batches"
+        )
+        # Unreachable yield to make this an async generator
+        if False:
+            yield
+
     def _log_progress(self, total_rows: int) -> None:
         """Log progress at regular intervals (DEBUG level)."""
         if total_rows % self.row_multiplier == 0:
@@ -217,10 +388,34 @@ class BaseHomeConfig(BaseModel):
     row_multiplier: int = Field(
         default=300_000, ge=1, description="Progress logging interval"
     )
+    prefetch: int = Field(
+        default=2,
+        ge=0,
+        description="Batches read ahead while the flow writes (0: no read-ahead)",
+    )
+    prefetch_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Also cap read-ahead by estimated bytes, e.g. 256MB (default: the "
+            "flow's queue_max_bytes, if set)"
+        ),
+    )
     options: Dict[str, Any] = Field(
         default_factory=dict, description="Additional home-specific options"
     )
 
+    @field_validator("prefetch_bytes", mode="before")
+    @classmethod
+    def parse_prefetch_bytes(cls, v):
+        """Accept sizes like '256MB' as well as plain byte counts."""
+        if v is None:
+            return None
+        try:
+            return parse_bytes(v)
+        except ConfigError as e:
+            raise ValueError(str(e)) from e
+
     @field_validator("type")
     @classmethod
     def validate_type(cls, v):
@@ -247,6 +442,8 @@ class BaseHomeConfig(BaseModel):
         options = {
             "batch_size": self.batch_size,
             "row_multiplier": self.row_multiplier,
+            "prefetch": self.prefetch,
+            "prefetch_bytes": self.prefetch_bytes,
         }
         # Add any additional options
         options.update(self.options)
@@ -17,14 +17,15 @@ Following hygge's philosophy, the journal prioritizes:
 
 import asyncio
 import io
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 import polars as pl
 from pydantic import BaseModel, Field, field_validator
 
+from hygge.core.manifest import FileEntry
 from hygge.messages import get_logger
 from hygge.utility.azure_onelake import ADLSOperations
 from hygge.utility.exceptions import ConfigError, JournalWriteError
@@ -95,7 +96,7 @@ class Journal:
     """
 
     # Schema version for evolution compatibility
-    SCHEMA_VERSION = "1.0"
+    SCHEMA_VERSION = "1.1"
 
     # Journal schema (Polars types)
     JOURNAL_SCHEMA = {
@@ -117,6 +118,20 @@ class Journal:
         "watermark": pl.Utf8,  # Nullable
         "message": pl.Utf8,  # Nullable
         "schema_version": pl.Utf8,
+        "home_batch_size": pl.Int64,  # Nullable (adaptive batching, 1.1+)
+        "store_batch_size": pl.Int64,  # Nullable (adaptive batching, 1.1+)
+    }
+
+    # File manifest schema (manifest.parquet, beside journal.parquet):
+    # one row per file ingested by a file home, per flow/entity
+    MANIFEST_SCHEMA = {
+        "flow": pl.Utf8,
+        "entity": pl.Utf8,
+        "path": pl.Utf8,  # Relative to the home's path
+        "size": pl.Int64,
+        "mtime": pl.Float64,
+        "content_hash": pl.Utf8,
+        "recorded_at": pl.Utf8,  # ISO format string
     }
 
     def __init__(
@@ -466,6 +481,8 @@ class Journal:
         watermark_type: Optional[str] = None,
         watermark: Optional[str] = None,
         message: Optional[str] = None,
+        home_batch_size: Optional[int] = None,
+        store_batch_size: Optional[int] = None,
     ) -> str:
         """
         Record entity run and return entity_run_id.
@@ -493,6 +510,8 @@ class Journal:
                 "datetime", "int", "string", or None
             watermark: Watermark value (string representation, None if no watermark)
             message: Error message, skip reason, config mismatch message, or None
+            home_batch_size: Home batch size chosen by adaptive batching
+            store_batch_size: Store batch size chosen by adaptive batching
 
         Returns:
             entity_run_id (deterministic hash)
@@ -522,6 +541,8 @@ class Journal:
             "watermark": watermark,
             "message": message,
             "schema_version": self.SCHEMA_VERSION,
+            "home_batch_size": home_batch_size,
+            "store_batch_size": store_batch_size,
         }
 
         # Create DataFrame from row
@@ -569,7 +590,7 @@ class Journal:
         try:
             if self.journal_path.exists():
                 # Read existing journal
-                existing_df = pl.read_parquet(self.journal_path)
+                existing_df = self._conform_schema(pl.read_parquet(self.journal_path))
                 # Concatenate with new row
                 combined_df = pl.concat([existing_df, new_row_df])
             else:
@@ -612,8 +633,8 @@ class Journal:
                 self.remote_journal_path
             )
             if existing_bytes:
-                existing_df = pl.read_parquet(
-                    io.BytesIO(existing_bytes), schema=self.JOURNAL_SCHEMA
+                existing_df = self._conform_schema(
+                    pl.read_parquet(io.BytesIO(existing_bytes))
                 )
                 combined_df = pl.concat([existing_df, new_row_df])
 
@@ -630,9 +651,8 @@ class Journal:
         if self.storage_backend == "local":
             if not self.journal_path or not self.journal_path.exists():
                 return None
-            return await asyncio.to_thread(
-                pl.read_parquet, self.journal_path, schema=self.JOURNAL_SCHEMA
-            )
+            journal_df = await asyncio.to_thread(pl.read_parquet, self.journal_path)
+            return self._conform_schema(journal_df)
 
         if not self.adls_ops or not self.remote_journal_path:
             raise ConfigError("Remote journal storage is not configured properly.")
@@ -643,7 +663,27 @@ class Journal:
         data = await self.adls_ops.read_file_bytes(self.remote_journal_path)
         if not data:
             return None
-        return pl.read_parquet(io.BytesIO(data), schema=self.JOURNAL_SCHEMA)
+        return self._conform_schema(pl.read_parquet(io.BytesIO(data)))
+
+    @classmethod
+    def _conform_schema(cls, journal_df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Bring a journal read from storage up to the current schema.
+
+        Journals written by older versions lack columns added since (e.g. the
+        1.1 batch size columns); those are filled with nulls so old and new
+        rows can be combined.
+        """
+        missing = [
+            pl.lit(None, dtype=dtype).alias(name)
+            for name, dtype in cls.JOURNAL_SCHEMA.items()
+            if name not in journal_df.columns
+        ]
+        if missing:
+            journal_df = journal_df.with_columns(missing)
+        return journal_df.select(
+            [pl.col(name).cast(dtype) for name, dtype in cls.JOURNAL_SCHEMA.items()]
+        )
 
     async def get_watermark(
         self,
@@ -725,6 +765,147 @@ class Journal:
             "primary_key": stored_primary_key,
         }
 
+    async def get_batch_sizes(self, flow: str, entity: str) -> Optional[Dict[str, int]]:
+        """
+        Get the batch sizes adaptive batching chose on the last successful run.
+
+        Args:
+            flow: Flow name
+            entity: Entity name
+
+        Returns:
+            Dict with "home_batch_size" and/or "store_batch_size", or None if
+            no successful run recorded them
+        """
+        journal_df = await self._read_journal_df()
+        if journal_df is None:
+            return None
+
+        sized_runs = journal_df.filter(
+            (pl.col("flow") == flow)
+            & (pl.col("entity") == entity)
+            & (pl.col("status") == "success")
+            & (
+                pl.col("home_batch_size").is_not_null()
+                | pl.col("store_batch_size").is_not_null()
+            )
+        )
+        if len(sized_runs) == 0:
+            return None
+
+        most_recent = sized_runs.sort("finish_time", descending=True).head(1)
+        return {
+            key: most_recent[key][0]
+            for key in ("home_batch_size", "store_batch_size")
+            if most_recent[key][0] is not None
+        }
+
+    async def get_file_manifest(self, flow: str, entity: str) -> Dict[str, FileEntry]:
+        """
+        Get the files already ingested for a flow/entity.
+
+        Args:
+            flow: Flow name
+            entity: Entity name
+
+        Returns:
+            Manifest entries by file key (empty if none recorded)
+        """
+        manifest_df = await self._read_manifest_df()
+        if manifest_df is None:
+            return {}
+
+        rows = manifest_df.filter(
+            (pl.col("flow") == flow) & (pl.col("entity") == entity)
+        )
+        return {
+            row["path"]: FileEntry(
+                row["path"], row["size"], row["mtime"], row["content_hash"]
+            )
+            for row in rows.iter_rows(named=True)
+        }
+
+    async def record_file_manifest(
+        self,
+        flow: str,
+        entity: str,
+        entries: List[FileEntry],
+        replace: bool = False,
+    ) -> None:
+        """
+        Record files ingested by a successful run.
+
+        Args:
+            flow: Flow name
+            entity: Entity name
+            entries: One entry per file
+            replace: Drop the entity's earlier entries first (full loads,
+                where the destination was rebuilt from exactly these files)
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        new_df = pl.DataFrame(
+            [
+                {
+                    "flow": flow,
+                    "entity": entity,
+                    "path": entry.path,
+                    "size": entry.size,
+                    "mtime": entry.mtime,
+                    "content_hash": entry.content_hash,
+                    "recorded_at": recorded_at,
+                }
+                for entry in entries
+            ],
+            schema=self.MANIFEST_SCHEMA,
+        )
+
+        async with self._write_lock:
+            existing = await self._read_manifest_df()
+            if existing is not None:
+                # Keep other entities' rows, and this entity's files not re-recorded
+                keep = (pl.col("flow") != flow) | (pl.col("entity") != entity)
+                if not replace:
+                    keep = keep | ~pl.col("path").is_in(new_df["path"].implode())
+                new_df = pl.concat([existing.filter(keep), new_df])
+            await self._write_manifest_df(new_df)
+
+        self.logger.debug(
+            f"Recorded {len(entries)} files in manifest for {flow}/{entity}"
+        )
+
+    async def _read_manifest_df(self) -> Optional[pl.DataFrame]:
+        """Read the file manifest into a Polars DataFrame."""
+        if self.storage_backend == "local":
+            path = self.journal_path.with_name("manifest.parquet")
+            if not path.exists():
+                return None
+            return await asyncio.to_thread(pl.read_parquet, path)
+
+        manifest_path = f"{self.remote_dir}/manifest.parquet"
+        if not await self.adls_ops.file_exists(manifest_path):
+            return None
+        data = await self.adls_ops.read_file_bytes(manifest_path)
+        return pl.read_parquet(io.BytesIO(data)) if data else None
+
+    async def _write_manifest_df(self, manifest_df: pl.DataFrame) -> None:
+        """Replace the file manifest (atomically, via a temp file and move)."""
+        try:
+            if self.storage_backend == "local":
+                path = self.journal_path.with_name("manifest.parquet")
+                temp_path = path.with_name(f"{path.name}.tmp_{uuid4().hex}")
+                await asyncio.to_thread(manifest_df.write_parquet, temp_path)
+                temp_path.replace(path)
+                return
+
+            buffer = io.BytesIO()
+            manifest_df.write_parquet(buffer)
+            manifest_path = f"{self.remote_dir}/manifest.parquet"
+            temp_path = f"{manifest_path}.tmp_{uuid4().hex}"
+            await self.adls_ops.upload_bytes(buffer.getvalue(), temp_path)
+            await self.adls_ops.move_file(temp_path, manifest_path)
+        except Exception as e:
+            raise JournalWriteError(f"Failed to write file manifest: {str(e)}") from e
+
     async def get_flow_summary(self, flow_run_id: str) -> Dict[str, Any]:
         """
         Get flow aggregation (n_entities, n_success, etc.) - computed on-demand.
@@ -0,0 +1,166 @@
+"""
+Coordinator-wide memory budget shared by concurrent flows.
+
+The Coordinator limits how many flows run at once, but not how much memory
+they hold. A dozen flows each buffering a full Store batch plus a full queue
+can add up to far more than the host has. MemoryBudget is a shared pool of
+byte credits: flows take credits for the batches they read and hold, give
+them back as data is written, and new flows are only admitted while there
+is headroom.
+
+Following hygge's philosophy:
+- **Comfort**: One `memory_budget` setting instead of tuning concurrency
+- **Reliability**: Every flow can always make progress, so no deadlocks
+- **Natural flow**: Large entities slow down instead of exhausting memory
+"""
+
+import asyncio
+import re
+from typing import Optional, Union
+
+from hygge.utility.exceptions import ConfigError
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_bytes(value: Union[int, float, str]) -> int:
+    """
+    Parse a byte size from config ("512MB", "8 GB", 1073741824).
+
+    Units are binary (1 GB = 1024**3 bytes) and case-insensitive.
+
+    Raises:
+        ConfigError: If the value is not a valid size
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        size = int(value)
+    else:
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*", str(value).upper())
+        if not match:
+            raise ConfigError(
+                f"Invalid size '{value}'. Use bytes or a unit like 512MB or 8GB."
+            )
+        size = int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+    if size <= 0:
+        raise ConfigError(f"Size must be positive, got '{value}'")
+    return size
+
+
+class MemoryBudget:
+    """
+    Shared pool of byte credits for all flows in a run.
+
+    Each flow works through its own MemoryAccount so its credits can be
+    returned in one go when it finishes or retries.
+
+    Example:
+        ```python
+        budget = MemoryBudget(parse_bytes("8GB"))
+        await budget.wait_for_headroom()  # Admission
+        account = budget.account("users")
+        await account.acquire(batch.estimated_size())
+        ...
+        account.release(batch.estimated_size())
+        account.close()
+        ```
+
+    Args:
+        limit_bytes: Total bytes that may be held across all accounts
+    """
+
+    def __init__(self, limit_bytes: int):
+        self.limit_bytes = limit_bytes
+        self.used_bytes = 0
+        self._freed = asyncio.Event()
+
+    @property
+    def available_bytes(self) -> int:
+        """Bytes still free (never negative)."""
+        return max(0, self.limit_bytes - self.used_bytes)
+
+    def account(self, name: str) -> "MemoryAccount":
+        """Create a per-flow account that draws on this budget."""
+        return MemoryAccount(self, name)
+
+    async def wait_for_headroom(self) -> None:
+        """Wait until some of the budget is free (used for flow admission)."""
+        while self.used_bytes >= self.limit_bytes:
+            await self._wait_for_release()
+
+    async def _acquire(self, nbytes: int, account: "MemoryAccount") -> None:
+        # An account with nothing in flight is always let through, so every
+        # flow can move at least one batch and the run cannot deadlock.
+        while (
+            account.acquired_bytes > 0 and self.used_bytes + nbytes > self.limit_bytes
+        ):
+            await self._wait_for_release()
+        self.used_bytes += nbytes
+
+    async def _wait_for_release(self) -> None:
+        self._freed.clear()
+        await self._freed.wait()
+
+    def _charge(self, nbytes: int) -> None:
+        self.used_bytes += nbytes
+
+    def _release(self, nbytes: int) -> None:
+        if nbytes <= 0:
+            return
+        self.used_bytes -= nbytes
+        self._freed.set()
+
+
+class MemoryAccount:
+    """
+    One flow's share of a MemoryBudget.
+
+    Two kinds of holdings are kept apart:
+    - `acquire()`/`release()` cover batches in flight (read but not yet
+      written). Acquiring waits for headroom, which is the backpressure.
+    - `track()` records memory already held elsewhere, such as rows a Store
+      keeps buffered. It never waits, so writers are never blocked.
+    """
+
+    def __init__(self, budget: MemoryBudget, name: str):
+        self.budget = budget
+        self.name = name
+        self.acquired_bytes = 0
+        self.tracked_bytes = 0
+
+    @property
+    def held_bytes(self) -> int:
+        """Total credit this account holds."""
+        return self.acquired_bytes + self.tracked_bytes
+
+    async def acquire(self, nbytes: int) -> None:
+        """Take `nbytes` of credit for new data, waiting for headroom."""
+        if nbytes > 0:
+            await self.budget._acquire(nbytes, self)
+            self.acquired_bytes += nbytes
+
+    def release(self, nbytes: int) -> None:
+        """Return `nbytes` of in-flight credit to the budget."""
+        nbytes = min(nbytes, self.acquired_bytes)
+        self.acquired_bytes -= nbytes
+        self.budget._release(nbytes)
+
+    def track(self, nbytes: int) -> None:
+        """Set the memory held outside the queue (e.g. Store buffer) to `nbytes`."""
+        delta = nbytes - self.tracked_bytes
+        self.tracked_bytes = nbytes
+        if delta > 0:
+            self.budget._charge(delta)
+        else:
+            self.budget._release(-delta)
+
+    def close(self) -> None:
+        """Return everything this account holds."""
+        self.release(self.acquired_bytes)
+        self.track(0)
+
+
+def resolve_memory_budget(value: Optional[Union[int, str]]) -> Optional[MemoryBudget]:
+    """Build a MemoryBudget from the `memory_budget` option (None = disabled)."""
+    if value is None:
+        return None
+    return MemoryBudget(parse_bytes(value))
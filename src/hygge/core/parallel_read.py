@@ -0,0 +1,125 @@
+"""
+Read several sources at once on a bounded worker pool.
+
+File homes read one file after another, each to completion. During a
+backfill over hundreds of files that leaves disks and cores idle while one
+file decodes. `read_in_parallel` runs up to `workers` file readers at once,
+each on its own worker thread, and hands their batches back to the event
+loop.
+
+Each reader keeps at most `prefetch` batches waiting, so memory stays at
+about `workers × prefetch` batches however many files there are.
+
+Following hygge's philosophy:
+- **Comfort**: Same batches as a sequential read, in the same order by default
+- **Reliability**: A failing reader stops the read and its error surfaces as-is
+- **Natural flow**: Readers wait for the consumer instead of racing ahead
+"""
+
+import asyncio
+import concurrent.futures
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List
+
+# A reader is called on a worker thread and returns a (sync) iterator of batches
+Reader = Callable[[], Iterable[Any]]
+
+_DONE = object()
+
+
+class _Failed:
+    """Carries a reader's exception back to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def read_in_parallel(
+    readers: List[Reader],
+    workers: int,
+    ordered: bool = True,
+    prefetch: int = 2,
+) -> AsyncIterator[Any]:
+    """
+    Yield the batches of every reader, running up to `workers` at once.
+
+    Args:
+        readers: One callable per source (e.g. per file)
+        workers: Readers running at the same time
+        ordered: Yield all of reader 0's batches, then reader 1's, ... (the
+            same order as a sequential read). When False, batches are
+            yielded as soon as any reader produces one.
+        prefetch: Batches each reader may hold before waiting for the consumer
+
+    Yields:
+        Batches from the readers
+    """
+    workers = max(1, min(workers, len(readers)))
+    loop = asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="hygge-read"
+    )
+
+    async def pump(reader: Reader, queue: asyncio.Queue) -> None:
+        """Move one reader's batches into `queue`, one worker call each."""
+        try:
+            batches: Iterator[Any] = await loop.run_in_executor(
+                executor, lambda: iter(reader())
+            )
+            while True:
+                batch = await loop.run_in_executor(executor, next, batches, _DONE)
+                if batch is _DONE:
+                    break
+                await queue.put(batch)
+        except Exception as e:
+            await queue.put(_Failed(e))
+        await queue.put(_DONE)
+
+    pending = iter(readers)
+    tasks: List[asyncio.Task] = []
+
+    def start(queue: asyncio.Queue) -> bool:
+        reader = next(pending, None)
+        if reader is None:
+            return False
+        tasks.append(asyncio.create_task(pump(reader, queue)))
+        return True
+
+    try:
+        if ordered:
+            # A window of `workers` readers, each with its own queue; drain
+            # the oldest while the others read ahead
+            window: List[asyncio.Queue] = []
+            for _ in range(workers):
+                queue = asyncio.Queue(maxsize=prefetch)
+                if start(queue):
+                    window.append(queue)
+            while window:
+                item = await window[0].get()
+                if item is _DONE:
+                    window.pop(0)
+                    queue = asyncio.Queue(maxsize=prefetch)
+                    if start(queue):
+                        window.append(queue)
+                    continue
+                if isinstance(item, _Failed):
+                    raise item.error
+                yield item
+        else:
+            # One shared queue; a new reader starts whenever one finishes
+            queue = asyncio.Queue(maxsize=prefetch * workers)
+            running = sum(start(queue) for _ in range(workers))
+            while running:
+                item = await queue.get()
+                if item is _DONE:
+                    running -= 1
+                    running += start(queue)
+                    continue
+                if isinstance(item, _Failed):
+                    raise item.error
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # A reader mid-batch finishes that batch on its thread; don't wait
+        executor.shutdown(wait=False, cancel_futures=True)
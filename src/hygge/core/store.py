@@ -7,6 +7,8 @@ all Store implementations follow, ensuring consistent, reliable data writing.
 
 hygge is built on Polars + PyArrow for efficient data movement. All stores
 accept Polars DataFrames for fast, columnar data writing that feels natural.
+Stores whose `_save()` can also write pyarrow Tables set `accepts_arrow`;
+when nothing needs polishing, Arrow batches reach `_save()` unconverted.
 
 Following hygge's philosophy, Stores prioritize:
 - **Comfort**: Simple, intuitive interface for writing data
@@ -19,12 +21,24 @@ Stores must implement:
 - `_save()`: Save data to the underlying store (abstract method)
 
 Stores can optionally override:
+- `prepare_batch()`: Per-batch CPU work before buffering (default: polish)
 - `configure_for_run()`: Configure store for run type (default: no-op)
 - `cleanup_staging()`: Clean up staging directories (default: no-op)
 - `reset_retry_sensitive_state()`: Reset retry-sensitive state
   (default: resets base state)
 - `set_pool()`: Set connection pool for database stores (default: no-op)
 
+Write-behind (opt-in via `options.max_inflight_writes`):
+    By default each flushed batch is saved inline, so the Flow consumer waits
+    for the encode/upload/insert before it accepts the next batch. Setting
+    `max_inflight_writes` above 1 lets up to that many `_save()` calls run in
+    the background while the consumer keeps reading. The first batch is
+    always saved inline, under a lock that concurrent Flow consumers wait
+    on, so one-time setup inside `_save()` (temp tables, folder preparation)
+    runs exactly once. Filenames are assigned in batch
+    order before a save starts, and `saved_paths` is restored to that order
+    once writes drain, so sequence-numbered files are published in order.
+
 Example:
     ```python
     class MyStore(Store, store_type="my_type"):
@@ -36,15 +50,21 @@ Example:
 """
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import polars as pl
 from pydantic import BaseModel, Field, field_validator
 
+from hygge.connections.execution import CpuEngine
 from hygge.messages import get_logger
 
+from .arrow import as_frame, is_arrow
+from .buffer import BatchBuffer
+from .timings import StageTimings
+
 if TYPE_CHECKING:
     from hygge.connections import ConnectionPool
 
@@ -76,6 +96,18 @@ class Store(ABC):
 
     _registry: Dict[str, Type["Store"]] = {}
 
+    # Whether batches must be written in the order they were read. Flows with
+    # several consumers serialize writes in queue order for these stores.
+    requires_ordered_writes: bool = False
+
+    # Whether _save() can write pyarrow Tables as well as DataFrames. See
+    # `arrow_passthrough` for when Arrow batches are actually passed through.
+    accepts_arrow: bool = False
+
+    # Whether _save() only hands the batch to background workers. Its time is
+    # then a queue wait, not write latency, so batch sizing ignores it.
+    saves_in_background: bool = False
+
     def __init_subclass__(cls, store_type: str = None):
         super().__init_subclass__()
         if store_type:
@@ -121,9 +153,9 @@ class Store(ABC):
         self.options = options or {}
         self.batch_size = self.options.get("batch_size", 100_000)
         self.row_multiplier = self.options.get("row_multiplier", 300_000)
-        self.data_buffer = []
-        self.buffer_size = 0
-        self.current_df = None  # Current accumulated data
+        # Incoming frames are kept as chunks and sliced into exact batches,
+        # so writes never re-concatenate the whole buffer
+        self._buffer = BatchBuffer()
         self.total_rows = 0
         self.rows_written = 0  # Track total rows written
         self.transfers = []  # Track file transfers
@@ -133,6 +165,10 @@ class Store(ABC):
         )
         self.start_time = None
         self.logger = get_logger(f"hygge.store.{self.__class__.__name__}")
+        # Stage timings (a Flow replaces this with its own shared instance)
+        self.timings = StageTimings()
+        # (rows, bytes, seconds) per finished save, for the flow's batch sizer
+        self._completed_saves: List[Tuple[int, int, float]] = []
 
         # Progress tracking (matches home read cadence)
         self.rows_since_last_log = 0
@@ -144,6 +180,75 @@ class Store(ABC):
         # Concrete stores can set this based on their config (e.g., store.polish).
         self._polisher = None
 
+        # Write-behind: how many _save() calls may run in the background.
+        # 1 (default) keeps the original inline behaviour.
+        self.max_inflight_writes = max(
+            1, int(self.options.get("max_inflight_writes", 1))
+        )
+        self._inflight_writes: List[asyncio.Task] = []
+        self._issued_filenames: List[str] = []
+        self._saves_started = 0
+        # Held while the first save runs, so flushes from several Flow
+        # consumers never run one-time setup in _save() concurrently
+        self._first_save_lock = asyncio.Lock()
+
+    @property
+    def data_buffer(self) -> List[pl.DataFrame]:
+        """Buffered chunks waiting to be flushed, in arrival order."""
+        return self._buffer.chunks
+
+    @data_buffer.setter
+    def data_buffer(self, chunks: Optional[List[pl.DataFrame]]) -> None:
+        self._buffer = BatchBuffer(chunks)
+
+    @property
+    def buffer_size(self) -> int:
+        """Number of rows currently buffered."""
+        return self._buffer.rows
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Estimated in-memory size of the rows currently buffered."""
+        return self._buffer.estimated_bytes
+
+    @property
+    def current_df(self) -> Optional[pl.DataFrame]:
+        """
+        All buffered rows as a single DataFrame (None when empty).
+
+        Computed on demand from the buffered chunks without copying.
+        """
+        return self._buffer.to_frame()
+
+    @current_df.setter
+    def current_df(self, df: Optional[pl.DataFrame]) -> None:
+        self._buffer = BatchBuffer([df] if df is not None else None)
+
+    @property
+    def arrow_passthrough(self) -> bool:
+        """
+        Whether Arrow batches can be buffered and saved without conversion.
+
+        True when the store accepts Arrow and per-batch preparation is a
+        no-op (see `prepares_batches`).
+        """
+        return self.accepts_arrow and not self.prepares_batches
+
+    @property
+    def prepares_batches(self) -> bool:
+        """
+        Whether `prepare_batch()` does any work.
+
+        False when no polisher is configured and neither `prepare_batch()`
+        nor `_pre_write()` is overridden. Such batches are not worth a trip
+        to the CPU pool.
+        """
+        return (
+            getattr(self, "_polisher", None) is not None
+            or type(self).prepare_batch is not Store.prepare_batch
+            or type(self)._pre_write is not Store._pre_write
+        )
+
     def configure_for_run(self, run_type: str) -> None:
         """
         Configure the store for the upcoming run type.
@@ -160,17 +265,39 @@ class Store(ABC):
         """
         pass
 
-    async def write(self, data: pl.DataFrame) -> None:
+    def prepare_batch(self, data: pl.DataFrame) -> pl.DataFrame:
+        """
+        Per-batch CPU work applied before data is buffered.
+
+        Runs once for every incoming batch. A Flow with several consumers
+        calls this on worker threads, for several batches at once, so it must
+        only depend on the batch it is given. Default: apply the optional
+        Polisher via `_pre_write()`.
+
+        Args:
+            data: Incoming batch
+
+        Returns:
+            Batch ready to buffer and save
+        """
+        return self._pre_write(data)
+
+    async def write(self, data: pl.DataFrame, prepared: bool = False) -> None:
         """
         Write data to this store.
 
         This method handles buffering and batch writing:
+        - Prepares the batch (polish) on the CPU pool unless the caller
+          already did, or inline when there is nothing to prepare
+        - Buffers Arrow batches as-is when `arrow_passthrough` allows it, and
+          converts them to Polars otherwise
         - Accumulates data until batch_size is reached
         - Writes batches to the underlying store
         - Tracks progress and performance
 
         Args:
-            data: Polars DataFrame to write
+            data: Polars DataFrame (or pyarrow RecordBatch/Table) to write
+            prepared: True if `prepare_batch()` has already been applied
         """
         try:
             if self.start_time is None:
@@ -182,20 +309,28 @@ class Store(ABC):
 
                 raise StoreError("Cannot write None data")
 
+            if is_arrow(data):
+                if self.arrow_passthrough:
+                    # Nothing to prepare; buffer the Arrow batch as-is
+                    prepared = True
+                else:
+                    data = await CpuEngine.execute(as_frame, data)
+
+            if not prepared:
+                with self.timings.span("polish"):
+                    if self.prepares_batches:
+                        # Polish is CPU-bound; keep it off the event loop
+                        data = await CpuEngine.execute(self.prepare_batch, data)
+                    else:
+                        # A no-op: not worth a thread hop per batch
+                        data = self.prepare_batch(data)
+
             # Add data to buffer and update tracking
             row_count = len(data)
-            self.data_buffer.append(data)
-            self.buffer_size += row_count
+            self._buffer.append(data)
             self.total_rows += row_count
             self.rows_written += row_count
 
-            # Update current_df (accumulate or replace)
-            if self.current_df is None:
-                self.current_df = data
-            else:
-                # Combine with existing data
-                self.current_df = pl.concat([self.current_df, data])
-
             # Write if buffer is full
             result = None
             while self.buffer_size >= self.batch_size:
@@ -214,28 +349,32 @@ class Store(ABC):
         This method should be called when all data has been written
         to ensure any remaining buffered data is persisted.
         """
-        if self.data_buffer:
+        if self._buffer:
             await self._flush_buffer()
 
+        # Wait for background saves before anything is published
+        await self._drain_writes()
+
         # Log any remaining accumulated rows that didn't hit the interval
         if self.rows_since_last_log > 0:
             self.logger.debug(f"WROTE {self.rows_since_last_log:,} rows")
 
         # Move staged files to final location for file-based stores
         if self.uses_file_staging:
-            if hasattr(self, "_move_staged_files_to_final"):
-                await self._move_staged_files_to_final()
-            elif hasattr(self, "saved_paths") and hasattr(self, "_move_to_final"):
-                # Move staged files to final location
-                for staging_path_str in self.saved_paths:
-                    if staging_path_str:
-                        from pathlib import Path
-
-                        staging_path = Path(staging_path_str)
-                        final_dir = self.get_final_directory()
-                        # final_dir is guaranteed non-None for file-based stores
-                        final_path = final_dir / staging_path.name
-                        await self._move_to_final(staging_path, final_path)
+            with self.timings.span("move"):
+                if hasattr(self, "_move_staged_files_to_final"):
+                    await self._move_staged_files_to_final()
+                elif hasattr(self, "saved_paths") and hasattr(self, "_move_to_final"):
+                    # Move staged files to final location
+                    for staging_path_str in self.saved_paths:
+                        if staging_path_str:
+                            from pathlib import Path
+
+                            staging_path = Path(staging_path_str)
+                            final_dir = self.get_final_directory()
+                            # final_dir is guaranteed non-None for file-based stores
+                            final_path = final_dir / staging_path.name
+                            await self._move_to_final(staging_path, final_path)
 
         if self.start_time:
             duration = asyncio.get_event_loop().time() - self.start_time
@@ -252,42 +391,13 @@ class Store(ABC):
         This method must be implemented by subclasses to provide
         the actual data writing logic.
         """
-        if not self.data_buffer:
+        if not self._buffer:
             return
 
         try:
-            # Combine all buffered data
-            combined_data = self._combine_buffered_data()
-
-            # Apply optional last-mile polish before saving.
-            combined_data = self._pre_write(combined_data)
-
-            # If data exceeds batch_size, only flush one batch
-            if len(combined_data) > self.batch_size:
-                batch_data = combined_data.slice(0, self.batch_size)
-                remaining_data = combined_data.slice(self.batch_size)
-
-                # Update current_df with remaining data
-                self.current_df = remaining_data
-
-                # Clear buffer and add back remaining data
-                self.data_buffer.clear()
-                if len(remaining_data) > 0:
-                    self.data_buffer.append(remaining_data)
-
-                # Update buffer size
-                self.buffer_size = len(remaining_data)
-
-                # Use batch data for writing
-                data_to_write = batch_data
-            else:
-                # Flush all data
-                data_to_write = combined_data
-                self.data_buffer.clear()
-                self.buffer_size = 0
-                # Only clear current_df if there's no remaining data
-                if len(data_to_write) == len(combined_data):
-                    self.current_df = None
+            # Cut at most one batch from the front of the buffer. Chunks are
+            # sliced in place, so the remainder is never copied.
+            data_to_write = self._buffer.take(self.batch_size)
 
             # Generate path for file-based stores
             path = None
@@ -297,8 +407,9 @@ class Store(ABC):
                 # staging_dir is guaranteed non-None for file-based stores
                 path = str(staging_dir / filename)
 
-            # Write to underlying store
-            await self._save(data_to_write, path)
+            if path:
+                self._issued_filenames.append(PurePath(path).name)
+            await self._dispatch_save(data_to_write, path)
 
             self.logger.debug(
                 f"Flushed batch: {len(data_to_write):,} rows to {self.name}"
@@ -311,6 +422,110 @@ class Store(ABC):
             self.logger.error(f"Failed to flush buffer for {self.name}: {str(e)}")
             raise
 
+    async def _dispatch_save(self, data: pl.DataFrame, path: Optional[str]) -> None:
+        """
+        Save one flushed batch to the underlying store.
+
+        The first save runs inline under `_first_save_lock`: concurrent
+        flushes wait for it, so one-time setup inside `_save()` runs once.
+        Later saves run in the background when write-behind is enabled.
+        """
+        if self._saves_started == 0:
+            async with self._first_save_lock:
+                if self._saves_started == 0:
+                    await self._timed_save(data, path)
+                    self._saves_started += 1
+                    return
+
+        self._saves_started += 1
+        if self.max_inflight_writes > 1:
+            await self._submit_write(data, path)
+        else:
+            await self._timed_save(data, path)
+
+    async def _submit_write(self, data: pl.DataFrame, path: Optional[str]) -> None:
+        """
+        Start a background _save(), waiting while the in-flight limit is reached.
+
+        Any error from an earlier background save is raised here, so failures
+        surface on the next write instead of waiting for finish().
+        """
+        try:
+            self._reap_writes([t for t in self._inflight_writes if t.done()])
+
+            while len(self._inflight_writes) >= self.max_inflight_writes:
+                done, _ = await asyncio.wait(
+                    self._inflight_writes, return_when=asyncio.FIRST_COMPLETED
+                )
+                self._reap_writes(done)
+        except BaseException:
+            await self._cancel_writes()
+            raise
+
+        task = asyncio.create_task(
+            self._timed_save(data, path), name=f"{self.name}_save"
+        )
+        self._inflight_writes.append(task)
+
+    async def _timed_save(self, data: pl.DataFrame, path: Optional[str]) -> None:
+        """Run _save() as one `save` span and record it for batch sizing."""
+        started = time.perf_counter()
+        with self.timings.span("save"):
+            await self._save(data, path)
+        nbytes = data.nbytes if is_arrow(data) else data.estimated_size()
+        self._completed_saves.append((len(data), nbytes, time.perf_counter() - started))
+
+    def take_completed_saves(self) -> List[Tuple[int, int, float]]:
+        """
+        Saves finished since the last call, as (rows, bytes, seconds).
+
+        Writes that only buffered rows flush nothing, so they add nothing
+        here; background saves appear once they finish.
+        """
+        saves, self._completed_saves = self._completed_saves, []
+        return saves
+
+    def _reap_writes(self, done) -> None:
+        """Remove finished saves from the in-flight list, raising the first error."""
+        error = None
+        for task in done:
+            self._inflight_writes.remove(task)
+            if error is None and not task.cancelled():
+                error = task.exception()
+        if error is not None:
+            raise error
+
+    async def _drain_writes(self) -> None:
+        """
+        Wait for all background saves to complete.
+
+        On the first failure the remaining saves are cancelled and the error
+        is raised. On success, saved_paths is restored to the order in which
+        filenames were issued.
+        """
+        if self._inflight_writes:
+            try:
+                await asyncio.gather(*self._inflight_writes)
+            except BaseException:
+                await self._cancel_writes()
+                raise
+            self._inflight_writes.clear()
+
+        saved_paths = getattr(self, "saved_paths", None)
+        if self._issued_filenames and saved_paths:
+            order = {name: i for i, name in enumerate(self._issued_filenames)}
+            saved_paths.sort(
+                key=lambda p: order.get(PurePath(p).name, len(order)) if p else -1
+            )
+
+    async def _cancel_writes(self) -> None:
+        """Cancel any background saves and wait for them to stop."""
+        for task in self._inflight_writes:
+            task.cancel()
+        if self._inflight_writes:
+            await asyncio.gather(*self._inflight_writes, return_exceptions=True)
+        self._inflight_writes.clear()
+
     def _combine_buffered_data(self) -> pl.DataFrame:
         """
         Combine buffered data into a single Polars DataFrame.
@@ -321,11 +536,7 @@ class Store(ABC):
         Returns:
             Combined Polars DataFrame ready for writing
         """
-        if len(self.data_buffer) == 1:
-            return self.data_buffer[0]
-        else:
-            # Combine multiple DataFrames
-            return pl.concat(self.data_buffer)
+        return self._buffer.to_frame()
 
     def _pre_write(self, data: pl.DataFrame) -> pl.DataFrame:
         """
@@ -393,7 +604,8 @@ class Store(ABC):
         Subclasses should call self._log_write_progress(len(data)) after saving.
 
         Args:
-            data: Polars DataFrame to save
+            data: Polars DataFrame to save (a pyarrow Table when the store
+                sets `accepts_arrow` and the Arrow lane is in use)
             path: Optional path for the data (for file-based stores)
         """
         pass
@@ -460,10 +672,13 @@ class Store(ABC):
         Raises:
             StoreError: If reset fails (stores can raise this)
         """
+        # Stop any background saves from the failed attempt
+        await self._cancel_writes()
+        self._issued_filenames.clear()
+        self._saves_started = 0
+
         # Reset general store state that accumulates during execution
-        self.data_buffer.clear()
-        self.buffer_size = 0
-        self.current_df = None
+        self._buffer.clear()
         self.total_rows = 0
         self.rows_written = 0
         self.transfers.clear()
@@ -494,12 +709,7 @@ class Store(ABC):
 
         This method is called when data needs to be staged to temporary storage.
         """
-        # If no data_buffer but current_df exists, use it
-        if not self.data_buffer and self.current_df is not None:
-            self.data_buffer = [self.current_df]
-            self.buffer_size = len(self.current_df)
-
-        if not self.data_buffer:
+        if not self._buffer:
             return
 
         combined_data = self._combine_buffered_data()
@@ -515,9 +725,7 @@ class Store(ABC):
         await self._save(combined_data, path)
 
         # Clear buffer after staging
-        self.data_buffer.clear()
-        self.buffer_size = 0
-        self.current_df = None
+        self._buffer.clear()
 
 
 class StoreConfig(ABC):
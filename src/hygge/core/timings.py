@@ -0,0 +1,111 @@
+"""
+Per-stage timings for a flow run.
+
+The rows/s lines say how fast a flow was, not where its time went. A Flow
+owns one StageTimings and shares it with its Home and Store; each records
+wall-clock spans for the stages it runs (read, queue wait, polish, encode,
+upload, move, journal, ...). The totals go into the run summary and into a
+machine-readable report.
+
+Following hygge's philosophy:
+- **Comfort**: One line per entity shows where the time went
+- **Reliability**: Timing never changes what a flow does
+- **Natural flow**: Spans wrap the code that already runs, nothing more
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from hygge.messages import get_logger
+
+
+class StageTimings:
+    """
+    Accumulated seconds and call counts per stage.
+
+    Spans may nest (a Store's `save` includes its `encode` and `upload`)
+    and may overlap when work runs concurrently (several consumers, or
+    write-behind saves), so totals are busy time per stage and can add up
+    to more than the flow's wall-clock duration. Retried attempts keep
+    adding to the same totals.
+
+    Example:
+        ```python
+        timings = StageTimings()
+        with timings.span("encode"):
+            data = encode(df, "parquet")
+        timings.add("read", 0.42)
+        timings.as_dict()  # {"encode": {"seconds": ..., "count": 1}, ...}
+        ```
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add one span of `seconds` to `stage`."""
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + max(seconds, 0.0)
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block (sync or async code) as one `stage` span."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def as_dict(self) -> Dict[str, Dict[str, Union[float, int]]]:
+        """Totals per stage, in the order stages were first recorded."""
+        return {
+            stage: {"seconds": round(seconds, 4), "count": self.counts[stage]}
+            for stage, seconds in self.seconds.items()
+        }
+
+
+def write_timings_report(
+    path: Union[str, Path],
+    flow_results: List[Dict[str, Any]],
+    coordinator_run_id: Optional[str] = None,
+    coordinator_name: Optional[str] = None,
+) -> Path:
+    """
+    Write per-entity stage timings for a run as JSON.
+
+    Args:
+        path: Report file (parent directories are created)
+        flow_results: Coordinator flow results, each with a `timings` dict
+        coordinator_run_id: Run this report belongs to
+        coordinator_name: Coordinator (workspace) name
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "coordinator": coordinator_name,
+        "coordinator_run_id": coordinator_run_id,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "flows": [
+            {
+                "name": result["name"],
+                "flow": result.get("flow"),
+                "entity": result.get("entity"),
+                "status": result["status"],
+                "rows": result.get("rows", 0),
+                "duration": round(result.get("duration", 0.0), 4),
+                "stages": result.get("timings", {}),
+            }
+            for result in flow_results
+        ],
+    }
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    get_logger("hygge.timings").debug(f"Wrote stage timings to {path}")
+    return path
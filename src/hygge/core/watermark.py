@@ -11,7 +11,9 @@ Following hygge's philosophy:
 - **Natural flow**: Simple API that feels natural to use
 """
 
-from typing import Any, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
 
 import polars as pl
 
@@ -251,3 +253,53 @@ class Watermark:
         """
         self._watermark_candidate = None
         self._watermark_type = None
+
+
+def watermark_filter(
+    watermark: Dict[str, Any], schema: Optional[pl.Schema] = None
+) -> Optional[pl.Expr]:
+    """
+    Build a Polars predicate selecting rows past a journal watermark.
+
+    The counterpart of a SQL home's `WHERE column > watermark` for homes that
+    read through Polars scans, where the predicate is pushed into the scan.
+
+    Args:
+        watermark: Watermark information from the journal (watermark,
+            watermark_type, watermark_column)
+        schema: Source schema, used to line up datetime time zones
+
+    Returns:
+        `col(watermark_column) > watermark`, or None when the watermark is
+        incomplete or of an unsupported type
+    """
+    value = watermark.get("watermark")
+    watermark_type = watermark.get("watermark_type")
+    column = watermark.get("watermark_column")
+    if not value or not watermark_type or not column:
+        return None
+
+    if watermark_type == "datetime":
+        try:
+            since = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        dtype = schema.get(column) if schema is not None else None
+        if isinstance(dtype, pl.Datetime):
+            # Compare like with like: aware columns need aware literals
+            if dtype.time_zone and since.tzinfo is None:
+                since = since.replace(tzinfo=ZoneInfo(dtype.time_zone))
+            elif not dtype.time_zone and since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        return pl.col(column) > since
+
+    if watermark_type == "int":
+        try:
+            return pl.col(column) > int(value)
+        except ValueError:
+            return None
+
+    if watermark_type == "string":
+        return pl.col(column) > pl.lit(str(value))
+
+    return None
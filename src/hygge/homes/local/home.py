@@ -2,28 +2,37 @@
 Local file home: reads from local paths using the format layer.
 """
 
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import polars as pl
 from pydantic import Field, field_validator
 
-from hygge.core.formats import VALID_FORMATS, format_to_suffix
+from hygge.core.formats import VALID_FORMATS, build_predicate, file_patterns
 from hygge.core.formats import read as format_read
 from hygge.core.home import BaseHomeConfig, Home, HomeConfig
+from hygge.core.parallel_read import read_in_parallel
+from hygge.core.watermark import watermark_filter
 from hygge.utility.exceptions import HomeError, HomeReadError
 from hygge.utility.path_helper import PathHelper
 
 
 class LocalHome(Home, home_type="local"):
     """
-    A local file home that reads by format (parquet, csv, ndjson).
+    A local file home that reads by format (parquet, csv, ndjson, arrow).
+    CSV and NDJSON files may be gzip or zstd compressed (.gz, .zst).
 
     Delegates actual I/O to the format layer. Supports single file or directory
     (glob by format extension). Compatible with ParquetHomeConfig for backward
     compatibility (type: parquet → LocalHome with format=parquet).
+
+    `columns` and `filter` are pushed down into the format layer's scans, as
+    is the journal watermark for incremental runs (`read_with_watermark`).
     """
 
+    reads_files = True
+
     def __init__(
         self,
         name: str,
@@ -37,6 +46,8 @@ class LocalHome(Home, home_type="local"):
 
         self._format = getattr(config, "format", "parquet")
         self._format_options = getattr(config, "format_options", None) or {}
+        self._columns = getattr(config, "columns", None)
+        self._filter = getattr(config, "filter", None)
 
         if entity_name:
             merged_path = PathHelper.merge_paths(config.path, entity_name)
@@ -51,17 +62,22 @@ class LocalHome(Home, home_type="local"):
     def get_batch_paths(self) -> list[Path]:
         """
         Get list of files to read (by format extension).
-        Single file → [path]; directory → sorted glob by format suffix.
+        Single file → [path]; directory → sorted glob by format suffix,
+        including compressed csv/ndjson (.gz, .zst) alongside plain files.
         """
         if not self.data_path.exists():
             raise HomeError(f"Path does not exist: {self.data_path}")
 
-        suffix = format_to_suffix(self._format)
         if self.data_path.is_file():
             return [self.data_path]
         if self.data_path.is_dir():
-            pattern = f"*{suffix}"
-            files = sorted(self.data_path.rglob(pattern))
+            files = sorted(
+                {
+                    path
+                    for pattern in file_patterns(self._format)
+                    for path in self.data_path.rglob(pattern)
+                }
+            )
             if not files:
                 raise HomeError(
                     f"No {self._format} files found in directory: {self.data_path}"
@@ -72,18 +88,69 @@ class LocalHome(Home, home_type="local"):
 
     async def _get_batches(self) -> AsyncIterator[pl.DataFrame]:
         """Yield batches from the format layer (read per file)."""
+        async for batch_df in self._read_files(self._predicate()):
+            yield batch_df
+
+    async def read_with_watermark(
+        self, watermark: Dict[str, Any]
+    ) -> AsyncIterator[pl.DataFrame]:
+        """
+        Read only rows past the journal watermark.
+
+        The watermark becomes a predicate on the scan, so parquet row groups
+        whose statistics are all at or below it are skipped without decoding.
+
+        Args:
+            watermark: Watermark information retrieved from the journal.
+                Expected keys: watermark, watermark_type, watermark_column
+        """
+        watermark_expr = None
+        if watermark and watermark.get("watermark"):
+            watermark_expr = watermark_filter(watermark, self._source_schema())
+
+        if watermark_expr is None:
+            self.logger.debug(
+                "Watermark information missing or unusable - performing full load"
+            )
+            predicate = self._predicate()
+        else:
+            self.logger.debug(f"Applying watermark filter: {watermark_expr}")
+            predicate = self._predicate(watermark_expr)
+
+        async for batch_df in self._track(self._read_files(predicate)):
+            yield batch_df
+
+    async def _read_files(
+        self, predicate: Optional[pl.Expr]
+    ) -> AsyncIterator[pl.DataFrame]:
+        """
+        Read every file at the path, pushing `predicate` into each scan.
+
+        Files are decoded on worker threads (see `read_in_parallel`), so the
+        event loop keeps writing while the next batch is read. With
+        `read_workers` above 1, several files are read at once.
+        """
         try:
             batch_size = self.options.get("batch_size", 50_000)
+            paths = self.selected_files
+            if paths is None:
+                paths = self.get_batch_paths()
+            workers = getattr(self.config, "read_workers", 1)
 
-            for path in self.get_batch_paths():
-                self.logger.debug(f"Reading {self._format} from: {path}")
-                for batch_df in format_read(
-                    path,
-                    self._format,
-                    batch_size=batch_size,
-                    **self._format_options,
-                ):
-                    yield batch_df
+            if workers > 1 and len(paths) > 1:
+                self.logger.debug(
+                    f"Reading {len(paths)} {self._format} files, "
+                    f"{min(workers, len(paths))} at a time"
+                )
+            readers = [
+                partial(self._read_file, path, batch_size, predicate) for path in paths
+            ]
+            async for batch_df in read_in_parallel(
+                readers,
+                workers,
+                ordered=getattr(self.config, "preserve_order", True),
+            ):
+                yield batch_df
 
         except HomeError:
             raise
@@ -92,6 +159,34 @@ class LocalHome(Home, home_type="local"):
                 f"Failed to read {self._format} from {self.data_path}: {str(e)}"
             ) from e
 
+    def _read_file(
+        self, path: Path, batch_size: int, predicate: Optional[pl.Expr]
+    ) -> Iterator[pl.DataFrame]:
+        """Batches of one file, via the format layer."""
+        self.logger.debug(f"Reading {self._format} from: {path}")
+        return format_read(
+            path,
+            self._format,
+            batch_size=batch_size,
+            columns=self._columns,
+            predicate=predicate,
+            **self._format_options,
+        )
+
+    def _predicate(self, *extra: pl.Expr) -> Optional[pl.Expr]:
+        """The configured `filter`, combined with any extra conditions."""
+        return build_predicate(self._filter, *extra)
+
+    def _source_schema(self) -> Optional[pl.Schema]:
+        """Schema of the first parquet/arrow file (from its footer); else None."""
+        scan = {"parquet": pl.scan_parquet, "arrow": pl.scan_ipc, "ipc": pl.scan_ipc}
+        if self._format not in scan:
+            return None
+        try:
+            return scan[self._format](self.get_batch_paths()[0]).collect_schema()
+        except Exception:
+            return None
+
 
 class LocalHomeConfig(HomeConfig, BaseHomeConfig, config_type="local"):
     """Configuration for a LocalHome (path + format + optional format_options)."""
@@ -99,7 +194,7 @@ class LocalHomeConfig(HomeConfig, BaseHomeConfig, config_type="local"):
     path: str = Field(..., description="Path to file or directory")
     format: str = Field(
         default="parquet",
-        description="File format: parquet, csv, or ndjson",
+        description="File format: parquet, csv, ndjson, or arrow (IPC)",
     )
     format_options: Dict[str, Any] = Field(
         default_factory=dict,
@@ -110,6 +205,29 @@ class LocalHomeConfig(HomeConfig, BaseHomeConfig, config_type="local"):
         ge=1,
         description="Number of rows to read per batch",
     )
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Columns to read (default: all); pushed into the scan",
+    )
+    filter: Optional[str] = Field(
+        default=None,
+        description=(
+            "SQL condition rows must meet, e.g. order_date >= DATE '2024-01-01'; "
+            "pushed into the scan"
+        ),
+    )
+    read_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Files to read at once when the path is a directory",
+    )
+    preserve_order: bool = Field(
+        default=True,
+        description=(
+            "With read_workers > 1, yield batches in file order (False: as "
+            "soon as any file has one ready)"
+        ),
+    )
     options: Dict[str, Any] = Field(
         default_factory=dict,
         description="Additional home options",
@@ -122,6 +240,16 @@ class LocalHomeConfig(HomeConfig, BaseHomeConfig, config_type="local"):
             raise ValueError("Path is required for local homes")
         return v
 
+    @field_validator("filter")
+    @classmethod
+    def validate_filter(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            try:
+                build_predicate(v)
+            except Exception as e:
+                raise ValueError(f"Invalid filter {v!r}: {e}") from e
+        return v
+
     @field_validator("format")
     @classmethod
     def validate_format(cls, v: str) -> str:
@@ -132,6 +260,8 @@ class LocalHomeConfig(HomeConfig, BaseHomeConfig, config_type="local"):
     def get_merged_options(self) -> Dict[str, Any]:
         options = {
             "batch_size": self.batch_size,
+            "prefetch": self.prefetch,
+            "prefetch_bytes": self.prefetch_bytes,
         }
         options.update(self.options)
         return options
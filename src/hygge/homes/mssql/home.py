@@ -3,14 +3,36 @@ MS SQL Server home implementation.
 
 Reads data from MS SQL Server databases using connection pooling
 and efficient batching with Polars.
+
+A large table can be read in key ranges over several connections at once
+(`partition_column`), so one entity can use the whole connection pool.
+
+With `reader: arrow_odbc` (on the connection or the home), rows are fetched
+into columnar Arrow buffers by arrow-odbc instead of as pyodbc row objects,
+and the home can feed Arrow batches straight to an Arrow-capable store.
 """
 
 import asyncio
 import re
-from typing import Any, AsyncIterator, Dict, Optional
+from contextlib import aclosing
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 import polars as pl
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 
 from hygge.connections import (
     ConnectionPool,
@@ -28,6 +50,9 @@ from hygge.utility.exceptions import (
     HomeReadError,
 )
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class MssqlHome(Home, home_type="mssql"):
     """
@@ -39,6 +64,8 @@ class MssqlHome(Home, home_type="mssql"):
     - Efficient batching with Polars
     - Support for table names or custom SQL queries
     - Entity support for parameterized queries
+    - Partitioned reads: key ranges streamed over several connections
+    - Optional Arrow-native extraction via arrow-odbc (`reader: arrow_odbc`)
 
     Example:
         ```python
@@ -84,6 +111,30 @@ class MssqlHome(Home, home_type="mssql"):
         # Connection management
         self._connection = None
         self._owned_connection = False  # Track if we created the connection
+        self._factory: Optional[MssqlConnection] = None
+
+        # arrow-odbc produces Arrow batches natively
+        self.supports_arrow = self.reader == "arrow_odbc"
+
+    @property
+    def reader(self) -> str:
+        """Extraction path: the home's `reader`, else its connection's."""
+        if self.config.reader:
+            return self.config.reader
+        factory = getattr(self.pool, "connection_factory", None)
+        return getattr(factory, "reader", MSSQL_CONNECTION_DEFAULTS.reader)
+
+    def _connection_factory(self) -> MssqlConnection:
+        """The pool's connection factory, or one for a dedicated connection."""
+        if self.pool:
+            return self.pool.connection_factory
+        if self._factory is None:
+            self._factory = MssqlConnection(
+                server=self.config.server,
+                database=self.config.database,
+                options=self.config.get_connection_options(),
+            )
+        return self._factory
 
     async def _get_batches(self) -> AsyncIterator[pl.DataFrame]:
         """
@@ -102,6 +153,16 @@ class MssqlHome(Home, home_type="mssql"):
         async for batch in self._stream_query(self._build_query()):
             yield batch
 
+    async def _get_arrow_batches(self) -> AsyncIterator["pa.RecordBatch"]:
+        """
+        Get Arrow record batches from MS SQL Server (arrow_odbc reader).
+
+        Yields:
+            pyarrow RecordBatches as arrow-odbc fetches them
+        """
+        async for batch in self._stream_query(self._build_query(), arrow=True):
+            yield batch
+
     async def read_with_watermark(
         self, watermark: Dict[str, Any]
     ) -> AsyncIterator[pl.DataFrame]:
@@ -146,15 +207,19 @@ class MssqlHome(Home, home_type="mssql"):
         async for batch in self._stream_query(incremental_query):
             yield batch
 
-    async def _stream_query(self, query: str) -> AsyncIterator[pl.DataFrame]:
+    async def _stream_query(
+        self, query: str, arrow: bool = False
+    ) -> AsyncIterator[pl.DataFrame]:
         """
         Execute a query and yield batches using streaming extraction.
 
         Args:
             query: SQL query string to execute.
+            arrow: Yield Arrow record batches (arrow_odbc reader only).
         """
         try:
-            await self._acquire_connection()
+            with self.timings.span("connect"):
+                await self._acquire_connection()
 
             self.logger.debug(f"Executing query: {query[:150]}...")
 
@@ -162,20 +227,33 @@ class MssqlHome(Home, home_type="mssql"):
             batch_num = 0
             total_rows = 0
 
-            self.logger.debug(
-                f"Starting batched extraction with batch_size={batch_size:,}"
-            )
+            predicates = await self._partition_predicates(query)
+            if len(predicates) > 1:
+                # Partitions open their own connections; hand this one back
+                await self._cleanup_connection()
+                async for batch_df in self._stream_partitions(
+                    query, predicates, batch_size, arrow
+                ):
+                    batch_num += 1
+                    yield batch_df
+            else:
+                self.logger.debug(
+                    f"Starting batched extraction with batch_size={batch_size:,}"
+                )
 
-            engine = get_engine("thread_pool")
+                engine = get_engine("thread_pool")
 
-            async for batch_df, batch_rows in engine.execute_streaming(
-                self._extract_batches_sync, query, batch_size
-            ):
-                batch_num += 1
-                total_rows += batch_rows
+                # Closed on exit, so the extraction thread is done with the
+                # connection before it is released
+                async with aclosing(
+                    engine.execute_streaming(self._extractor(arrow), query, batch_size)
+                ) as batches:
+                    async for batch_df, batch_rows in batches:
+                        batch_num += 1
+                        total_rows += batch_rows
 
-                if len(batch_df) > 0:
-                    yield batch_df
+                        if len(batch_df) > 0:
+                            yield batch_df
 
             if batch_num == 0:
                 # This is expected for incremental flows with no new data
@@ -200,21 +278,245 @@ class MssqlHome(Home, home_type="mssql"):
         if self._connection:
             return
 
+        self._connection, self._owned_connection = await self._open_connection()
+
+    async def _open_connection(self) -> Tuple[Any, bool]:
+        """
+        A connection from the pool, or a new dedicated one.
+
+        Returns:
+            (connection, owned): owned connections are closed after use,
+            pooled ones are released back to the pool.
+        """
         if self.pool:
             self.logger.debug(f"Acquiring connection from pool '{self.pool.name}'")
-            self._connection = await self.pool.acquire()
-            self._owned_connection = False
+            return await self.pool.acquire(), False
+
+        self.logger.debug("Creating dedicated connection (no pool)")
+        return await self._connection_factory().get_connection(), True
+
+    async def _partition_predicates(self, query: str) -> List[Optional[str]]:
+        """
+        Range predicates splitting `query` on `partition_column`.
+
+        Bounds are the configured `partition_bounds`, or are discovered on
+        the current connection (MIN/MAX or NTILE over the key). The ranges
+        cover every row exactly once: below the first bound (plus NULL keys),
+        between consecutive bounds, and from the last bound up. A single
+        [None] means no partitioning.
+        """
+        if not self.config.partition_column:
+            return [None]
+
+        # The column goes into SQL as-is; never trust it unchecked
+        column = self._validate_identifier(
+            self.config.partition_column, "partition_column"
+        )
+        if not column:
+            raise HomeError(
+                f"Invalid partition_column: {self.config.partition_column!r}"
+            )
+
+        if self.config.partition_bounds:
+            bounds = list(self.config.partition_bounds)
         else:
-            self.logger.debug("Creating dedicated connection (no pool)")
-            factory = MssqlConnection(
-                server=self.config.server,
-                database=self.config.database,
-                options=self.config.get_connection_options(),
+            with self.timings.span("partition"):
+                bounds = await self._discover_bounds(query, column)
+
+        if not bounds:
+            return [None]
+
+        literals = [self._sql_literal(bound) for bound in bounds]
+        predicates = [f"({column} < {literals[0]} OR {column} IS NULL)"]
+        predicates += [
+            f"{column} >= {low} AND {column} < {high}"
+            for low, high in zip(literals, literals[1:])
+        ]
+        predicates.append(f"{column} >= {literals[-1]}")
+        self.logger.debug(f"Reading {len(predicates)} partitions on {column}")
+        return predicates
+
+    async def _discover_bounds(self, query: str, column: str) -> List[Any]:
+        """Split points for `partitions` ranges, read from the source."""
+        partitions = self.config.partitions
+        source = f"({self._strip_semicolon(query)}) AS hygge_source"
+        engine = get_engine("thread_pool")
+
+        if self.config.partition_discovery == "minmax":
+            rows = await engine.execute(
+                self._fetch_rows_sync,
+                f"SELECT MIN({column}), MAX({column}) FROM {source}",
             )
-            self._connection = await factory.get_connection()
-            self._owned_connection = True
+            low, high = rows[0] if rows else (None, None)
+            if low is None or low == high:
+                return []
+            if isinstance(low, (int, float, Decimal, datetime, date)):
+                step = high - low
+                # Integer keys split on whole values
+                if isinstance(low, int):
+                    bounds = [
+                        low + step * i // partitions for i in range(1, partitions)
+                    ]
+                else:
+                    bounds = [low + step * i / partitions for i in range(1, partitions)]
+                return sorted({bound for bound in bounds if low < bound <= high})
+            self.logger.debug(
+                f"Cannot split {type(low).__name__} key {column} by value; using NTILE"
+            )
+
+        # Equal row counts: the first key of each NTILE bucket after the first
+        rows = await engine.execute(
+            self._fetch_rows_sync,
+            f"SELECT MIN({column}) FROM ("
+            f"SELECT {column}, NTILE({partitions}) OVER (ORDER BY {column}) "
+            f"AS hygge_tile FROM {source} WHERE {column} IS NOT NULL"
+            ") AS hygge_tiles GROUP BY hygge_tile ORDER BY hygge_tile",
+        )
+        bounds: List[Any] = []
+        for (value,) in rows[1:]:
+            if not bounds or value > bounds[-1]:
+                bounds.append(value)
+        return bounds
+
+    async def _stream_partitions(
+        self, query: str, predicates: List[str], batch_size: int, arrow: bool = False
+    ) -> AsyncIterator[pl.DataFrame]:
+        """
+        Stream every partition, several at once, merging their batches.
 
-    def _extract_batches_sync(self, query: str, batch_size: int):
+        Each worker holds one connection and reads partitions off a shared
+        list until none are left, so a slow range never idles the others.
+        Batches arrive in no particular order.
+        """
+        workers = min(
+            len(predicates),
+            self.config.partition_workers
+            or (self.pool.size if self.pool else len(predicates)),
+        )
+        self.logger.debug(
+            f"Streaming {len(predicates)} partitions over {workers} connections"
+        )
+        engine = get_engine("thread_pool")
+        remaining = iter(predicates)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+        done = object()
+        extract = self._extractor(arrow)
+
+        async def worker() -> None:
+            try:
+                with self.timings.span("connect"):
+                    connection, owned = await self._open_connection()
+                try:
+                    for predicate in remaining:
+                        # Closed on exit (even when cancelled), so the
+                        # extraction thread has stopped reading on this
+                        # connection before it is released
+                        async with aclosing(
+                            engine.execute_streaming(
+                                extract,
+                                self._partition_query(query, predicate),
+                                batch_size,
+                                connection,
+                            )
+                        ) as batches:
+                            async for batch_df, _ in batches:
+                                if len(batch_df) > 0:
+                                    await queue.put(batch_df)
+                finally:
+                    await self._release_connection(connection, owned)
+            except Exception as e:
+                await queue.put(e)
+            await queue.put(done)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        try:
+            running = workers
+            while running:
+                item = await queue.get()
+                if item is done:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _partition_query(self, query: str, predicate: str) -> str:
+        """`query` narrowed to one partition's key range."""
+        return (
+            f"SELECT * FROM ({self._strip_semicolon(query)}) AS hygge_source "
+            f"WHERE {predicate}"
+        )
+
+    @staticmethod
+    def _strip_semicolon(query: str) -> str:
+        stripped = query.strip()
+        return stripped[:-1] if stripped.endswith(";") else stripped
+
+    @staticmethod
+    def _sql_literal(value: Any) -> str:
+        """Render a partition bound as a T-SQL literal."""
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, datetime):
+            return f"'{value.isoformat(timespec='milliseconds')}'"
+        if isinstance(value, (date, time)):
+            return f"'{value.isoformat()}'"
+        if isinstance(value, str):
+            escaped = value.replace("'", "''")
+            return f"N'{escaped}'"
+        raise HomeError(
+            f"Unsupported partition bound {value!r} ({type(value).__name__})"
+        )
+
+    def _fetch_rows_sync(self, sql: str) -> List[tuple]:
+        """Run a small query on the current connection and return its rows."""
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(sql)
+            return [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def _extractor(self, arrow: bool = False) -> Callable[..., Iterator[tuple]]:
+        """The sync batch extractor for this home's reader."""
+        if self.reader == "arrow_odbc":
+            return partial(self._extract_arrow_batches_sync, arrow=arrow)
+        return self._extract_batches_sync
+
+    def _extract_arrow_batches_sync(
+        self,
+        query: str,
+        batch_size: int,
+        connection: Any = None,
+        arrow: bool = False,
+    ):
+        """
+        Synchronous generator that yields batches fetched by arrow-odbc.
+
+        arrow-odbc reads on its own ODBC connection, so `connection` (which
+        still holds the pool slot and serves partition discovery) is unused.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Number of rows per batch
+            connection: Unused; accepted for the shared extractor signature
+            arrow: Yield Arrow record batches instead of DataFrames
+
+        Yields:
+            Tuples of (batch, row_count) as batches are extracted
+        """
+        for batch in self._connection_factory().read_arrow_batches(query, batch_size):
+            yield (batch if arrow else pl.from_arrow(batch), batch.num_rows)
+
+    def _extract_batches_sync(
+        self, query: str, batch_size: int, connection: Any = None
+    ):
         """
         Synchronous generator that yields batches from the database.
 
@@ -227,13 +529,14 @@ class MssqlHome(Home, home_type="mssql"):
         Args:
             query: SQL query to execute
             batch_size: Number of rows per batch
+            connection: Connection to read on (default: the home's own)
 
         Yields:
             Tuples of (batch_df, row_count) as batches are extracted
         """
         for batch_df in pl.read_database(
             query,
-            self._connection,
+            connection if connection is not None else self._connection,
             iter_batches=True,
             batch_size=batch_size,
         ):
@@ -325,14 +628,11 @@ class MssqlHome(Home, home_type="mssql"):
 
         candidate = identifier.strip()
         if not candidate:
-            self.logger.warning(f"Empty {field_name} provided for watermark filter")
+            self.logger.warning(f"Empty {field_name} provided")
             return None
 
         if not self._IDENTIFIER_PATTERN.fullmatch(candidate):
-            self.logger.warning(
-                f"Unsafe {field_name} '{identifier}' detected; "
-                "falling back to full data load"
-            )
+            self.logger.warning(f"Unsafe {field_name} '{identifier}' detected")
             return None
 
         return candidate
@@ -362,18 +662,23 @@ class MssqlHome(Home, home_type="mssql"):
             return
 
         try:
-            if self.pool and not self._owned_connection:
+            await self._release_connection(self._connection, self._owned_connection)
+        finally:
+            self._connection = None
+
+    async def _release_connection(self, connection: Any, owned: bool) -> None:
+        """Return a pooled connection, or close a dedicated one."""
+        try:
+            if self.pool and not owned:
                 # Return to pool
                 self.logger.debug(f"Releasing connection to pool '{self.pool.name}'")
-                await self.pool.release(self._connection)
-            elif self._owned_connection:
+                await self.pool.release(connection)
+            elif owned:
                 # Close dedicated connection
                 self.logger.debug("Closing dedicated connection")
-                await asyncio.to_thread(self._connection.close)
+                await asyncio.to_thread(connection.close)
         except Exception as e:
             self.logger.warning(f"Error cleaning up connection: {str(e)}")
-        finally:
-            self._connection = None
 
 
 class MssqlHomeConfig(HomeConfig, BaseHomeConfig, config_type="mssql"):
@@ -444,11 +749,75 @@ class MssqlHomeConfig(HomeConfig, BaseHomeConfig, config_type="mssql"):
         description="Progress logging interval (rows)",
     )
 
+    # Partitioned reads
+    partition_column: Optional[str] = Field(
+        None,
+        description="Key column to split the read on (enables partitioned reads)",
+    )
+    partitions: int = Field(
+        default=8,
+        ge=2,
+        description="Number of key ranges to discover (without partition_bounds)",
+    )
+    partition_bounds: Optional[List[Any]] = Field(
+        None,
+        description="Explicit ascending split points instead of discovery",
+    )
+    partition_discovery: Literal["minmax", "ntile"] = Field(
+        default="minmax",
+        description=(
+            "minmax: equal-width ranges between MIN and MAX (cheap); "
+            "ntile: equal row counts (sorts the key)"
+        ),
+    )
+    partition_workers: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Partitions read at once (default: the pool size)",
+    )
+
+    # Extraction
+    reader: Optional[Literal["pyodbc", "arrow_odbc"]] = Field(
+        None,
+        description=(
+            "pyodbc: rows via pyodbc; arrow_odbc: columnar Arrow batches "
+            "via arrow-odbc (default: the connection's reader)"
+        ),
+    )
+    authentication: Optional[str] = Field(
+        None,
+        description="ODBC Authentication keyword for the arrow_odbc reader",
+    )
+    max_text_size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Cap for (MAX) text columns with the arrow_odbc reader",
+    )
+
     # Additional options
     options: Dict[str, Any] = Field(
         default_factory=dict, description="Additional MSSQL-specific options"
     )
 
+    @field_validator("partition_column")
+    @classmethod
+    def validate_partition_column(cls, v):
+        """Validate the partition column is a plain identifier."""
+        if v is not None and not MssqlHome._IDENTIFIER_PATTERN.fullmatch(v.strip()):
+            raise ValueError(f"Invalid partition_column: {v!r}")
+        return v.strip() if v else v
+
+    @field_validator("partition_bounds")
+    @classmethod
+    def validate_partition_bounds(cls, v):
+        """Validate explicit bounds are present and ascending."""
+        if v is not None:
+            if not v:
+                raise ValueError("partition_bounds must not be empty")
+            if any(later <= earlier for earlier, later in zip(v, v[1:])):
+                raise ValueError("partition_bounds must be strictly ascending")
+        return v
+
     @model_validator(mode="after")
     def validate_connection_params(self):
         """Validate that either connection name OR server/database is provided."""
@@ -469,6 +838,13 @@ class MssqlHomeConfig(HomeConfig, BaseHomeConfig, config_type="mssql"):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_partition_params(self):
+        """Validate partition settings are given with a partition column."""
+        if self.partition_bounds and not self.partition_column:
+            raise ValueError("partition_bounds requires partition_column")
+        return self
+
     @model_validator(mode="after")
     def validate_query_params(self):
         """Validate that either table OR query is provided."""
@@ -481,6 +857,8 @@ class MssqlHomeConfig(HomeConfig, BaseHomeConfig, config_type="mssql"):
         """Get all options including defaults."""
         options = {
             "batch_size": self.batch_size,
+            "prefetch": self.prefetch,
+            "prefetch_bytes": self.prefetch_bytes,
         }
         options.update(self.options)
         return options
@@ -492,4 +870,7 @@ class MssqlHomeConfig(HomeConfig, BaseHomeConfig, config_type="mssql"):
             "encrypt": self.encrypt,
             "trust_cert": self.trust_cert,
             "timeout": self.timeout,
+            "reader": self.reader or MSSQL_CONNECTION_DEFAULTS.reader,
+            "authentication": self.authentication,
+            "max_text_size": self.max_text_size,
         }
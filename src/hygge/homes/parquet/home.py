@@ -2,13 +2,17 @@
 Parquet file home implementation.
 """
 
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import polars as pl
 from pydantic import Field, field_validator
 
+from hygge.core.formats import build_predicate, stream_batches
 from hygge.core.home import BaseHomeConfig, Home, HomeConfig
+from hygge.core.parallel_read import read_in_parallel
+from hygge.core.watermark import watermark_filter
 from hygge.utility.exceptions import HomeError, HomeReadError
 from hygge.utility.path_helper import PathHelper
 
@@ -32,6 +36,8 @@ class ParquetHome(Home, home_type="parquet"):
         ```
     """
 
+    reads_files = True
+
     def __init__(
         self, name: str, config: "ParquetHomeConfig", entity_name: Optional[str] = None
     ):
@@ -93,38 +99,103 @@ class ParquetHome(Home, home_type="parquet"):
         - Partitioned parquet datasets
         - Directories containing multiple parquet files
 
-        Relies on Polars' scan_parquet() to handle path detection.
+        Relies on Polars' scan_parquet() to handle path detection. A
+        directory is one multi-file scan, which already reads ahead across
+        files and decodes row groups on Polars' thread pool. With
+        `read_workers` above 1, each file is scanned on its own instead and
+        up to that many are read at once (see `read_in_parallel`).
+        """
+        async for batch_df in self._scan(build_predicate(self.config.filter)):
+            yield batch_df
+
+    async def read_with_watermark(
+        self, watermark: Dict[str, Any]
+    ) -> AsyncIterator[pl.DataFrame]:
+        """
+        Read only rows past the journal watermark.
+
+        The watermark is pushed into the scan as a predicate, so row groups
+        whose statistics are all at or below it are skipped without decoding.
+
+        Args:
+            watermark: Watermark information retrieved from the journal.
+                Expected keys: watermark, watermark_type, watermark_column
         """
+        watermark_expr = None
+        if watermark and watermark.get("watermark"):
+            try:
+                schema = pl.scan_parquet(self.data_path).collect_schema()
+            except Exception:
+                schema = None
+            watermark_expr = watermark_filter(watermark, schema)
+
+        if watermark_expr is None:
+            self.logger.debug(
+                "Watermark information missing or unusable - performing full load"
+            )
+            predicate = build_predicate(self.config.filter)
+        else:
+            self.logger.debug(f"Applying watermark filter: {watermark_expr}")
+            predicate = build_predicate(self.config.filter, watermark_expr)
+
+        async for batch_df in self._track(self._scan(predicate)):
+            yield batch_df
+
+    async def _scan(self, predicate: Optional[pl.Expr]) -> AsyncIterator[pl.DataFrame]:
+        """Stream the path, with `columns` and `predicate` pushed into the scan."""
         try:
             batch_size = self.options.get("batch_size", 10_000)
+            workers = self.config.read_workers
 
             # Let Polars handle path detection - it's smarter than us!
             # Polars can handle: files, directories, datasets, partitions
             self.logger.debug(f"Reading parquet from: {self.data_path}")
 
-            # Polars' scan_parquet handles both files and directories
-            lf = pl.scan_parquet(self.data_path)
-
-            # Get total rows to determine number of batches
-            total_rows = lf.select(pl.len()).collect().item()
-
-            if total_rows == 0:
-                self.logger.warning(f"No data found in {self.data_path}")
+            paths = self.selected_files
+            if paths is None and workers > 1 and self.data_path.is_dir():
+                paths = self.get_batch_paths()
+
+            # Polars' scan_parquet handles both files and directories.
+            # stream_batches streams each scan once, batch_size rows at a
+            # time, on a worker thread so the event loop is free while it
+            # decodes
+            if paths is None:
+                scans = [pl.scan_parquet(self.data_path)]
+            elif not paths:
+                self.logger.debug(f"No new files to read in {self.data_path}")
                 return
-
-            # Calculate number of batches needed
-            num_batches = (total_rows + batch_size - 1) // batch_size
-            self.logger.debug(f"{total_rows:,} rows, running {num_batches} batches")
-
-            # Yield data in batches
-            for batch_idx in range(num_batches):
-                offset = batch_idx * batch_size
-                batch_df = lf.slice(offset, batch_size).collect(engine="streaming")
-
+            elif workers > 1 and len(paths) > 1:
+                self.logger.debug(
+                    f"Reading {len(paths)} parquet files, "
+                    f"{min(workers, len(paths))} at a time"
+                )
+                scans = self._file_scans(paths)
+            else:
+                # Same partition columns as a scan of the whole directory
+                scans = [
+                    pl.scan_parquet(paths, hive_partitioning=self.data_path.is_dir())
+                ]
+
+            readers = []
+            for lf in scans:
+                if predicate is not None:
+                    lf = lf.filter(predicate)
+                if self.config.columns:
+                    lf = lf.select(self.config.columns)
+                readers.append(partial(stream_batches, lf, batch_size))
+
+            batch_count = 0
+            async for batch_df in read_in_parallel(
+                readers, workers, ordered=self.config.preserve_order
+            ):
                 if len(batch_df) > 0:
-                    self.logger.debug(f"Yielding batch {batch_idx + 1})")
+                    batch_count += 1
+                    self.logger.debug(f"Yielding batch {batch_count}")
                     yield batch_df
 
+            if batch_count == 0:
+                self.logger.warning(f"No data found in {self.data_path}")
+
         except HomeError:
             # Other home errors - preserve and re-raise
             raise
@@ -135,6 +206,21 @@ class ParquetHome(Home, home_type="parquet"):
                 f"Failed to read parquet from {self.data_path}: {str(e)}"
             ) from e
 
+    def _file_scans(self, paths: List[Path]) -> List[pl.LazyFrame]:
+        """
+        One scan per file, each shaped like a scan of all of them.
+
+        Partition columns come from each file's own path, so they are cast
+        to the types the combined scan infers and columns kept in its order.
+        """
+        hive = self.data_path.is_dir()
+        schema = pl.scan_parquet(paths, hive_partitioning=hive).collect_schema()
+        shape = [pl.col(name).cast(dtype) for name, dtype in schema.items()]
+        return [
+            pl.scan_parquet(path, hive_partitioning=hive).select(shape)
+            for path in paths
+        ]
+
 
 class ParquetHomeConfig(HomeConfig, BaseHomeConfig, config_type="parquet"):
     """Configuration for a ParquetHome."""
@@ -143,6 +229,32 @@ class ParquetHomeConfig(HomeConfig, BaseHomeConfig, config_type="parquet"):
     batch_size: int = Field(
         default=10_000, ge=1, description="Number of rows to read at once"
     )
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Columns to read (default: all); pushed into the scan",
+    )
+    filter: Optional[str] = Field(
+        default=None,
+        description=(
+            "SQL condition rows must meet, e.g. order_date >= DATE '2024-01-01'; "
+            "pushed into the scan"
+        ),
+    )
+    read_workers: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Files to read at once when the path is a directory (default 1: "
+            "one multi-file scan)"
+        ),
+    )
+    preserve_order: bool = Field(
+        default=True,
+        description=(
+            "With read_workers > 1, yield batches in file order (False: as "
+            "soon as any file has one ready)"
+        ),
+    )
     options: Dict[str, Any] = Field(
         default_factory=dict, description="Additional parquet home options"
     )
@@ -155,11 +267,24 @@ class ParquetHomeConfig(HomeConfig, BaseHomeConfig, config_type="parquet"):
             raise ValueError("Path is required for parquet homes")
         return v
 
+    @field_validator("filter")
+    @classmethod
+    def validate_filter(cls, v):
+        """Validate the filter parses as a SQL condition."""
+        if v is not None:
+            try:
+                build_predicate(v)
+            except Exception as e:
+                raise ValueError(f"Invalid filter {v!r}: {e}") from e
+        return v
+
     def get_merged_options(self) -> Dict[str, Any]:
         """Get all options including defaults."""
         # Start with the config fields
         options = {
             "batch_size": self.batch_size,
+            "prefetch": self.prefetch,
+            "prefetch_bytes": self.prefetch_bytes,
         }
         # Add any additional options
         options.update(self.options)
@@ -45,6 +45,8 @@ class Summary:
                 - rows: Number of rows processed
                 - duration: Duration in seconds
                 - error: Optional error message (for failures)
+                - timings: Optional per-stage totals
+                  ({stage: {"seconds": float, "count": int}})
             start_time: Optional start time for calculating elapsed time
                         (default: uses current event loop time, which may be incorrect)
         """
@@ -114,6 +116,7 @@ class Summary:
         self._log_success_header(passed, skipped)
         self._log_success_stats(passed, skipped, total_rows, elapsed_time, time_str)
         self._log_settled_flows(flow_results)
+        self._log_stage_timings(flow_results)
 
     def _log_success_header(self, passed: int, skipped: int) -> None:
         """Log celebratory header."""
@@ -175,6 +178,31 @@ class Summary:
             rows_info = f"({rows:,} rows)" if rows > 0 else ""
             self.logger.info(f"   ✓ {flow_result['name']} {rows_info}")
 
+    def _log_stage_timings(
+        self, flow_results: List[Dict[str, Any]], limit: int = 10, stages: int = 3
+    ) -> None:
+        """Log the busiest stages for each flow (slowest flows first)."""
+        timed_flows = [r for r in flow_results if r.get("timings")]
+        if not timed_flows:
+            return
+
+        timed_flows.sort(key=lambda r: r.get("duration", 0.0), reverse=True)
+        self.logger.info("")
+        if len(timed_flows) > limit:
+            self.logger.info(f"⏱️  Where the time went (slowest {limit} flows):")
+        else:
+            self.logger.info("⏱️  Where the time went:")
+        for flow_result in timed_flows[:limit]:
+            busiest = sorted(
+                flow_result["timings"].items(),
+                key=lambda item: item[1]["seconds"],
+                reverse=True,
+            )[:stages]
+            breakdown = " · ".join(
+                f"{stage} {totals['seconds']:.1f}s" for stage, totals in busiest
+            )
+            self.logger.info(f"   • {flow_result['name']}: {breakdown}")
+
     def _generate_error_summary(
         self,
         flow_results: List[Dict[str, Any]],
@@ -189,6 +217,7 @@ class Summary:
         self.logger.error("⚠️  Some flows need attention")
         self._log_error_stats(passed, failed, skipped, total_rows, time_str)
         self._log_failed_flows(flow_results)
+        self._log_stage_timings(flow_results)
         self._log_next_steps()
 
     def _log_error_stats(
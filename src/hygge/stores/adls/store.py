@@ -5,7 +5,6 @@ Generic ADLS Gen2 store that works with any Azure Data Lake Storage account.
 For Fabric OneLake-specific path conventions, see OneLakeStore which extends this.
 """
 
-import io
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -20,6 +19,8 @@ from azure.identity import (
 from azure.storage.filedatalake import DataLakeServiceClient
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from hygge.connections.execution import CpuEngine
+from hygge.core.formats import encode
 from hygge.core.polish import PolishConfig, Polisher
 from hygge.core.store import Store, StoreConfig
 from hygge.utility.azure_onelake import ADLSOperations
@@ -192,6 +193,9 @@ class ADLSStore(Store, store_type="adls"):
         ```
     """
 
+    # encode() takes Arrow tables as well as DataFrames
+    accepts_arrow = True
+
     def __init__(
         self,
         name: str,
@@ -481,13 +485,15 @@ class ADLSStore(Store, store_type="adls"):
             # Get ADLS Gen2 operations client
             adls_ops = self._get_adls_ops()
 
-            # Write to memory buffer
-            buffer = io.BytesIO()
-            df.write_parquet(buffer, compression=self.compression)
-            data = buffer.getvalue()
+            # Encode off the event loop so other flows keep moving
+            with self.timings.span("encode"):
+                data = await CpuEngine.execute(
+                    encode, df, "parquet", compression=self.compression
+                )
 
             # Upload to cloud staging location
-            await adls_ops.upload_bytes(data, cloud_staging_path)
+            with self.timings.span("upload"):
+                await adls_ops.upload_bytes(data, cloud_staging_path)
 
             # Log write progress using base class method with cloud path context
             self._log_write_progress(len(df), path=cloud_staging_path)
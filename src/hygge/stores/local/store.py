@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 import polars as pl
 from pydantic import Field, field_validator
 
+from hygge.connections.execution import CpuEngine
 from hygge.core.formats import (
     VALID_FORMATS,
     default_file_pattern,
@@ -24,12 +25,15 @@ from hygge.utility.path_helper import PathHelper
 
 class LocalStore(Store, store_type="local"):
     """
-    A local file store that writes by format (parquet, csv, ndjson).
+    A local file store that writes by format (parquet, csv, ndjson, arrow).
 
     Delegates actual I/O to the format layer. Staging + move-to-final same as
     ParquetStore. File pattern and extension are format-aware.
     """
 
+    # The format layer writes Arrow tables as well as DataFrames
+    accepts_arrow = True
+
     def __init__(
         self,
         name: str,
@@ -112,12 +116,14 @@ class LocalStore(Store, store_type="local"):
                 return
             staging_path = Path(staging_path)
             staging_path.parent.mkdir(parents=True, exist_ok=True)
-            format_write(
-                df,
-                staging_path,
-                self._format,
-                **self._format_options,
-            )
+            with self.timings.span("encode"):
+                await CpuEngine.execute(
+                    format_write,
+                    df,
+                    staging_path,
+                    self._format,
+                    **self._format_options,
+                )
             if not staging_path.exists():
                 raise StoreError(f"File was not created after write: {staging_path}")
             self._log_write_progress(len(df), path=str(staging_path))
@@ -180,7 +186,7 @@ class LocalStoreConfig(StoreConfig, BaseStoreConfig, config_type="local"):
     path: str = Field(..., description="Path to destination directory")
     format: str = Field(
         default="parquet",
-        description="File format: parquet, csv, or ndjson",
+        description="File format: parquet, csv, ndjson, or arrow (IPC)",
     )
     format_options: Dict[str, Any] = Field(
         default_factory=dict,
@@ -3,13 +3,28 @@ MS SQL Server store implementation.
 
 Writes data to MS SQL Server databases using connection pooling,
 parallel batch writes, and efficient bulk loading patterns.
+
+Batches are cut into chunks and queued for a fixed set of writer workers,
+each holding one pooled connection for the whole run, so a slow chunk never
+stalls the next batch.
+
+On close, the temp table replaces, is appended to, or (`if_exists: merge`)
+is upserted into the production table by `key_columns`, one key range per
+transaction. Appends into a partitioned columnstore table can switch whole
+partitions in (`append_method: switch`), a metadata-only operation.
+
+Rows reach the temp table through pyodbc's fast_executemany by default.
+With `load_method: arrow_odbc`, columns are bound straight from Arrow
+buffers instead, skipping the Python tuple built per row.
 """
 
 import asyncio
+import math
 import re
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
 import polars as pl
+import pyodbc
 from pydantic import BaseModel, Field, model_validator
 
 from hygge.connections import ConnectionPool
@@ -24,6 +39,43 @@ from hygge.utility.exceptions import (
     StoreWriteError,
 )
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Tells a writer worker to commit and stop
+_STOP = object()
+
+# ODBC parameter types for the SQL types `_map_polars_type_to_sql` produces
+_ODBC_TYPES = {
+    "NVARCHAR": pyodbc.SQL_WVARCHAR,
+    "TINYINT": pyodbc.SQL_TINYINT,
+    "SMALLINT": pyodbc.SQL_SMALLINT,
+    "INT": pyodbc.SQL_INTEGER,
+    "BIGINT": pyodbc.SQL_BIGINT,
+    "REAL": pyodbc.SQL_REAL,
+    "FLOAT": pyodbc.SQL_DOUBLE,
+    "DECIMAL": pyodbc.SQL_DECIMAL,
+    "DATE": pyodbc.SQL_TYPE_DATE,
+    "DATETIME2": pyodbc.SQL_TYPE_TIMESTAMP,
+    "TIME": pyodbc.SQL_SS_TIME2,
+    "BIT": pyodbc.SQL_BIT,
+    "VARBINARY": pyodbc.SQL_VARBINARY,
+}
+
+# (column size, decimal digits) for types without a length in their name
+_ODBC_SIZES = {
+    "TINYINT": (3, 0),
+    "SMALLINT": (5, 0),
+    "INT": (10, 0),
+    "BIGINT": (19, 0),
+    "REAL": (24, 0),
+    "FLOAT": (53, 0),
+    "BIT": (1, 0),
+    "DATE": (10, 0),
+    "DATETIME2": (27, 7),
+    "TIME": (16, 7),
+}
+
 
 class MssqlStore(Store, store_type="mssql"):
     """
@@ -51,6 +103,9 @@ class MssqlStore(Store, store_type="mssql"):
         ```
     """
 
+    # _save() queues chunks for the writer workers; they time the inserts
+    saves_in_background = True
+
     def __init__(
         self,
         name: str,
@@ -83,6 +138,7 @@ class MssqlStore(Store, store_type="mssql"):
         # Performance settings
         self.parallel_workers = merged_options.get("parallel_workers", 8)
         self.table_hints = merged_options.get("table_hints")
+        self.load_method = config.load_method
 
         # Write strategy (extensible for future temp_swap, merge, etc.)
         self.write_strategy = config.write_strategy
@@ -93,6 +149,14 @@ class MssqlStore(Store, store_type="mssql"):
 
         # Auto-create table support
         self.if_exists = config.if_exists
+        self.key_columns = config.key_columns or []
+        self.merge_batch_rows = config.merge_batch_rows
+        self.append_method = config.append_method
+        self.append_hints = config.append_hints
+
+        # Index for tables this store creates
+        self.table_index = config.table_index
+        self.clustered_index = config.clustered_index or []
         self._table_checked = False
         self._table_created = False
 
@@ -100,6 +164,21 @@ class MssqlStore(Store, store_type="mssql"):
         self.temp_table = f"{self.table}_hygge_tmp"
         self._temp_table_created = False
 
+        # Columns written to the temp table, in order (merge updates only these)
+        self._columns_written: Dict[str, None] = {}
+
+        # Writer workers pull chunks from a bounded queue across batches
+        self.commit_rows = config.commit_rows
+        self._chunks: Optional[asyncio.Queue] = None
+        self._writers: List[asyncio.Task] = []
+        self._writer_count = 0
+        self._writer_error: Optional[BaseException] = None
+
+        # INSERT statement and parameter bindings per batch schema
+        self._insert_plans: Dict[tuple, Tuple[str, List[Any]]] = {}
+        # Declared sizes of the temp table's columns, read once it exists
+        self._temp_columns: Dict[str, Dict[str, Optional[int]]] = {}
+
     def set_pool(self, pool: ConnectionPool) -> None:
         """
         Set the connection pool for this store.
@@ -175,23 +254,22 @@ class MssqlStore(Store, store_type="mssql"):
         # Ensure temp table exists (check once on first write)
         await self._ensure_temp_table_exists(df)
 
-        # Split DataFrame into chunks for parallel writing
-        chunk_size = max(1, len(df) // self.parallel_workers)
-        chunks = []
+        # Surface a failed chunk from an earlier batch before queueing more
+        self._raise_writer_error()
+        self._start_writers()
+        self._columns_written.update(dict.fromkeys(df.columns))
+
+        # Split DataFrame into one chunk per writer
+        chunk_size = max(1, len(df) // self._writer_count)
+        chunks = 0
 
+        # Queue the chunks; waits only while the writers are a queue behind
+        start_time = asyncio.get_event_loop().time()
         for i in range(0, len(df), chunk_size):
             chunk = df.slice(i, min(chunk_size, len(df) - i))
             if len(chunk) > 0:
-                chunks.append(chunk)
-
-        self.logger.debug(
-            f"Writing {len(df):,} rows to temp table in {len(chunks)} parallel chunks "
-            f"(~{chunk_size:,} rows each)"
-        )
-
-        # Write chunks in parallel using asyncio.gather
-        start_time = asyncio.get_event_loop().time()
-        await asyncio.gather(*[self._write_chunk_to_temp(chunk) for chunk in chunks])
+                await self._chunks.put(chunk)
+                chunks += 1
         elapsed = asyncio.get_event_loop().time() - start_time
 
         # Track statistics
@@ -203,31 +281,196 @@ class MssqlStore(Store, store_type="mssql"):
         self._log_write_progress(len(df), path=table_path)
 
         # Detailed batch info at DEBUG level
-        rows_per_sec = len(df) / elapsed if elapsed > 0 else 0
         self.logger.debug(
-            f"Wrote batch {self.batches_written}: {len(df):,} rows to temp table "
-            f"in {elapsed:.2f}s ({rows_per_sec:,.0f} rows/sec)"
+            f"Queued batch {self.batches_written}: {len(df):,} rows in {chunks} "
+            f"chunks (~{chunk_size:,} rows each, waited {elapsed:.2f}s)"
         )
 
-    async def _write_chunk_to_temp(self, df_chunk: pl.DataFrame) -> None:
+    def _start_writers(self) -> None:
+        """Start the writer workers on the first batch."""
+        if self._writers:
+            return
+
+        # More writers than pooled connections would only wait for one
+        workers = self.parallel_workers
+        pool_size = getattr(self.pool, "pool_size", None)
+        if isinstance(pool_size, int):
+            workers = max(1, min(workers, pool_size))
+        self._writer_count = workers
+        self._chunks = asyncio.Queue(maxsize=2 * workers)
+        self._writers = [
+            asyncio.create_task(self._writer(), name=f"{self.name}_writer_{i}")
+            for i in range(workers)
+        ]
+        self.logger.debug(f"Started {workers} writers for {self.temp_table}")
+
+    async def _writer(self) -> None:
+        """
+        Write queued chunks on one pooled connection until told to stop.
+
+        Commits every `commit_rows` rows (every chunk by default) and once
+        more at the end. After any writer fails, the rest keep draining the
+        queue without writing, so producers never block on a dead store;
+        the error is raised on the next batch or in finish().
+
+        Inserts and commits are timed as `insert` and `commit` spans; the
+        store's `save` span only covers queueing.
+
+        The connection goes back to the pool only with nothing left
+        uncommitted. After an error or cancellation it is rolled back and
+        discarded instead, once no thread is still using it.
+
+        With `load_method: arrow_odbc` the writer also opens one arrow-odbc
+        connection on its first chunk and loads every chunk through it, so
+        the ODBC (and Azure AD) login happens once per writer, not per chunk.
+        """
+        connection = None
+        arrow_connection = None
+        uncommitted = 0
+        failed = False
+        reusable = False
+        try:
+            while (chunk := await self._chunks.get()) is not _STOP:
+                if self._writer_error is not None:
+                    continue
+                try:
+                    if connection is None:
+                        connection = await self.pool.acquire()
+                    if arrow_connection is None and self.load_method == "arrow_odbc":
+                        arrow_connection = await self._connect_arrow()
+                    with self.timings.span("insert"):
+                        await self._write_chunk_to_temp(
+                            chunk, connection, arrow_connection
+                        )
+                    uncommitted += len(chunk)
+                    if uncommitted >= (self.commit_rows or 1):
+                        with self.timings.span("commit"):
+                            await self._run_blocking(connection.commit)
+                        uncommitted = 0
+                except Exception as e:
+                    self._writer_error = self._writer_error or e
+                    failed = True
+
+            if uncommitted and self._writer_error is None:
+                with self.timings.span("commit"):
+                    await self._run_blocking(connection.commit)
+                uncommitted = 0
+            reusable = not failed and uncommitted == 0
+        finally:
+            # arrow-odbc disconnects when its connection is dropped
+            arrow_connection = None
+            if connection is not None:
+                if reusable:
+                    await self.pool.release(connection)
+                else:
+                    await self._discard_connection(connection)
+
+    async def _connect_arrow(self) -> Any:
+        """Open a writer's arrow-odbc connection (one login per writer)."""
+        try:
+            return await self._run_blocking(self.pool.connection_factory.connect_arrow)
+        except StoreError:
+            raise
+        except Exception as e:
+            raise StoreConnectionError(
+                f"Failed to open arrow-odbc connection: {str(e)}"
+            ) from e
+
+    async def _discard_connection(self, connection: Any) -> None:
+        """Roll back a writer's connection and drop it from the pool."""
+        try:
+            await asyncio.to_thread(connection.rollback)
+        except Exception:
+            pass  # Discarded either way
+        await self.pool.discard(connection)
+
+    @staticmethod
+    async def _run_blocking(func: Any, *args: Any) -> Any:
+        """
+        Run blocking pyodbc work in a thread.
+
+        Cancelling the caller does not stop the thread, so on cancellation
+        this waits for the thread to finish before re-raising. The caller's
+        cleanup then never touches a connection a thread is still using.
+        """
+        work = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        try:
+            return await asyncio.shield(work)
+        except asyncio.CancelledError:
+            await asyncio.wait({work})
+            raise
+
+    def _raise_writer_error(self) -> None:
+        """Raise the first error any writer hit."""
+        if self._writer_error is not None:
+            raise self._writer_error
+
+    async def _stop_writers(self) -> None:
+        """Let the writers finish the queue and commit, then raise any error."""
+        if self._writers:
+            for _ in self._writers:
+                await self._chunks.put(_STOP)
+            try:
+                await asyncio.gather(*self._writers)
+            finally:
+                self._writers = []
+                self._chunks = None
+        self._raise_writer_error()
+
+    async def _drain_writes(self) -> None:
+        """Wait for background saves, then for the writers to commit."""
+        await super()._drain_writes()
+        await self._stop_writers()
+
+    async def _cancel_writes(self) -> None:
+        """Cancel background saves and the writers (e.g. before a retry)."""
+        await super()._cancel_writes()
+        for task in self._writers:
+            task.cancel()
+        await asyncio.gather(*self._writers, return_exceptions=True)
+        self._writers = []
+        self._chunks = None
+        self._writer_error = None
+
+    async def _write_chunk_to_temp(
+        self,
+        df_chunk: pl.DataFrame,
+        connection: Any = None,
+        arrow_connection: Any = None,
+    ) -> None:
         """
         Write a single DataFrame chunk to temp table using a pooled connection.
 
-        Acquires connection from pool, writes data to temp table, releases connection.
+        Without `connection`, acquires one from the pool, writes and commits
+        the chunk, and releases it. Writer workers pass the connection they
+        hold and commit on their own schedule.
 
         Args:
             df_chunk: Polars DataFrame chunk to write
+            connection: Connection held by the caller (left uncommitted)
+            arrow_connection: arrow-odbc connection held by the caller for
+                `load_method: arrow_odbc`; without one, the insert opens its own
 
         Raises:
             StoreError: If write fails
         """
-        connection = None
+        owned = connection is None
         try:
             # Acquire connection from pool
-            connection = await self.pool.acquire()
+            if owned:
+                connection = await self.pool.acquire()
 
             # Offload synchronous pyodbc operations to thread pool
-            await asyncio.to_thread(self._insert_batch_to_temp, connection, df_chunk)
+            if self.load_method == "arrow_odbc":
+                # arrow-odbc loads (and commits) on its own connection; the
+                # pooled one keeps concurrent loads within the pool size
+                await self._run_blocking(
+                    self._insert_arrow_to_temp, df_chunk, arrow_connection
+                )
+            else:
+                await self._run_blocking(
+                    self._insert_batch_to_temp, connection, df_chunk, owned
+                )
 
         except StoreConnectionError:
             # Connection errors - preserve and re-raise
@@ -243,11 +486,13 @@ class MssqlStore(Store, store_type="mssql"):
             ) from e
 
         finally:
-            # Always release connection back to pool
-            if connection:
+            # Release a connection acquired here back to pool
+            if owned and connection:
                 await self.pool.release(connection)
 
-    def _insert_batch_to_temp(self, connection, df: pl.DataFrame) -> None:
+    def _insert_batch_to_temp(
+        self, connection, df: pl.DataFrame, commit: bool = True
+    ) -> None:
         """
         Blocking INSERT operation to temp table using fast_executemany.
 
@@ -256,33 +501,26 @@ class MssqlStore(Store, store_type="mssql"):
         Args:
             connection: pyodbc connection from pool
             df: Polars DataFrame to insert
+            commit: Commit after the insert (writers commit in intervals)
 
         Raises:
             Exception: If INSERT fails
         """
+        sql, input_sizes = self._insert_plan(df.schema)
         cursor = connection.cursor()
         cursor.fast_executemany = True
 
         try:
-            # Build INSERT statement for temp table
-            columns = df.columns
-            placeholders = ",".join(["?"] * len(columns))
-            column_list = ",".join([f"[{col}]" for col in columns])
-
-            # Build SQL: INSERT INTO temp_table WITH (hints) (columns) VALUES (?)
-            # Quote table name to prevent SQL injection
-            safe_temp_table = self._quote_table_name(self.temp_table)
-            sql = f"INSERT INTO {safe_temp_table}"
-            if self.table_hints:
-                sql += f" WITH ({self.table_hints})"
-            sql += f" ({column_list}) VALUES ({placeholders})"
+            # Bind parameter types up front instead of guessing from values
+            cursor.setinputsizes(input_sizes)
 
             # Convert DataFrame to list of tuples for executemany
             values = [tuple(row) for row in df.iter_rows()]
 
             # Execute batch insert
             cursor.executemany(sql, values)
-            connection.commit()
+            if commit:
+                connection.commit()
 
         except Exception:
             connection.rollback()
@@ -291,6 +529,117 @@ class MssqlStore(Store, store_type="mssql"):
         finally:
             cursor.close()
 
+    def _insert_plan(self, schema: pl.Schema) -> Tuple[str, List[Any]]:
+        """
+        INSERT statement and `setinputsizes` bindings for a batch schema.
+
+        Built once per schema and reused by every chunk. Bindings follow
+        the column types hygge creates tables with, sized to the temp
+        table's declared columns where known, so pyodbc neither guesses
+        types from the first row nor widens strings to MAX.
+
+        Args:
+            schema: Polars schema of the chunks to insert
+
+        Returns:
+            (sql, input_sizes)
+        """
+        key = tuple(schema.items())
+        plan = self._insert_plans.get(key)
+        if plan is None:
+            placeholders = ",".join(["?"] * len(schema))
+            column_list = ",".join([f"[{col}]" for col in schema])
+
+            # Build SQL: INSERT INTO temp_table WITH (hints) (columns) VALUES (?)
+            # Quote table name to prevent SQL injection
+            sql = f"INSERT INTO {self._quote_table_name(self.temp_table)}"
+            if self.table_hints:
+                sql += f" WITH ({self.table_hints})"
+            sql += f" ({column_list}) VALUES ({placeholders})"
+
+            input_sizes = [
+                self._input_size(dtype, self._temp_columns.get(col))
+                for col, dtype in schema.items()
+            ]
+            plan = self._insert_plans[key] = (sql, input_sizes)
+        return plan
+
+    def _input_size(
+        self,
+        polars_type: pl.DataType,
+        column: Optional[Dict[str, Optional[int]]] = None,
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        pyodbc binding (type, column size, decimal digits) for a Polars type.
+
+        With `column` (the target column's declared sizes), strings and
+        binary take the column's length and decimals its precision and
+        scale, so NVARCHAR(MAX) or DECIMAL(38, 18) columns of a table hygge
+        did not create are neither truncated nor rounded.
+
+        None leaves the parameter for pyodbc to describe, e.g. for Duration
+        values, which have no SQL Server counterpart.
+        """
+        if polars_type == pl.Duration:
+            return None
+
+        sql_type = self._map_polars_type_to_sql(polars_type)
+        name, _, args = sql_type.partition("(")
+        odbc_type = _ODBC_TYPES.get(name)
+        if odbc_type is None:
+            return None
+        if name in _ODBC_SIZES:
+            return (odbc_type, *_ODBC_SIZES[name])
+
+        sizes = [arg.strip() for arg in args.rstrip(")").split(",")] if args else []
+        # Size 0 binds (MAX) types
+        size = int(sizes[0]) if sizes and sizes[0] != "MAX" else 0
+        digits = int(sizes[1]) if len(sizes) > 1 else 0
+
+        if column:
+            if name in ("NVARCHAR", "VARBINARY") and column["length"] is not None:
+                # -1 is how SQL Server reports (MAX)
+                size = max(column["length"], 0)
+            elif name == "DECIMAL" and column["scale"] is not None:
+                # Exact numerics only (FLOAT reports a precision but no scale)
+                size, digits = column["precision"], column["scale"]
+        return (odbc_type, size, digits)
+
+    def _insert_arrow_to_temp(
+        self, df: pl.DataFrame, arrow_connection: Any = None
+    ) -> None:
+        """
+        Blocking columnar INSERT to temp table via arrow-odbc.
+
+        This runs in a thread pool via asyncio.to_thread(). Table hints do
+        not apply: arrow-odbc writes its own INSERT statement.
+
+        Args:
+            df: Polars DataFrame to insert
+            arrow_connection: Connection from connect_arrow(), if held
+
+        Raises:
+            Exception: If INSERT fails
+        """
+        self.pool.connection_factory.insert_arrow(
+            self._quote_table_name(self.temp_table),
+            self._to_insert_arrow(df),
+            self.options.get("batch_size", MSSQL_STORE_BATCHING_DEFAULTS.batch_size),
+            arrow_connection,
+        )
+
+    @staticmethod
+    def _to_insert_arrow(df: pl.DataFrame) -> "pa.Table":
+        """Arrow view of `df` with plain (not large/view) string and binary."""
+        import pyarrow as pa
+
+        table = df.to_arrow(compat_level=pl.CompatLevel.oldest())
+        narrow = {pa.large_string(): pa.string(), pa.large_binary(): pa.binary()}
+        schema = pa.schema(
+            [f.with_type(narrow.get(f.type, f.type)) for f in table.schema]
+        )
+        return table if schema.equals(table.schema) else table.cast(schema)
+
     def _map_polars_type_to_sql(self, polars_type: pl.DataType) -> str:
         """
         Map Polars data type to SQL Server type with conservative defaults.
@@ -383,9 +732,6 @@ class MssqlStore(Store, store_type="mssql"):
             sql_type = self._map_polars_type_to_sql(col_type)
             columns.append(f"[{col_name}] {sql_type} NULL")
 
-        # Create DDL - Always use Clustered Columnstore Index (analytics-optimized)
-        column_defs = ",\n    ".join(columns)
-
         # Generate safe index name from table name
         table_name_only = target_table.split(".")[-1].strip("[]")
         # Replace invalid SQL identifier characters with underscores
@@ -398,14 +744,23 @@ class MssqlStore(Store, store_type="mssql"):
         ):
             safe_index_name = f"idx_{safe_index_name}"
 
+        # Create DDL - Clustered Columnstore Index by default (analytics-optimized)
+        if self.table_index == "columnstore":
+            columns.append(f"INDEX CCI_{safe_index_name} CLUSTERED COLUMNSTORE")
+        elif self.table_index == "rowstore":
+            key_list = ", ".join(f"[{col}]" for col in self.clustered_index)
+            columns.append(f"INDEX CIX_{safe_index_name} CLUSTERED ({key_list})")
+        column_defs = ",\n    ".join(columns)
+
         ddl = f"""
 CREATE TABLE {target_table} (
-    {column_defs},
-    INDEX CCI_{safe_index_name} CLUSTERED COLUMNSTORE
+    {column_defs}
 );
 """
 
-        self.logger.info(f"Creating table {target_table} with {len(columns)} columns")
+        self.logger.info(
+            f"Creating table {target_table} with {len(df.columns)} columns"
+        )
 
         # Offload blocking pyodbc operations to thread pool
         def execute_ddl(conn, ddl_str, tbl_name):
@@ -467,10 +822,10 @@ CREATE TABLE {target_table} (
                         "Use if_exists='append' or 'replace' to proceed."
                     )
 
-                # For append: validate and adapt schema
+                # For append/merge: validate and adapt schema
                 #   (add nullable cols, allow missing nullable)
                 # For replace: use new DataFrame schema (may have schema drift)
-                if self.if_exists == "append":
+                if self.if_exists in ("append", "merge"):
                     # Validate schema compatibility and adapt if needed
                     await self._validate_and_adapt_schema_for_append(connection, df)
                     # Create temp table matching production schema (after any ALTERs)
@@ -482,6 +837,12 @@ CREATE TABLE {target_table} (
                 # No production table - create temp table with inferred schema
                 await self._create_table(connection, df, self.temp_table)
 
+            # Bind parameters to the sizes the temp table really declares
+            self._temp_columns = await self._get_column_sizes(
+                connection, self.temp_table
+            )
+            self._insert_plans.clear()
+
             self._temp_table_created = True
             self._table_checked = True
 
@@ -629,6 +990,53 @@ CREATE TABLE {target_table} (
             get_schema, connection, query, schema_name, table_name_only
         )
 
+    async def _get_column_sizes(
+        self, connection, table_name: str
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """
+        Get the declared sizes of a table's columns.
+
+        Returns:
+            Dictionary mapping column names to dict with:
+            - length: character/byte length (-1 for MAX, None if unsized)
+            - precision: numeric precision (None for non-numeric types)
+            - scale: numeric scale (None for non-numeric types)
+        """
+        parts = table_name.split(".")
+        if len(parts) == 2:
+            schema_name, table_name_only = parts
+        else:
+            schema_name = "dbo"
+            table_name_only = table_name
+
+        schema_name = schema_name.strip("[]")
+        table_name_only = table_name_only.strip("[]")
+
+        query = """
+            SELECT
+                COLUMN_NAME,
+                CHARACTER_MAXIMUM_LENGTH,
+                NUMERIC_PRECISION,
+                NUMERIC_SCALE
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+        """
+
+        def get_sizes(conn, query_str, schema, table):
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query_str, (schema, table))
+                return {
+                    row[0]: {"length": row[1], "precision": row[2], "scale": row[3]}
+                    for row in cursor.fetchall()
+                }
+            finally:
+                cursor.close()
+
+        return await asyncio.to_thread(
+            get_sizes, connection, query, schema_name, table_name_only
+        )
+
     async def _create_temp_table_from_production(self, connection) -> None:
         """Create temp table with same schema as production table."""
 
@@ -748,7 +1156,7 @@ CREATE TABLE {target_table} (
                         f"Atomically replaced {self.table} with temp table data"
                     )
 
-            elif self.if_exists == "append":
+            elif self.if_exists in ("append", "merge"):
                 # For append, copy temp data to production (future: could use UNION ALL)
                 if not prod_exists:
                     # No existing table - just rename temp to production
@@ -756,9 +1164,19 @@ CREATE TABLE {target_table} (
                         connection, self.temp_table, self.table
                     )
                     self.logger.success(f"Created {self.table} from temp table")
+                elif self.if_exists == "merge":
+                    # Merge: UPDATE changed rows, INSERT new keys, per key range
+                    await self._merge_temp_to_production(connection)
+                    # Drop temp table after successful merge
+                    await self._drop_table_atomic(connection, self.temp_table)
                 else:
-                    # Append: INSERT INTO production SELECT FROM temp
-                    await self._append_temp_to_production(connection)
+                    # Append: SWITCH partitions in, or INSERT INTO ... SELECT
+                    switched = (
+                        self.append_method == "switch"
+                        and await self._switch_temp_into_production(connection)
+                    )
+                    if not switched:
+                        await self._append_temp_to_production(connection)
                     # Drop temp table after successful append
                     await self._drop_table_atomic(connection, self.temp_table)
                     self.logger.success(f"Appended temp table data to {self.table}")
@@ -861,9 +1279,12 @@ CREATE TABLE {target_table} (
         def append_data(conn, temp_table_quoted, prod_table_quoted):
             cursor = conn.cursor()
             try:
-                # INSERT INTO production SELECT * FROM temp
+                # INSERT INTO production WITH (hints) SELECT * FROM temp
+                # (TABLOCK makes this a minimally logged bulk insert)
+                hints = f" WITH ({self.append_hints})" if self.append_hints else ""
                 sql = (
-                    f"INSERT INTO {prod_table_quoted} SELECT * FROM {temp_table_quoted}"
+                    f"INSERT INTO {prod_table_quoted}{hints} "
+                    f"SELECT * FROM {temp_table_quoted}"
                 )
                 cursor.execute(sql)
                 conn.commit()
@@ -880,6 +1301,216 @@ CREATE TABLE {target_table} (
             append_data, connection, safe_temp_table, safe_prod_table
         )
 
+    async def _switch_temp_into_production(self, connection) -> bool:
+        """
+        Append by switching the temp table's partitions into production.
+
+        Works when production is a partitioned clustered columnstore table
+        with no other indexes and every partition the new rows fall in is
+        empty. The temp table gets a columnstore on production's partition
+        scheme, then each of its partitions is switched in: metadata only,
+        however many rows. Otherwise nothing is switched and the caller
+        falls back to INSERT ... SELECT.
+
+        Returns:
+            True if the rows were switched in
+        """
+        prod = self._quote_table_name(self.table)
+        temp = self._quote_table_name(self.temp_table)
+
+        def switch(conn) -> Optional[str]:
+            """Switch partitions in; or return why not."""
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT type_desc FROM sys.indexes "
+                    "WHERE object_id = OBJECT_ID(?) AND index_id > 0",
+                    (prod,),
+                )
+                indexes = [row[0] for row in cursor.fetchall()]
+                if indexes != ["CLUSTERED COLUMNSTORE"]:
+                    return "production is not a columnstore without other indexes"
+
+                cursor.execute(
+                    "SELECT ps.name, pf.name, c.name FROM sys.indexes AS i "
+                    "JOIN sys.partition_schemes AS ps "
+                    "ON ps.data_space_id = i.data_space_id "
+                    "JOIN sys.partition_functions AS pf "
+                    "ON pf.function_id = ps.function_id "
+                    "JOIN sys.index_columns AS ic ON ic.object_id = i.object_id "
+                    "AND ic.index_id = i.index_id AND ic.partition_ordinal = 1 "
+                    "JOIN sys.columns AS c ON c.object_id = ic.object_id "
+                    "AND c.column_id = ic.column_id "
+                    "WHERE i.object_id = OBJECT_ID(?) AND i.index_id = 1",
+                    (prod,),
+                )
+                partitioning = cursor.fetchone()
+                if not partitioning:
+                    return "production is not partitioned"
+                scheme, function, column = partitioning
+
+                cursor.execute(
+                    f"SELECT DISTINCT $PARTITION.[{function}]([{column}]) FROM {temp}"
+                )
+                partitions = sorted(row[0] for row in cursor.fetchall())
+                if not partitions:
+                    return "no rows to switch"
+
+                placeholders = ",".join("?" * len(partitions))
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sys.partitions "
+                    "WHERE object_id = OBJECT_ID(?) AND index_id = 1 "
+                    f"AND partition_number IN ({placeholders}) AND rows > 0",
+                    (prod, *partitions),
+                )
+                if cursor.fetchone()[0]:
+                    return "target partitions already hold rows"
+
+                # Align the temp table with production, then switch each
+                # partition in one transaction
+                index = re.sub(r"\W", "_", self.temp_table.split(".")[-1])
+                cursor.execute(
+                    f"CREATE CLUSTERED COLUMNSTORE INDEX [CCI_{index}] "
+                    f"ON {temp} ON [{scheme}]([{column}])"
+                )
+                for partition in partitions:
+                    cursor.execute(
+                        f"ALTER TABLE {temp} SWITCH PARTITION {int(partition)} "
+                        f"TO {prod} PARTITION {int(partition)}"
+                    )
+                conn.commit()
+                self.logger.debug(
+                    f"Switched {len(partitions)} partitions into {self.table}"
+                )
+                return None
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        reason = await asyncio.to_thread(switch, connection)
+        if reason:
+            self.logger.debug(f"Not switching into {self.table}: {reason}")
+        return reason is None
+
+    async def _merge_temp_to_production(self, connection) -> None:
+        """
+        Upsert temp table rows into production by `key_columns`.
+
+        Each key range of about `merge_batch_rows` temp rows runs an UPDATE
+        of rows whose values changed and an INSERT of keys production lacks,
+        then commits. Rows that arrived unchanged are not written, so only
+        the delta touches production. Ranges already committed stay applied
+        if a later one fails; re-running the same rows is safe.
+
+        Raises:
+            StoreError: If a key column was not written, or a key repeats
+        """
+        if not self._columns_written:
+            self.logger.debug("Nothing written to merge")
+            return
+
+        keys = self.key_columns
+        columns = list(self._columns_written)
+        missing = [key for key in keys if key not in self._columns_written]
+        if missing:
+            raise StoreError(
+                f"Cannot merge into {self.table}: key columns {missing} "
+                "are not in the data"
+            )
+
+        temp = self._quote_table_name(self.temp_table)
+        prod = self._quote_table_name(self.table)
+        key_list = ", ".join(f"[{key}]" for key in keys)
+        match = " AND ".join(f"p.[{key}] = t.[{key}]" for key in keys)
+        values = [col for col in columns if col not in keys]
+
+        update_sql = None
+        if values:
+            # EXCEPT compares NULLs as equal, so unchanged rows are skipped
+            update_sql = (
+                f"UPDATE p SET {', '.join(f'[{col}] = t.[{col}]' for col in values)} "
+                f"FROM {prod} AS p JOIN {temp} AS t ON {match} "
+                f"WHERE EXISTS (SELECT {', '.join(f't.[{col}]' for col in values)} "
+                f"EXCEPT SELECT {', '.join(f'p.[{col}]' for col in values)})"
+            )
+        insert_sql = (
+            f"INSERT INTO {prod} ({', '.join(f'[{col}]' for col in columns)}) "
+            f"SELECT {', '.join(f't.[{col}]' for col in columns)} FROM {temp} AS t "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {prod} AS p WHERE {match})"
+        )
+
+        def merge(conn):
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"SELECT TOP 1 1 FROM {temp} GROUP BY {key_list} "
+                    "HAVING COUNT(*) > 1"
+                )
+                if cursor.fetchone():
+                    raise StoreError(
+                        f"Cannot merge into {self.table}: key_columns {keys} "
+                        "repeat within this run's data"
+                    )
+
+                updated = inserted = 0
+                ranges = self._merge_ranges(cursor, temp)
+                for predicate, params in ranges:
+                    where = f" AND {predicate}" if predicate else ""
+                    if update_sql:
+                        cursor.execute(update_sql + where, params)
+                        updated += max(cursor.rowcount, 0)
+                    cursor.execute(insert_sql + where, params)
+                    inserted += max(cursor.rowcount, 0)
+                    conn.commit()
+                return updated, inserted, len(ranges)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        updated, inserted, ranges = await asyncio.to_thread(merge, connection)
+        self.logger.success(
+            f"Merged into {self.table}: {updated:,} rows updated, "
+            f"{inserted:,} inserted ({ranges} key ranges)"
+        )
+
+    def _merge_ranges(self, cursor, temp: str) -> List[Tuple[Optional[str], list]]:
+        """
+        Key-range predicates (on alias `t`) splitting the temp table.
+
+        Ranges hold about `merge_batch_rows` rows each, split on the first
+        key column at NTILE boundaries. Rows with a NULL first key fall in
+        the first range. A single (None, []) means one statement.
+        """
+        cursor.execute(f"SELECT COUNT(*) FROM {temp}")
+        tiles = math.ceil(cursor.fetchone()[0] / self.merge_batch_rows)
+        if tiles <= 1:
+            return [(None, [])]
+
+        column = f"t.[{self.key_columns[0]}]"
+        cursor.execute(
+            f"SELECT MIN(k) FROM (SELECT {column} AS k, "
+            f"NTILE({tiles}) OVER (ORDER BY {column}) AS tile FROM {temp} AS t "
+            f"WHERE {column} IS NOT NULL) AS tiles GROUP BY tile ORDER BY tile"
+        )
+        bounds = []
+        for (value,) in cursor.fetchall()[1:]:
+            if not bounds or value > bounds[-1]:
+                bounds.append(value)
+        if not bounds:
+            return [(None, [])]
+
+        ranges = [(f"({column} < ? OR {column} IS NULL)", [bounds[0]])]
+        ranges += [
+            (f"{column} >= ? AND {column} < ?", [low, high])
+            for low, high in zip(bounds, bounds[1:])
+        ]
+        ranges.append((f"{column} >= ?", [bounds[-1]]))
+        return ranges
+
     def _quote_table_name(self, table_name: str) -> str:
         """
         Safely validate and quote a table name for SQL Server.
@@ -1007,6 +1638,18 @@ class MssqlStoreConfig(BaseModel, StoreConfig, config_type="mssql"):
         default=None,
         description="Table hints (e.g., 'TABLOCK' for staging/columnstore)",
     )
+    commit_rows: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Rows each writer inserts between commits (default: every chunk)",
+    )
+    load_method: Literal["executemany", "arrow_odbc"] = Field(
+        default="executemany",
+        description=(
+            "executemany: pyodbc fast_executemany over row tuples; "
+            "arrow_odbc: columnar parameter arrays from Arrow buffers"
+        ),
+    )
 
     # Write strategy (deprecated - always uses atomic temp table pattern)
     write_strategy: str = Field(
@@ -1023,9 +1666,42 @@ class MssqlStoreConfig(BaseModel, StoreConfig, config_type="mssql"):
         description=(
             "Action when table exists: 'fail' (error if exists - default, safest), "
             "'append' (append data to existing table), "
-            "'replace' (atomically drop and replace with new data)"
+            "'replace' (atomically drop and replace with new data), "
+            "'merge' (upsert by key_columns: update changed rows, insert new)"
         ),
     )
+    key_columns: Optional[List[str]] = Field(
+        default=None,
+        description="Key columns matching rows for if_exists='merge'",
+    )
+    append_method: Literal["insert", "switch"] = Field(
+        default="insert",
+        description=(
+            "insert: INSERT INTO ... SELECT from the temp table; "
+            "switch: switch partitions into a partitioned columnstore table "
+            "(falls back to insert when it can't)"
+        ),
+    )
+    append_hints: Optional[str] = Field(
+        default=None,
+        description="Table hints for the append INSERT (e.g. 'TABLOCK')",
+    )
+    table_index: Literal["columnstore", "rowstore", "heap"] = Field(
+        default="columnstore",
+        description=(
+            "Index for tables the store creates: clustered columnstore, "
+            "clustered rowstore on clustered_index, or none (heap)"
+        ),
+    )
+    clustered_index: Optional[List[str]] = Field(
+        default=None,
+        description="Key columns of the clustered index (table_index='rowstore')",
+    )
+    merge_batch_rows: int = Field(
+        default=1_000_000,
+        ge=1,
+        description="Temp table rows merged per key range (one transaction each)",
+    )
 
     # Additional options
     options: Dict[str, Any] = Field(
@@ -1071,11 +1747,20 @@ class MssqlStoreConfig(BaseModel, StoreConfig, config_type="mssql"):
     @model_validator(mode="after")
     def validate_if_exists(self):
         """Validate if_exists policy."""
-        valid_policies = ["fail", "append", "replace"]
+        valid_policies = ["fail", "append", "replace", "merge"]
         if self.if_exists not in valid_policies:
             raise ValueError(
                 f"if_exists must be one of {valid_policies}, got '{self.if_exists}'"
             )
+        if self.if_exists == "merge" and not self.key_columns:
+            raise ValueError("if_exists='merge' requires key_columns")
+        return self
+
+    @model_validator(mode="after")
+    def validate_table_index(self):
+        """Validate a rowstore index names its key columns."""
+        if self.table_index == "rowstore" and not self.clustered_index:
+            raise ValueError("table_index='rowstore' requires clustered_index")
         return self
 
     def get_merged_options(self) -> Dict[str, Any]:
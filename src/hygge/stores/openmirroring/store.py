@@ -10,10 +10,10 @@ Extends OneLakeStore to add Open Mirroring specific requirements:
 """
 
 import asyncio
-import io
 import json
 import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -21,6 +21,8 @@ from typing import Any, Dict, List, Optional
 import polars as pl
 from pydantic import Field, field_validator, model_validator
 
+from hygge.connections.execution import CpuEngine
+from hygge.core.formats import encode
 from hygge.core.journal import Journal
 from hygge.core.polish import PolishConfig, Polisher
 from hygge.stores.onelake import OneLakeStore, OneLakeStoreConfig
@@ -293,6 +295,12 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
         ```
     """
 
+    # Sequence-numbered files must follow the order rows were read
+    requires_ordered_writes = True
+
+    # Every batch gets row markers and load timestamps in Polars
+    accepts_arrow = False
+
     def __init__(
         self,
         name: str,
@@ -379,7 +387,7 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
                 "before new files are published."
             )
 
-    async def write(self, data: pl.DataFrame) -> None:
+    async def write(self, data: pl.DataFrame, prepared: bool = False) -> None:
         """
         Write data to Open Mirroring store.
 
@@ -391,16 +399,59 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
         """
         # Capture the actual data schema from the first write so _schema.json
         # reflects the entity's columns, not a hardcoded default.
-        if not hasattr(self, "_data_schema") or self._data_schema is None:
-            self._data_schema = data.schema
+        if not prepared:
+            self._capture_data_schema(data)
 
         # Prepare table folder ONCE before any data writes
         # This ensures metadata is available when Open Mirroring scans
         if not self._table_folder_prepared:
             await self._prepare_table_folder()
 
-        # Now call parent write() which handles buffering and calls _save()
-        await super().write(data)
+        # Now call parent write() which prepares, buffers and calls _save()
+        await super().write(data, prepared=prepared)
+
+    def _capture_data_schema(self, data: pl.DataFrame) -> None:
+        """Remember the incoming schema (before polish) for _schema.json."""
+        if not hasattr(self, "_data_schema") or self._data_schema is None:
+            self._data_schema = data.schema
+
+    def prepare_batch(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Make an incoming batch landing-zone ready.
+
+        Extends base Store.prepare_batch() (polish) with:
+        - Key column validation (after polish has created hash IDs)
+        - __LastLoadedAt__ and __rowMarker__ injection and validation
+        - Column reordering (__rowMarker__ must be last)
+
+        Everything here is row-local, so Flow can run it on worker threads
+        for several batches at once; only the writes need to stay in order.
+
+        Raises:
+            StoreError: If validation fails
+        """
+        self._capture_data_schema(df)
+        if len(df) == 0:
+            return df
+
+        # CRITICAL: Apply polish FIRST (creates hash IDs, normalizes columns)
+        # This ensures hash ID columns exist before validation
+        df = super().prepare_batch(df)
+
+        # Validate key columns exist (after polish has created them)
+        self._validate_key_columns(df)
+
+        # Add __rowMarker__ column if needed
+        df = self._add_row_marker_column(df)
+
+        # Validate row marker values
+        self._validate_row_marker(df)
+
+        # Validate update rows have full data
+        self._validate_update_rows(df)
+
+        # Ensure __rowMarker__ is last column (CRITICAL)
+        return self._ensure_row_marker_last(df)
 
     def _get_adls_ops(self) -> "ADLSOperations":
         """
@@ -535,6 +586,10 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
 
     async def reset_retry_sensitive_state(self) -> None:
         """Reset retry-sensitive state (sequence counter) before retry."""
+        # Stop any background saves from the failed attempt
+        await self._cancel_writes()
+        self._issued_filenames.clear()
+        self._saves_started = 0
         # Reset to None so it will be re-initialized from existing files
         # This ensures we don't create gaps in sequence numbers on retry
         self.sequence_counter = None
@@ -1208,12 +1263,9 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
         """
         Save data to Open Mirroring landing zone.
 
-        Overrides OneLakeStore._save() to add:
-        - Polish transform (hash IDs, column normalization) - FIRST
-        - __rowMarker__ column injection/validation
-        - Column reordering (__rowMarker__ must be last)
-        - Metadata file writing
-        - Full drop data preparation.
+        Overrides OneLakeStore._save() to stage files under _tmp while
+        keeping the schema folder structure. Polish, __rowMarker__ handling
+        and column ordering have already been applied by prepare_batch().
 
         Args:
             df: Polars DataFrame to write
@@ -1231,27 +1283,6 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
             # Table folder preparation is now handled in write() method
             # before any data is written, so we don't need to do it here
 
-            # CRITICAL: Apply polish FIRST (creates hash IDs, normalizes columns)
-            # This ensures hash ID columns exist before validation
-            # Note: _pre_write() is also called in _flush_buffer(), but we ensure
-            # it's applied here as well for safety (idempotent - won't double-apply)
-            df = self._pre_write(df)
-
-            # Validate key columns exist (after polish has created them)
-            self._validate_key_columns(df)
-
-            # Add __rowMarker__ column if needed
-            df = self._add_row_marker_column(df)
-
-            # Validate row marker values
-            self._validate_row_marker(df)
-
-            # Validate update rows have full data
-            self._validate_update_rows(df)
-
-            # Ensure __rowMarker__ is last column (CRITICAL)
-            df = self._ensure_row_marker_last(df)
-
             # Build staging path that maintains schema structure:
             # Files/_tmp/schema_name.schema/entity/ instead of Files/LandingZone/...
             # We need to handle this specially because PathHelper.build_staging_path()
@@ -1287,10 +1318,14 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
 
             # Get ADLS operations and upload (reusing parent's upload logic)
             adls_ops = self._get_adls_ops()
-            buffer = io.BytesIO()
-            df.write_parquet(buffer, compression=self.compression)
-            data = buffer.getvalue()
-            stored_staging_path = await adls_ops.upload_bytes(data, cloud_staging_path)
+            with self.timings.span("encode"):
+                data = await CpuEngine.execute(
+                    encode, df, "parquet", compression=self.compression
+                )
+            with self.timings.span("upload"):
+                stored_staging_path = await adls_ops.upload_bytes(
+                    data, cloud_staging_path
+                )
 
             # Log and track (reusing parent's tracking logic) with cloud path context
             self._log_write_progress(
@@ -1327,6 +1362,9 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
         if self.data_buffer:
             await self._flush_buffer()
 
+        # Wait for background saves so saved_paths is complete and in order
+        await self._drain_writes()
+
         # Log any remaining accumulated rows that didn't hit the interval
         if self.rows_since_last_log > 0:
             self.logger.debug(f"WROTE {self.rows_since_last_log:,} rows")
@@ -1340,10 +1378,12 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
                 )
 
                 # Step 1: Delete production folder (ACID: only after all writes succeed)
-                await self._delete_table_folder()
+                with self.timings.span("delete"):
+                    await self._delete_table_folder()
 
                 # Step 2: Move all data files from _tmp to production
                 # Collect any errors but continue moving files to minimize data loss
+                move_started = time.perf_counter()
                 adls_ops = self._get_adls_ops()
                 move_errors = []
 
@@ -1444,6 +1484,7 @@ class OpenMirroringStore(OneLakeStore, store_type="open_mirroring"):
                         error_msg = f"Failed to move _schema.json: {str(e)}"
                         move_errors.append(error_msg)
                         self.logger.error(error_msg)
+                self.timings.add("move", time.perf_counter() - move_started)
 
                 # If any moves failed, raise a comprehensive error
                 if move_errors:
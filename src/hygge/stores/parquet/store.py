@@ -8,6 +8,8 @@ from typing import Any, Dict, Optional
 import polars as pl
 from pydantic import Field, field_validator
 
+from hygge.connections.execution import CpuEngine
+from hygge.core.formats import write as format_write
 from hygge.core.polish import PolishConfig, Polisher
 from hygge.core.store import BaseStoreConfig, Store, StoreConfig
 from hygge.utility.exceptions import StoreError, StoreWriteError
@@ -38,6 +40,9 @@ class ParquetStore(Store, store_type="parquet"):
         ```
     """
 
+    # The format layer writes Arrow tables as well as DataFrames
+    accepts_arrow = True
+
     def __init__(
         self,
         name: str,
@@ -141,8 +146,15 @@ class ParquetStore(Store, store_type="parquet"):
             # Ensure directory exists
             staging_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write using standard parquet write
-            df.write_parquet(staging_path, compression=self.compression)
+            # Encode off the event loop so other flows keep moving
+            with self.timings.span("encode"):
+                await CpuEngine.execute(
+                    format_write,
+                    df,
+                    staging_path,
+                    "parquet",
+                    compression=self.compression,
+                )
 
             # Verify the file was actually created
             if not staging_path.exists():
@@ -0,0 +1,84 @@
+"""
+Integration test: executemany vs arrow-odbc loads into MSSQL.
+
+Writes the same rows with each `load_method`, checks both tables hold them
+all, and prints their throughput.
+
+arrow-odbc authenticates in the ODBC driver; set AZURE_SQL_AUTHENTICATION
+(default: ActiveDirectoryDefault) to the driver's Authentication keyword.
+
+Run with: pytest tests/integration/test_mssql_arrow_load.py -v -s
+"""
+
+import importlib.util
+import os
+import time
+
+import polars as pl
+import pytest
+
+from hygge.connections import ConnectionPool, MssqlConnection
+from hygge.stores.mssql import MssqlStore, MssqlStoreConfig
+
+ROWS = 200_000
+
+
+@pytest.mark.skipif(
+    not os.getenv("AZURE_SQL_SERVER") or not os.getenv("AZURE_SQL_DATABASE"),
+    reason="Azure SQL credentials not configured",
+)
+@pytest.mark.skipif(
+    importlib.util.find_spec("arrow_odbc") is None,
+    reason="arrow-odbc not installed",
+)
+@pytest.mark.asyncio
+async def test_arrow_odbc_load_matches_executemany():
+    """Both load methods land every row; report their throughput."""
+    data = pl.DataFrame(
+        {
+            "id": list(range(ROWS)),
+            "name": [f"User_{i}" for i in range(ROWS)],
+            "score": [(i * 3.14) % 100 for i in range(ROWS)],
+        }
+    )
+    factory = MssqlConnection(
+        server=os.getenv("AZURE_SQL_SERVER"),
+        database=os.getenv("AZURE_SQL_DATABASE"),
+        options={
+            "authentication": os.getenv(
+                "AZURE_SQL_AUTHENTICATION", "ActiveDirectoryDefault"
+            ),
+        },
+    )
+    pool = ConnectionPool(name="load_pool", connection_factory=factory, pool_size=8)
+    await pool.initialize()
+
+    try:
+        for load_method in ("executemany", "arrow_odbc"):
+            table = f"dbo.hygge_load_{load_method}"
+            config = MssqlStoreConfig(
+                connection="load_pool",
+                table=table,
+                if_exists="replace",
+                load_method=load_method,
+            )
+            store = MssqlStore(load_method, config)
+            store.set_pool(pool)
+
+            start = time.perf_counter()
+            await store.write(data)
+            await store.close()
+            seconds = time.perf_counter() - start
+            print(f"{load_method:>12}: {ROWS / seconds:,.0f} rows/s ({seconds:.2f}s)")
+
+            connection = await pool.acquire()
+            try:
+                cursor = connection.cursor()
+                count = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                cursor.execute(f"DROP TABLE {table}")
+                connection.commit()
+            finally:
+                await pool.release(connection)
+            assert count == ROWS
+    finally:
+        await pool.close()
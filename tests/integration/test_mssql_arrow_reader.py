@@ -0,0 +1,73 @@
+"""
+Integration test: pyodbc vs arrow-odbc extraction from MSSQL.
+
+Reads the table written by test_mssql_large_volume.py through both readers,
+checks they return the same rows, and prints their throughput.
+
+arrow-odbc authenticates in the ODBC driver; set AZURE_SQL_AUTHENTICATION
+(default: ActiveDirectoryDefault) to the driver's Authentication keyword.
+
+Run with: pytest tests/integration/test_mssql_arrow_reader.py -v -s
+"""
+
+import importlib.util
+import os
+import time
+
+import polars as pl
+import pytest
+
+from hygge.connections import ConnectionPool, MssqlConnection
+from hygge.homes.mssql import MssqlHome, MssqlHomeConfig
+
+TEST_TABLE = "dbo.hygge_large_volume_test"
+
+
+async def _read(reader: str) -> tuple[pl.DataFrame, float]:
+    """Read the test table with `reader`; return the rows and seconds taken."""
+    factory = MssqlConnection(
+        server=os.getenv("AZURE_SQL_SERVER"),
+        database=os.getenv("AZURE_SQL_DATABASE"),
+        options={
+            "reader": reader,
+            "authentication": os.getenv(
+                "AZURE_SQL_AUTHENTICATION", "ActiveDirectoryDefault"
+            ),
+        },
+    )
+    pool = ConnectionPool(name=reader, connection_factory=factory, pool_size=1)
+    await pool.initialize()
+    try:
+        config = MssqlHomeConfig(type="mssql", connection=reader, table=TEST_TABLE)
+        home = MssqlHome(reader, config, pool=pool)
+        start = time.perf_counter()
+        batches = [batch async for batch in home.read()]
+        return pl.concat(batches), time.perf_counter() - start
+    finally:
+        await pool.close()
+
+
+@pytest.mark.skipif(
+    not os.getenv("AZURE_SQL_SERVER") or not os.getenv("AZURE_SQL_DATABASE"),
+    reason="Azure SQL credentials not configured",
+)
+@pytest.mark.skipif(
+    importlib.util.find_spec("arrow_odbc") is None,
+    reason="arrow-odbc not installed",
+)
+@pytest.mark.asyncio
+async def test_arrow_odbc_reader_matches_pyodbc():
+    """Both readers return the same rows; report their throughput."""
+    rows_pyodbc, seconds_pyodbc = await _read("pyodbc")
+    rows_arrow, seconds_arrow = await _read("arrow_odbc")
+
+    for reader, rows, seconds in (
+        ("pyodbc", rows_pyodbc, seconds_pyodbc),
+        ("arrow_odbc", rows_arrow, seconds_arrow),
+    ):
+        print(f"{reader:>10}: {len(rows) / seconds:,.0f} rows/s ({seconds:.2f}s)")
+
+    assert len(rows_arrow) == len(rows_pyodbc)
+    # Integer widths can differ (arrow-odbc keeps INT as Int32); values match
+    assert rows_arrow["id"].sort().to_list() == rows_pyodbc["id"].sort().to_list()
+    assert rows_arrow["name"].sort().to_list() == rows_pyodbc["name"].sort().to_list()
@@ -6,11 +6,15 @@ without requiring actual database connections.
 """
 
 import asyncio
+import threading
+import time
+from contextlib import aclosing
 from typing import Iterator
 
 import pytest
 
 from hygge.connections.execution import (
+    CpuEngine,
     SimpleEngine,
     ThreadPoolEngine,
     get_engine,
@@ -20,16 +24,18 @@ from hygge.connections.execution import (
 
 @pytest.fixture(autouse=True)
 def clean_execution_engine():
-    """Ensure ThreadPoolEngine is clean before and after each test."""
+    """Ensure shared engines are clean before and after each test."""
     # Clean up before test
-    if ThreadPoolEngine.is_initialized():
-        ThreadPoolEngine.shutdown()
+    for engine in (ThreadPoolEngine, CpuEngine):
+        if engine.is_initialized():
+            engine.shutdown()
 
     yield
 
     # Clean up after test
-    if ThreadPoolEngine.is_initialized():
-        ThreadPoolEngine.shutdown()
+    for engine in (ThreadPoolEngine, CpuEngine):
+        if engine.is_initialized():
+            engine.shutdown()
 
 
 class TestThreadPoolEngine:
@@ -136,6 +142,29 @@ class TestThreadPoolEngine:
         # Should have gotten batches before the error
         assert len(batches) >= 1
 
+    @pytest.mark.asyncio
+    async def test_execute_streaming_stops_thread_when_closed_early(self):
+        """Test closing the stream early stops and closes the extraction thread."""
+        ThreadPoolEngine.initialize(pool_size=2)
+        closed = threading.Event()
+
+        def endless() -> Iterator[int]:
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        async with aclosing(ThreadPoolEngine.execute_streaming(endless)) as batches:
+            async for _ in batches:
+                break
+
+        # The thread has exited (and closed its generator) by the time the
+        # stream is closed, instead of blocking on a full queue
+        assert closed.is_set()
+
     @pytest.mark.asyncio
     async def test_execute_streaming_parallelism(self):
         """
@@ -189,6 +218,67 @@ class TestThreadPoolEngine:
         assert ThreadPoolEngine.is_initialized()
 
 
+class TestCpuEngine:
+    """Test CpuEngine for CPU-bound data work."""
+
+    def test_initialization_defaults_to_core_count(self):
+        """Test that the pool defaults to one worker per core."""
+        CpuEngine.initialize()
+        assert CpuEngine.is_initialized()
+        assert CpuEngine._pool_size == CpuEngine.default_pool_size()
+
+    def test_separate_from_thread_pool(self):
+        """Test that the CPU pool does not share ThreadPoolEngine's workers."""
+        CpuEngine.initialize(pool_size=2)
+        ThreadPoolEngine.initialize(pool_size=2)
+        assert CpuEngine._executor is not ThreadPoolEngine._executor
+
+        CpuEngine.shutdown()
+        assert not CpuEngine.is_initialized()
+        assert ThreadPoolEngine.is_initialized()
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_event_loop_free(self):
+        """Test that CPU work runs off the loop so other tasks keep running."""
+        CpuEngine.initialize(pool_size=2)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        def busy(seconds):
+            time.sleep(seconds)
+            return "done"
+
+        result, _ = await asyncio.gather(CpuEngine.execute(busy, 0.1), ticker())
+
+        assert result == "done"
+        assert len(ticks) == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_lazy_initialization(self):
+        """Test that engine initializes lazily if not pre-initialized."""
+        result = await CpuEngine.execute(lambda a, b: a * b, 6, 7)
+        assert result == 42
+        assert CpuEngine.is_initialized()
+
+    def test_execute_streaming_is_rejected(self):
+        """Test that generators are refused rather than collected into memory."""
+        pulled = []
+
+        def endless():
+            while True:
+                pulled.append(1)
+                yield len(pulled)
+
+        with pytest.raises(TypeError, match="per-batch callables"):
+            CpuEngine.execute_streaming(endless)
+
+        assert pulled == []
+
+
 class TestSimpleEngine:
     """Test SimpleEngine for simple async operations."""
 
@@ -236,6 +326,11 @@ class TestExecutionEngineRegistry:
         engine = get_engine("simple")
         assert isinstance(engine, SimpleEngine)
 
+    def test_get_engine_cpu(self):
+        """Test getting cpu engine."""
+        engine = get_engine("cpu")
+        assert isinstance(engine, CpuEngine)
+
     def test_get_engine_unknown_raises_error(self):
         """Test that unknown engine raises error."""
         with pytest.raises(ValueError, match="Unknown execution engine"):
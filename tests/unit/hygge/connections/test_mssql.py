@@ -12,6 +12,7 @@ import pytest
 from azure.core.credentials import AccessToken
 
 from hygge.connections.mssql import MssqlConnection
+from hygge.utility.exceptions import HomeError
 
 
 @pytest.fixture
@@ -219,3 +220,78 @@ async def test_is_connection_alive_handles_errors(mssql_connection):
 
         # Should return False for failed health check
         assert is_alive is False
+
+
+def test_arrow_connection_string_uses_driver_authentication():
+    """arrow-odbc authenticates in the driver, never with the token."""
+    with patch("hygge.connections.mssql.DefaultAzureCredential"):
+        conn = MssqlConnection(
+            server="test.database.windows.net",
+            database="testdb",
+            options={"reader": "arrow_odbc", "authentication": "ActiveDirectoryMsi"},
+        )
+
+    conn_str = conn._arrow_connection_string()
+
+    assert conn.reader == "arrow_odbc"
+    assert conn_str.startswith("DRIVER=ODBC Driver 18 for SQL Server;")
+    assert conn_str.endswith(";Authentication=ActiveDirectoryMsi")
+
+
+def test_read_arrow_batches(mssql_connection):
+    """Batches come straight from arrow-odbc's reader."""
+    pa = pytest.importorskip("pyarrow")
+    batch = pa.record_batch({"id": [1, 2]})
+    arrow_odbc = MagicMock()
+    arrow_odbc.read_arrow_batches_from_odbc.return_value = iter([batch, batch])
+
+    with patch.dict("sys.modules", {"arrow_odbc": arrow_odbc}):
+        batches = list(mssql_connection.read_arrow_batches("SELECT 1", 500))
+
+    assert batches == [batch, batch]
+    kwargs = arrow_odbc.read_arrow_batches_from_odbc.call_args.kwargs
+    assert kwargs["query"] == "SELECT 1"
+    assert kwargs["batch_size"] == 500
+    assert "Authentication" not in kwargs["connection_string"]
+
+
+def test_read_arrow_batches_without_arrow_odbc(mssql_connection):
+    """A missing arrow-odbc says how to install it."""
+    with patch.dict("sys.modules", {"arrow_odbc": None}):
+        with pytest.raises(HomeError, match="pip install arrow-odbc"):
+            next(mssql_connection.read_arrow_batches("SELECT 1", 500))
+
+
+def test_insert_arrow(mssql_connection):
+    """Arrow tables go to arrow-odbc as a record batch reader."""
+    pa = pytest.importorskip("pyarrow")
+    data = pa.table({"id": list(range(5))})
+    arrow_odbc = MagicMock()
+
+    with patch.dict("sys.modules", {"arrow_odbc": arrow_odbc}):
+        mssql_connection.insert_arrow("[dbo].[t]", data, 2)
+
+    kwargs = arrow_odbc.insert_into_table.call_args.kwargs
+    assert kwargs["table"] == "[dbo].[t]"
+    assert kwargs["chunk_size"] == 2
+    assert kwargs["reader"].read_all().equals(data)
+
+
+def test_insert_arrow_on_held_connection(mssql_connection):
+    """A connection from connect_arrow() is reused, with no new login."""
+    pa = pytest.importorskip("pyarrow")
+    data = pa.table({"id": list(range(5))})
+    arrow_odbc = MagicMock()
+
+    with patch.dict("sys.modules", {"arrow_odbc": arrow_odbc}):
+        held = mssql_connection.connect_arrow()
+        mssql_connection.insert_arrow("[dbo].[t]", data, 2, held)
+        mssql_connection.insert_arrow("[dbo].[t]", data, 2, held)
+
+    arrow_odbc.connect.assert_called_once()
+    assert "connection_string" in arrow_odbc.connect.call_args.kwargs
+    arrow_odbc.insert_into_table.assert_not_called()
+    assert held.insert_into_table.call_count == 2
+    kwargs = held.insert_into_table.call_args.kwargs
+    assert kwargs["table"] == "[dbo].[t]"
+    assert kwargs["reader"].read_all().equals(data)
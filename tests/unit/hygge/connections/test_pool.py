@@ -214,3 +214,21 @@ async def test_pool_concurrent_access(mock_factory):
     assert pool.available == 3
 
     await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_discard_replaces_connection(mock_factory):
+    """Test a discarded connection is closed and replaced with a new one."""
+    pool = ConnectionPool(
+        name="test_pool", connection_factory=mock_factory, pool_size=1
+    )
+    await pool.initialize()
+
+    conn = await pool.acquire()
+    await pool.discard(conn)
+
+    assert mock_factory.closed
+    assert pool.available == 1
+    assert MockConnection.connection_count == 2
+
+    await pool.close()
@@ -256,6 +256,24 @@ class TestFlowConfig:
         assert config.timeout == 300  # Default from FlowConfig
         assert config.full_drop is None  # Default for flow-level strategy
 
+    @pytest.mark.parametrize(
+        "value, expected", [("256MB", 256 * 1024**2), (4096, 4096)]
+    )
+    def test_queue_max_bytes_accepts_sizes(self, value, expected):
+        """Test queue_max_bytes takes '256MB'-style sizes as well as bytes."""
+        config = FlowConfig(
+            home="data/users.parquet", store="data/output", queue_max_bytes=value
+        )
+
+        assert config.queue_max_bytes == expected
+
+    def test_queue_max_bytes_rejects_invalid_sizes(self):
+        """Test queue_max_bytes rejects sizes it cannot parse."""
+        with pytest.raises(ValidationError, match="Invalid size"):
+            FlowConfig(
+                home="data/users.parquet", store="data/output", queue_max_bytes="lots"
+            )
+
     def test_flow_config_with_full_drop(self):
         """Test FlowConfig with flow-level full_drop setting."""
         config = FlowConfig(
@@ -49,6 +49,19 @@ class TestHomeConfig:
         assert config.options["batch_size"] == 1000
         assert config.options["custom_option"] == "value"
 
+    def test_prefetch_bytes_accepts_sizes(self):
+        """Test prefetch_bytes takes '256MB'-style sizes as well as bytes."""
+        config = HomeConfig.create(
+            {"type": "parquet", "path": "data/users.parquet", "prefetch_bytes": "1MB"}
+        )
+        assert config.prefetch_bytes == 1024**2
+        assert config.get_merged_options()["prefetch_bytes"] == 1024**2
+
+        with pytest.raises(ValidationError, match="Invalid size"):
+            HomeConfig.create(
+                {"type": "parquet", "path": "data/users.parquet", "prefetch_bytes": "x"}
+            )
+
     # SQL tests removed - only parquet is supported in POC
 
     # Error Scenarios
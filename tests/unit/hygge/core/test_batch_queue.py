@@ -0,0 +1,67 @@
+"""
+Tests for BatchQueue.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on memory staying bounded
+- Keep tests clear and maintainable
+"""
+
+import asyncio
+
+import polars as pl
+import pytest
+
+from hygge.core.flow.batch_queue import BatchQueue
+
+
+@pytest.fixture
+def batch():
+    return pl.DataFrame({"id": range(1000), "value": ["x" * 20] * 1000})
+
+
+class TestBatchQueue:
+    """Test byte accounting and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_queued_bytes(self, batch):
+        queue = BatchQueue(maxsize=10)
+
+        await queue.put(batch)
+        await queue.put(batch)
+        assert queue.queued_bytes == 2 * batch.estimated_size()
+
+        await queue.get()
+        assert queue.queued_bytes == batch.estimated_size()
+
+    @pytest.mark.asyncio
+    async def test_sentinel_costs_nothing(self, batch):
+        queue = BatchQueue(maxsize=10, max_bytes=1)
+
+        await queue.put(batch)
+        await asyncio.wait_for(queue.put(None), timeout=1)
+
+        assert queue.queued_bytes == batch.estimated_size()
+
+    @pytest.mark.asyncio
+    async def test_put_waits_for_byte_headroom(self, batch):
+        queue = BatchQueue(maxsize=10, max_bytes=int(batch.estimated_size() * 1.5))
+        await queue.put(batch)
+
+        second_put = asyncio.create_task(queue.put(batch))
+        await asyncio.sleep(0.01)
+        assert not second_put.done()  # Over budget: blocked
+        assert queue.qsize() == 1
+
+        await queue.get()
+        await asyncio.wait_for(second_put, timeout=1)
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_admitted_when_empty(self, batch):
+        queue = BatchQueue(maxsize=10, max_bytes=1)
+
+        await asyncio.wait_for(queue.put(batch), timeout=1)
+
+        assert queue.qsize() == 1
+        assert "MB" in queue.describe()
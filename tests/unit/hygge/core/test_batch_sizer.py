@@ -0,0 +1,88 @@
+"""
+Tests for adaptive batch sizing.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on sizes converging within bounds
+- Keep tests clear and maintainable
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from hygge.core.flow.batch_sizer import (
+    AdaptiveBatchConfig,
+    BatchSizer,
+    resolve_adaptive_batching,
+)
+
+
+class TestAdaptiveBatchConfig:
+    """Test adaptive batching configuration."""
+
+    def test_resolve_option(self):
+        assert resolve_adaptive_batching(None) is None
+        assert resolve_adaptive_batching(False) is None
+        assert resolve_adaptive_batching(True) == AdaptiveBatchConfig()
+
+        config = resolve_adaptive_batching({"target_batch_bytes": "16MB"})
+        assert config.target_batch_bytes == 16 * 1024**2
+
+    def test_rejects_inverted_bounds(self):
+        with pytest.raises(ValidationError):
+            AdaptiveBatchConfig(min_rows=10_000, max_rows=1_000)
+
+    def test_rejects_invalid_size(self):
+        with pytest.raises(ValidationError):
+            AdaptiveBatchConfig(target_batch_bytes="lots")
+
+
+class TestBatchSizer:
+    """Test how batch sizes respond to observed batches."""
+
+    def test_shrinks_wide_batches_toward_byte_target(self):
+        config = AdaptiveBatchConfig(target_batch_bytes=10_000_000, min_rows=100)
+        sizer = BatchSizer(100_000, config)
+
+        # 1 KB rows: 10 MB target means about 10k rows
+        for _ in range(10):
+            sizer.observe(rows=sizer.rows, nbytes=sizer.rows * 1_000, seconds=0.1)
+
+        assert 9_000 <= sizer.rows <= 11_000
+
+    def test_grows_fast_narrow_batches_within_bounds(self):
+        config = AdaptiveBatchConfig(max_rows=200_000, target_seconds=1.0)
+        sizer = BatchSizer(10_000, config)
+
+        for _ in range(10):
+            sizer.observe(rows=sizer.rows, nbytes=sizer.rows * 10, seconds=0.01)
+
+        assert sizer.rows == 200_000
+
+    def test_slow_stage_targets_latency(self):
+        config = AdaptiveBatchConfig(target_seconds=2.0, min_rows=100)
+        sizer = BatchSizer(50_000, config)
+
+        # 5,000 rows/s: 2 seconds means about 10k rows
+        for _ in range(10):
+            sizer.observe(
+                rows=sizer.rows, nbytes=sizer.rows, seconds=sizer.rows / 5_000
+            )
+
+        assert 9_000 <= sizer.rows <= 11_000
+
+    def test_steps_are_bounded(self):
+        sizer = BatchSizer(100_000, AdaptiveBatchConfig(min_rows=1))
+
+        sizer.observe(rows=100_000, nbytes=100_000 * 1_000_000, seconds=1.0)
+
+        assert sizer.rows == 50_000
+
+    def test_small_changes_are_ignored(self):
+        config = AdaptiveBatchConfig(target_batch_bytes=1_050_000)
+        sizer = BatchSizer(1_000, config)
+
+        # Target is 1,050 rows: within the 10% deadband
+        sizer.observe(rows=1_000, nbytes=1_000_000, seconds=0)
+
+        assert sizer.rows == 1_000
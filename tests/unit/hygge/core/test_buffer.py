@@ -0,0 +1,89 @@
+"""
+Tests for BatchBuffer.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on row order and exact batch sizes
+- Keep tests clear and maintainable
+"""
+
+import polars as pl
+
+from hygge.core.buffer import BatchBuffer
+
+
+def _frame(start: int, rows: int) -> pl.DataFrame:
+    return pl.DataFrame({"id": list(range(start, start + rows))})
+
+
+class TestBatchBuffer:
+    """Test chunked buffering and batch slicing."""
+
+    def test_empty_buffer(self):
+        buffer = BatchBuffer()
+
+        assert not buffer
+        assert buffer.rows == 0
+        assert buffer.to_frame() is None
+        assert buffer.take_all() is None
+
+    def test_append_tracks_rows_and_chunks(self):
+        buffer = BatchBuffer()
+        buffer.append(_frame(0, 3))
+        buffer.append(_frame(3, 4))
+
+        assert buffer.rows == 7
+        assert len(buffer) == 2
+        assert buffer.to_frame()["id"].to_list() == list(range(7))
+        # to_frame() does not consume
+        assert buffer.rows == 7
+
+    def test_take_splits_across_chunk_boundaries(self):
+        buffer = BatchBuffer([_frame(0, 25), _frame(25, 25), _frame(50, 25)])
+
+        first = buffer.take(40)
+        second = buffer.take(40)
+
+        assert first["id"].to_list() == list(range(40))
+        assert second["id"].to_list() == list(range(40, 75))
+        assert buffer.rows == 0
+        assert not buffer
+
+    def test_take_leaves_remainder_in_place(self):
+        buffer = BatchBuffer([_frame(0, 10)])
+
+        batch = buffer.take(4)
+
+        assert len(batch) == 4
+        assert buffer.rows == 6
+        assert buffer.chunks[0]["id"].to_list() == list(range(4, 10))
+
+    def test_take_more_than_buffered_returns_everything(self):
+        buffer = BatchBuffer([_frame(0, 5)])
+
+        batch = buffer.take(100)
+
+        assert len(batch) == 5
+        assert buffer.rows == 0
+
+    def test_clear(self):
+        buffer = BatchBuffer([_frame(0, 5), _frame(5, 5)])
+        buffer.clear()
+
+        assert buffer.rows == 0
+        assert buffer.chunks == []
+
+    def test_arrow_chunks_come_back_as_one_table(self):
+        import pyarrow as pa
+
+        buffer = BatchBuffer()
+        buffer.append(_frame(0, 6).to_arrow().to_batches()[0])
+        buffer.append(_frame(6, 6).to_arrow())
+
+        batch = buffer.take(8)
+
+        assert isinstance(batch, pa.Table)
+        assert batch.column("id").to_pylist() == list(range(8))
+        assert buffer.rows == 4
+        assert buffer.estimated_bytes > 0
+        assert buffer.take_all().column("id").to_pylist() == list(range(8, 12))
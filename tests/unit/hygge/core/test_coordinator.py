@@ -6,6 +6,7 @@ They verify that the registry pattern works correctly with real configurations.
 """
 
 import asyncio
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -179,6 +180,45 @@ flows_dir: "flows"
                 Coordinator(temp_dir)
 
 
+class TestCoordinatorTimingsReport:
+    """Test the optional stage timings report."""
+
+    def _coordinator(self, tmp_path):
+        hygge_file = tmp_path / "hygge.yml"
+        hygge_file.write_text('name: "test_project"\nflows_dir: "flows"\n')
+        (tmp_path / "flows").mkdir()
+        coordinator = Coordinator(str(hygge_file))
+        coordinator.coordinator_run_id = "coord_run"
+        coordinator.flow_results = [
+            {"name": "users", "status": "pass", "timings": {"read": {"seconds": 1}}}
+        ]
+        return coordinator
+
+    def test_no_report_by_default(self, tmp_path, monkeypatch):
+        """Test nothing is written unless timings_file is set."""
+        monkeypatch.chdir(tmp_path)
+        coordinator = self._coordinator(tmp_path)
+
+        coordinator._write_timings_report()
+
+        assert not (tmp_path / "logs").exists()
+
+    def test_report_path_is_per_run(self, tmp_path):
+        """Test {run_id} in timings_file gives each run its own report."""
+        coordinator = self._coordinator(tmp_path)
+        coordinator.options["timings_file"] = str(
+            tmp_path / "reports" / "timings_{run_id}.json"
+        )
+
+        coordinator._write_timings_report()
+
+        report = json.loads(
+            (tmp_path / "reports" / "timings_coord_run.json").read_text()
+        )
+        assert report["coordinator_run_id"] == "coord_run"
+        assert report["flows"][0]["stages"] == {"read": {"seconds": 1}}
+
+
 class TestCoordinatorConfigLoading:
     """Test configuration loading via Workspace."""
 
@@ -1762,9 +1802,9 @@ store:
 
         # Verify that max concurrent never exceeded 3
         # Note: This is a timing-dependent test, but should be reliable with the sleep
-        assert (
-            max_concurrent_seen <= 3
-        ), f"Max concurrent was {max_concurrent_seen}, expected <= 3"
+        assert max_concurrent_seen <= 3, (
+            f"Max concurrent was {max_concurrent_seen}, expected <= 3"
+        )
 
     @pytest.mark.asyncio
     async def test_semaphore_released_early_via_extraction_callback(self, tmp_path):
@@ -9,15 +9,18 @@ Following hygge's testing principles:
 """
 
 import asyncio
+import time
 from pathlib import Path
 from typing import AsyncIterator, List, Optional
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import polars as pl
+import pyarrow as pa
 import pytest
 
 from hygge.core.flow import Flow
 from hygge.core.home import Home
+from hygge.core.memory import MemoryBudget
 from hygge.core.store import Store
 from hygge.utility.exceptions import ConfigError, FlowError, HomeConnectionError
 
@@ -58,6 +61,16 @@ class WatermarkCapableHome(MockHome):
             yield df
 
 
+class ArrowHome(MockHome):
+    """Mock Home that can also yield pyarrow record batches."""
+
+    supports_arrow = True
+
+    async def _get_arrow_batches(self) -> AsyncIterator[pa.RecordBatch]:
+        for df in self.data:
+            yield df.to_arrow().to_batches()[0]
+
+
 class StubJournal:
     """Simple in-memory journal stub for Flow tests."""
 
@@ -137,6 +150,50 @@ class MockStore(Store):
         self.written_data.clear()
 
 
+class PreparingMockStore(MockStore):
+    """Mock Store whose prepare step takes a variable amount of time."""
+
+    requires_ordered_writes = True
+
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name, **kwargs)
+        self.prepared_batches = 0
+
+    def prepare_batch(self, df: pl.DataFrame) -> pl.DataFrame:
+        # Later batches finish preparing first, so ordering is really tested
+        time.sleep(0.02 / (1 + df["id"][0] // 10 % 5))
+        self.prepared_batches += 1
+        return df.with_columns(pl.lit(True).alias("prepared"))
+
+    async def write(self, df: pl.DataFrame, prepared: bool = False):
+        assert prepared and "prepared" in df.columns
+        self.written_data.append(df)
+
+
+class SetupMockStore(Store):
+    """Mock Store whose first _save() awaits one-time setup (like a temp table)."""
+
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name, kwargs)
+        self.ready = False
+        self.setups = 0
+        self.rows_saved = 0
+
+    async def _save(self, df, path=None):
+        if not self.ready:
+            self.setups += 1
+            await asyncio.sleep(0.1)
+            self.ready = True
+        await asyncio.sleep(0)
+        self.rows_saved += len(df)
+
+
+class ArrowMockStore(MockStore):
+    """Mock Store that accepts Arrow batches."""
+
+    accepts_arrow = True
+
+
 @pytest.fixture
 def sample_data():
     """Create sample data for testing."""
@@ -244,6 +301,272 @@ class TestSimplifiedFlow:
         for i, df in enumerate(flow.store.written_data):
             assert df.equals(sample_data[i])
 
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_flow_byte_budgeted_queue(self, mock_home, mock_store, sample_data):
+        """Test Flow moves all data when the queue is bounded by bytes."""
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=mock_store,
+            options={"queue_size": 5, "queue_max_bytes": 1},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        assert flow.queue.max_bytes == 1
+        assert flow.queued_bytes == 0
+        assert flow.total_rows == sum(len(df) for df in sample_data)
+        # The home's read-ahead is capped the same way
+        assert mock_home.prefetch_bytes == 1
+
+    @pytest.mark.asyncio
+    async def test_flow_returns_memory_budget_credit(
+        self, mock_home, mock_store, sample_data
+    ):
+        """Test Flow draws on a shared memory budget and returns it all."""
+        budget = MemoryBudget(1)
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=mock_store,
+            options={"queue_size": 5},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+        flow.memory = budget.account("test_flow")
+
+        await flow.start()
+
+        assert flow.total_rows == sum(len(df) for df in sample_data)
+        assert budget.used_bytes == 0
+        # Batches the home read ahead were charged to the same account
+        assert mock_home.memory is flow.memory
+
+    @pytest.mark.asyncio
+    async def test_flow_records_stage_timings(self, mock_home, mock_store, sample_data):
+        """Test Flow shares one StageTimings with home and store."""
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=mock_store,
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        assert mock_home.timings is flow.timings
+        assert mock_store.timings is flow.timings
+        stages = flow.timings.as_dict()
+        assert stages["read"]["count"] == len(sample_data)
+        assert stages["queue_wait"]["count"] == len(sample_data)
+        assert stages["finish"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flow_arrow_lane(self, sample_data):
+        """Test Arrow batches pass from home to store unconverted."""
+        store = ArrowMockStore("test_store")
+        flow = Flow(
+            name="test_flow",
+            home=ArrowHome("test_home", sample_data),
+            store=store,
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        assert flow.arrow_lane
+        assert all(isinstance(b, pa.RecordBatch) for b in store.written_data)
+        assert flow.total_rows == sum(len(df) for df in sample_data)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "reason", ["store_rejects", "polish", "disabled", "watermark"]
+    )
+    async def test_flow_arrow_lane_falls_back_to_polars(self, sample_data, reason):
+        """Test the Arrow lane is used only when every side allows it."""
+        store_class = MockStore if reason == "store_rejects" else ArrowMockStore
+        store = store_class("test_store")
+        if reason == "polish":
+            store._polisher = Mock()
+        flow = Flow(
+            name="test_flow",
+            home=ArrowHome("test_home", sample_data),
+            store=store,
+            options={"arrow_passthrough": reason != "disabled"},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+            watermark_config=(
+                {"primary_key": "id", "watermark_column": "updated_at"}
+                if reason == "watermark"
+                else None
+            ),
+        )
+
+        await flow.start()
+
+        assert not flow.arrow_lane
+        assert all(isinstance(df, pl.DataFrame) for df in store.written_data)
+        assert flow.total_rows == sum(len(df) for df in sample_data)
+
+    @pytest.mark.asyncio
+    async def test_flow_adaptive_batching_resizes_store(self, mock_home, sample_data):
+        """Test adaptive batching steers the store batch size within bounds."""
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=SetupMockStore("test_store", batch_size=150),
+            options={
+                "adaptive_batching": {
+                    "min_rows": 10,
+                    "max_rows": 50,
+                    "target_batch_bytes": 1,
+                }
+            },
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        # A 1-byte target drives both stages to min_rows
+        assert flow.store.batch_size == 10
+        assert flow.home.options["batch_size"] == 10
+        assert flow.total_rows == sum(len(df) for df in sample_data)
+
+    @pytest.mark.asyncio
+    async def test_flow_adaptive_batching_learns_from_flushes_only(self, mock_home):
+        """Test the store sizer sees save time, not time spent buffering."""
+        store = SetupMockStore("test_store", batch_size=150)
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=store,
+            options={"adaptive_batching": {"min_rows": 10, "max_rows": 1_000}},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+        observed = []
+        original = flow.store_sizer.observe
+        flow.store_sizer.observe = lambda rows, nbytes, seconds: (
+            observed.append((rows, seconds)) or original(rows, nbytes, seconds)
+        )
+
+        await flow.start()
+
+        # 250 rows in 150-row batches: one flush while writing, one at finish
+        assert [rows for rows, _ in observed] == [150, 100]
+        assert observed[0][1] >= 0.1  # The first save's one-time setup
+        assert store.rows_saved == 250
+
+    @pytest.mark.asyncio
+    async def test_flow_adaptive_batching_ignores_background_save_time(self, mock_home):
+        """Test stores that save in the background are sized by bytes only."""
+        store = SetupMockStore("test_store", batch_size=150)
+        store.saves_in_background = True
+        flow = Flow(
+            name="test_flow",
+            home=mock_home,
+            store=store,
+            options={"adaptive_batching": {"min_rows": 10, "max_rows": 1_000}},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        assert flow.store_sizer.bytes_per_row
+        assert flow.store_sizer.rows_per_second is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ordered", [True, False])
+    async def test_flow_parallel_consumers(self, ordered):
+        """Test several consumers prepare in parallel and count correctly."""
+        data = [
+            pl.DataFrame({"id": range(i * 10, i * 10 + 10), "value": [i] * 10})
+            for i in range(20)
+        ]
+        store = PreparingMockStore("test_store")
+        store.requires_ordered_writes = ordered
+        flow = Flow(
+            name="test_flow",
+            home=MockHome("test_home", data),
+            store=store,
+            options={"consumers": 4},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+            watermark_config={"primary_key": "id", "watermark_column": "id"},
+        )
+
+        await flow.start()
+
+        assert store.prepared_batches == 20
+        assert flow.total_rows == 200
+        assert flow.batches_processed == 20
+        assert flow.watermark.get_watermark_value() == 199
+        written_ids = [df["id"][0] for df in store.written_data]
+        if ordered:
+            assert written_ids == list(range(0, 200, 10))
+        else:
+            assert sorted(written_ids) == list(range(0, 200, 10))
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_flow_parallel_consumers_run_store_setup_once(self):
+        """Test concurrent consumers wait for the store's first save."""
+        data = [pl.DataFrame({"id": range(i * 50, i * 50 + 50)}) for i in range(40)]
+        store = SetupMockStore("test_store", batch_size=100)
+        flow = Flow(
+            name="test_flow",
+            home=MockHome("test_home", data),
+            store=store,
+            options={"consumers": 4},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        await flow.start()
+
+        assert store.setups == 1
+        assert store.rows_saved == 2000
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_flow_consumer_failure_cancels_siblings(self):
+        """Test a failing consumer stops the producer and the other consumers."""
+        data = [pl.DataFrame({"id": range(i * 10, i * 10 + 10)}) for i in range(20)]
+        cancelled = []
+
+        class FailingStore(MockStore):
+            async def write(self, df, prepared: bool = False):
+                if df["id"][0] == 30:
+                    raise ValueError("write failed")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(df["id"][0])
+                    raise
+
+        home = MockHome("test_home", data)
+        flow = Flow(
+            name="test_flow",
+            home=home,
+            store=FailingStore("test_store"),
+            options={"consumers": 4, "queue_size": 2},
+            entity_name="test_flow",
+            base_flow_name="test_flow",
+        )
+
+        with pytest.raises(FlowError, match="write failed"):
+            await flow.start()
+
+        # The three writes still in progress were cancelled, not left running
+        assert sorted(cancelled) == [0, 10, 20]
+
     @pytest.mark.asyncio
     @pytest.mark.timeout(30)
     async def test_flow_handles_empty_data(self):
@@ -644,6 +967,96 @@ class TestSimplifiedFlow:
         assert store.cleanup_staging_call_count == 2
 
 
+class TestFlowFileManifest:
+    """Test that incremental runs over a landing directory skip ingested files."""
+
+    @staticmethod
+    def _flow(
+        source: Path, journal, run_type: str, **options
+    ) -> "tuple[Flow, MockStore]":
+        from hygge.homes.local import LocalHome, LocalHomeConfig
+
+        home = LocalHome("landing", LocalHomeConfig(path=str(source)))
+        store = MockStore("test_store")
+        flow = Flow(
+            name="landing_flow_orders",
+            home=home,
+            store=store,
+            options=options,
+            journal=journal,
+            coordinator_run_id="coord_run",
+            flow_run_id="flow_run",
+            coordinator_name="coord",
+            base_flow_name="landing_flow",
+            entity_name="orders",
+            run_type=run_type,
+        )
+        return flow, store
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_incremental_run_reads_only_new_files(self, tmp_path):
+        from hygge.core.journal import Journal, JournalConfig
+
+        source = tmp_path / "landing"
+        source.mkdir()
+        pl.DataFrame({"id": [1, 2]}).write_parquet(source / "day1.parquet")
+        journal = Journal(
+            "journal", JournalConfig(path=str(tmp_path / "journal")), "coord"
+        )
+
+        flow, store = self._flow(source, journal, "incremental")
+        await flow.start()
+        assert sum(len(df) for df in store.written_data) == 2
+
+        pl.DataFrame({"id": [3]}).write_parquet(source / "day2.parquet")
+        flow, store = self._flow(source, journal, "incremental")
+        await flow.start()
+
+        written = pl.concat(store.written_data)
+        assert written["id"].to_list() == [3]
+        manifest = await journal.get_file_manifest("landing_flow", "orders")
+        assert set(manifest) == {"day1.parquet", "day2.parquet"}
+
+        # Nothing new: the next incremental run reads nothing
+        flow, store = self._flow(source, journal, "incremental")
+        await flow.start()
+        assert store.written_data == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_full_runs_skip_manifest_until_one_exists(self, tmp_path):
+        from hygge.core.journal import Journal, JournalConfig
+
+        source = tmp_path / "landing"
+        source.mkdir()
+        pl.DataFrame({"id": [1, 2]}).write_parquet(source / "day1.parquet")
+        journal = Journal(
+            "journal", JournalConfig(path=str(tmp_path / "journal")), "coord"
+        )
+
+        # A plain full load neither hashes nor records its files
+        with patch("hygge.core.flow.flow.plan_files") as plan_files:
+            flow, _ = self._flow(source, journal, "full_drop")
+            await flow.start()
+        plan_files.assert_not_called()
+        assert await journal.get_file_manifest("landing_flow", "orders") == {}
+
+        # Unless asked to
+        flow, _ = self._flow(source, journal, "full_drop", file_manifest=True)
+        await flow.start()
+        manifest = await journal.get_file_manifest("landing_flow", "orders")
+        assert set(manifest) == {"day1.parquet"}
+
+        # With a manifest in place, a full reload keeps it current
+        pl.DataFrame({"id": [3]}).write_parquet(source / "day2.parquet")
+        flow, store = self._flow(source, journal, "full_drop")
+        await flow.start()
+        assert sum(len(df) for df in store.written_data) == 3
+        manifest = await journal.get_file_manifest("landing_flow", "orders")
+        assert set(manifest) == {"day1.parquet", "day2.parquet"}
+
+
 class TestFlowConfigSafeAccess:
     """Test FlowConfig safe config access methods (no side effects)."""
 
@@ -6,12 +6,20 @@ and that format_to_suffix returns the correct extension.
 """
 
 import tempfile
+from io import BytesIO
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from hygge.core.formats import format_to_suffix
+from hygge.core import formats
+from hygge.core.formats import (
+    build_predicate,
+    compression_of,
+    encode,
+    file_patterns,
+    format_to_suffix,
+)
 from hygge.core.formats import read as format_read
 from hygge.core.formats import write as format_write
 
@@ -26,6 +34,10 @@ class TestFormatToSuffix:
     def test_ndjson_suffix(self):
         assert format_to_suffix("ndjson") == ".ndjson"
 
+    def test_arrow_suffix(self):
+        assert format_to_suffix("arrow") == ".arrow"
+        assert format_to_suffix("ipc") == ".arrow"
+
     def test_case_insensitive(self):
         assert format_to_suffix("PARQUET") == ".parquet"
         assert format_to_suffix("CSV") == ".csv"
@@ -50,6 +62,15 @@ class TestFormatReadWriteParquet:
         finally:
             path.unlink(missing_ok=True)
 
+    def test_read_parquet_batches_span_row_groups(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "groups.parquet"
+            df = pl.DataFrame({"a": range(1000)})
+            df.write_parquet(path, row_group_size=300)
+            batches = list(format_read(path, "parquet", batch_size=400))
+            assert [len(b) for b in batches] == [400, 400, 200]
+            assert pl.concat(batches)["a"].to_list() == list(range(1000))
+
     def test_write_parquet(self):
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "out.parquet"
@@ -59,6 +80,124 @@ class TestFormatReadWriteParquet:
             back = pl.read_parquet(path)
             assert back.equals(df)
 
+    def test_encode_parquet(self):
+        df = pl.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        data = encode(df, "parquet", compression="zstd")
+        assert pl.read_parquet(BytesIO(data)).equals(df)
+
+    def test_encode_arrow_table(self):
+        df = pl.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        data = encode(df.to_arrow(), "parquet")
+        assert pl.read_parquet(BytesIO(data)).equals(df)
+
+    def test_encode_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unknown format"):
+            encode(pl.DataFrame({"x": [1]}), "xlsx")
+
+
+class TestFormatReadWriteArrow:
+    @pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+    def test_round_trip(self, compression, tmp_path):
+        path = tmp_path / "out.arrow"
+        df = pl.DataFrame({"a": range(100), "b": [f"x{i}" for i in range(100)]})
+
+        format_write(df, path, "arrow", compression=compression)
+        batches = list(format_read(path, "ipc", batch_size=30))
+
+        assert [len(b) for b in batches] == [30, 30, 30, 10]
+        assert pl.concat(batches).equals(df)
+
+    def test_encode_arrow(self):
+        df = pl.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        data = encode(df.to_arrow(), "arrow", compression="lz4")
+        assert pl.read_ipc(BytesIO(data)).equals(df)
+
+
+class TestFormatReadCompressed:
+    """gzip and zstd compressed CSV/NDJSON stream like plain files."""
+
+    @pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+    @pytest.mark.parametrize("codec,ext", [("gzip", ".gz"), ("zstd", ".zst")])
+    def test_read_compressed(self, fmt, codec, ext, tmp_path):
+        import pyarrow as pa
+
+        df = pl.DataFrame({"a": range(50), "b": [f"x{i}" for i in range(50)]})
+        path = tmp_path / f"data{format_to_suffix(fmt)}{ext}"
+        with pa.CompressedOutputStream(str(path), codec) as out:
+            out.write(encode(df, fmt))
+
+        batches = list(format_read(path, fmt, batch_size=20))
+
+        assert compression_of(path) == codec
+        assert [len(b) for b in batches] == [20, 20, 10]
+        assert pl.concat(batches).equals(df)
+
+    @pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+    def test_read_compressed_without_streaming_scans(self, fmt, tmp_path, monkeypatch):
+        """Polars < 2.0: compressed files are read whole, then sliced."""
+        import pyarrow as pa
+
+        df = pl.DataFrame({"a": range(50), "b": [f"x{i}" for i in range(50)]})
+        path = tmp_path / f"data{format_to_suffix(fmt)}.gz"
+        with pa.CompressedOutputStream(str(path), "gzip") as out:
+            out.write(encode(df, fmt))
+        monkeypatch.setattr(formats, "_STREAMS_COMPRESSED", False)
+        monkeypatch.setattr(formats, "_read_scanned", None)  # Must not scan
+
+        batches = list(
+            format_read(
+                path, fmt, batch_size=20, columns=["a"], predicate=pl.col("a") >= 5
+            )
+        )
+
+        assert [len(b) for b in batches] == [20, 20, 5]
+        assert pl.concat(batches).equals(df.select("a").filter(pl.col("a") >= 5))
+
+    def test_compressed_parquet_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="gzip compressed parquet"):
+            list(format_read(tmp_path / "data.parquet.gz", "parquet"))
+
+    def test_file_patterns(self):
+        assert file_patterns("parquet") == ["*.parquet"]
+        assert file_patterns("csv") == ["*.csv", "*.csv.gz", "*.csv.zst", "*.csv.zstd"]
+
+
+class TestFormatReadPushdown:
+    """columns and predicate narrow what read() returns, for every format."""
+
+    @pytest.mark.parametrize("fmt", ["parquet", "csv", "ndjson", "arrow"])
+    def test_columns_and_predicate(self, fmt, tmp_path):
+        path = tmp_path / f"data{format_to_suffix(fmt)}"
+        df = pl.DataFrame({"a": range(100), "b": [f"x{i}" for i in range(100)]})
+        format_write(df, path, fmt)
+
+        batches = list(
+            format_read(
+                path,
+                fmt,
+                batch_size=30,
+                columns=["a"],
+                predicate=build_predicate("a >= 90"),
+            )
+        )
+
+        combined = pl.concat(batches)
+        assert combined.columns == ["a"]
+        assert combined["a"].to_list() == list(range(90, 100))
+
+    def test_predicate_matching_nothing_yields_no_batches(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"a": range(10)}).write_parquet(path)
+
+        assert list(format_read(path, "parquet", predicate=pl.col("a") > 100)) == []
+
+    def test_build_predicate_combines_conditions(self):
+        df = pl.DataFrame({"a": range(10)})
+
+        assert build_predicate() is None
+        predicate = build_predicate("a > 2", pl.col("a") < 5)
+        assert df.filter(predicate)["a"].to_list() == [3, 4]
+
 
 class TestFormatReadWriteCsv:
     def test_read_csv_yields_batches(self):
@@ -102,6 +241,30 @@ class TestFormatReadWriteNdjson:
         finally:
             path.unlink(missing_ok=True)
 
+    def test_read_ndjson_streams_ordered_batches(self, tmp_path):
+        """Blank lines are skipped; batches are full-size and in file order."""
+        path = tmp_path / "data.ndjson"
+        lines = [f'{{"a":{i}}}' for i in range(25)]
+        lines.insert(5, "")
+        lines.insert(12, "   ")
+        path.write_text("\n".join(lines) + "\n")
+
+        batches = list(format_read(path, "ndjson", batch_size=10))
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert pl.concat(batches)["a"].to_list() == list(range(25))
+
+    def test_read_ndjson_keeps_fields_first_seen_late(self, tmp_path):
+        """Schema inference covers a whole batch, not just the first lines."""
+        path = tmp_path / "data.ndjson"
+        lines = [f'{{"a":{i}}}' for i in range(500)] + ['{"a":500,"b":"late"}']
+        path.write_text("\n".join(lines) + "\n")
+
+        combined = pl.concat(list(format_read(path, "ndjson", batch_size=1000)))
+
+        assert combined.columns == ["a", "b"]
+        assert combined["b"].to_list()[-1] == "late"
+
     def test_write_ndjson(self):
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "out.ndjson"
@@ -15,6 +15,7 @@ import polars as pl
 import pytest
 
 from hygge.core.home import Home
+from hygge.core.memory import MemoryBudget
 
 
 class SimpleHome(Home, home_type="test"):
@@ -52,6 +53,16 @@ class ErrorHome(Home, home_type="error"):
         return f"/test/home/{self.name}"
 
 
+class ArrowHome(SimpleHome, home_type="test_arrow"):
+    """SimpleHome that also yields its data as Arrow record batches."""
+
+    supports_arrow = True
+
+    async def _get_arrow_batches(self):
+        for df in self.data:
+            yield df.to_arrow().to_batches()[0]
+
+
 class DelayedHome(Home, home_type="delayed"):
     """Test implementation with delays."""
 
@@ -199,6 +210,136 @@ class TestHomeDataReading:
         assert "Test error" in str(exc_info.value)
 
 
+class TestHomeArrowBatches:
+    """Test the Arrow read path."""
+
+    @pytest.mark.asyncio
+    async def test_read_arrow_yields_record_batches(self, sample_data):
+        import pyarrow as pa
+
+        home = ArrowHome("arrow", sample_data)
+
+        batches = [batch async for batch in home.read_arrow()]
+
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == sum(
+            len(df) for df in sample_data
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_arrow_not_supported_by_default(self, simple_home):
+        assert not simple_home.supports_arrow
+        with pytest.raises(NotImplementedError):
+            async for _ in simple_home.read_arrow():
+                pass
+
+
+class TestHomeReadAhead:
+    """Test that reads run ahead of the caller, within the prefetch bounds."""
+
+    class CountingHome(Home):
+        def __init__(self, batches: int, **options):
+            super().__init__("counting", options)
+            self.batches = batches
+            self.produced = 0
+            self.closed = False
+
+        async def _get_batches(self) -> AsyncIterator[pl.DataFrame]:
+            try:
+                for i in range(self.batches):
+                    self.produced += 1
+                    yield pl.DataFrame({"id": [i] * 1000})
+            finally:
+                self.closed = True
+
+        def get_data_path(self):
+            return "/test/path"
+
+    @pytest.mark.asyncio
+    async def test_reads_ahead_up_to_prefetch_batches(self):
+        home = self.CountingHome(10, prefetch=3)
+        reader = home.read()
+
+        first = await reader.__anext__()
+        await asyncio.sleep(0.01)
+
+        assert first["id"][0] == 0
+        # One handed out, three queued, one waiting for room
+        assert home.produced == 5
+        assert [b["id"][0] async for b in reader] == list(range(1, 10))
+
+    @pytest.mark.asyncio
+    async def test_prefetch_bytes_caps_read_ahead(self):
+        batch_bytes = pl.DataFrame({"id": [0] * 1000}).estimated_size()
+        home = self.CountingHome(10, prefetch=8, prefetch_bytes=batch_bytes)
+        reader = home.read()
+
+        await reader.__anext__()
+        await asyncio.sleep(0.01)
+
+        assert home.produced == 3
+        await reader.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_closes_the_home_generator(self):
+        home = self.CountingHome(100)
+        reader = home.read()
+
+        await reader.__anext__()
+        await reader.aclose()
+        await asyncio.sleep(0.01)
+
+        assert home.closed
+        assert home.produced < 100
+
+    @pytest.mark.asyncio
+    async def test_prefetch_zero_reads_on_demand(self):
+        home = self.CountingHome(10, prefetch=0)
+        reader = home.read()
+
+        await reader.__anext__()
+        await asyncio.sleep(0.01)
+
+        assert home.produced == 1
+        await reader.aclose()
+
+    @pytest.mark.asyncio
+    async def test_read_ahead_is_charged_to_the_memory_budget(self):
+        batch_bytes = pl.DataFrame({"id": [0] * 1000}).estimated_size()
+        budget = MemoryBudget(2 * batch_bytes)
+        home = self.CountingHome(10, prefetch=8)
+        home.memory = budget.account("counting")
+        reader = home.read()
+
+        await reader.__anext__()
+        await asyncio.sleep(0.01)
+
+        # Read-ahead stops at the budget, not at `prefetch`
+        assert home.produced == 3
+        assert budget.used_bytes == 2 * batch_bytes
+        # The batch handed out keeps its credit until the caller returns it
+        assert home.take_read_credit() == batch_bytes
+        assert home.take_read_credit() == 0
+
+        await reader.aclose()
+        await asyncio.sleep(0.01)
+        # Queued batches give theirs back; only the handed-out one is held
+        assert budget.used_bytes == batch_bytes
+
+    @pytest.mark.asyncio
+    async def test_error_surfaces_after_earlier_batches(self):
+        class FailingHome(self.CountingHome):
+            async def _get_batches(self):
+                yield pl.DataFrame({"id": [1]})
+                raise ValueError("disk gone")
+
+        batches = []
+        with pytest.raises(ValueError, match="disk gone"):
+            async for batch in FailingHome(0).read():
+                batches.append(batch)
+        assert len(batches) == 1
+
+
 class TestHomeLifecycle:
     """Test Home lifecycle management."""
 
@@ -18,6 +18,7 @@ import pytest
 from pydantic import ValidationError
 
 from hygge.core.journal import Journal, JournalConfig
+from hygge.core.manifest import FileEntry
 from hygge.stores.openmirroring import OpenMirroringStoreConfig
 from hygge.utility.exceptions import ConfigError
 from hygge.utility.run_id import generate_run_id
@@ -666,6 +667,93 @@ class TestJournalWatermark:
         watermark = await journal.get_watermark("users_flow", entity="users")
         assert watermark is None
 
+    @pytest.mark.asyncio
+    async def test_get_batch_sizes(self, journal, sample_entity_run_data):
+        """Test adaptive batch sizes come back from the last successful run."""
+        assert await journal.get_batch_sizes("users_flow", entity="users") is None
+
+        await journal.record_entity_run(
+            **sample_entity_run_data, home_batch_size=40_000, store_batch_size=80_000
+        )
+
+        sizes = await journal.get_batch_sizes("users_flow", entity="users")
+        assert sizes == {"home_batch_size": 40_000, "store_batch_size": 80_000}
+
+    @pytest.mark.asyncio
+    async def test_reads_journal_without_batch_size_columns(
+        self, journal, sample_entity_run_data
+    ):
+        """Test journals written before schema 1.1 still read and append."""
+        legacy_schema = {
+            name: dtype
+            for name, dtype in Journal.JOURNAL_SCHEMA.items()
+            if name not in ("home_batch_size", "store_batch_size")
+        }
+        await journal.record_entity_run(**sample_entity_run_data)
+        pl.read_parquet(journal.journal_path).select(list(legacy_schema)).write_parquet(
+            journal.journal_path
+        )
+
+        await journal.record_entity_run(**sample_entity_run_data, home_batch_size=5)
+
+        journal_df = pl.read_parquet(journal.journal_path)
+        assert journal_df["home_batch_size"].to_list() == [None, 5]
+        watermark = await journal.get_watermark("users_flow", entity="users")
+        assert watermark["watermark"] == "2024-01-01T09:00:00Z"
+
+
+class TestJournalFileManifest:
+    """Test the file manifest kept beside the journal."""
+
+    @pytest.mark.asyncio
+    async def test_manifest_round_trip_and_upsert(self, journal):
+        first = [
+            FileEntry("a.parquet", 10, 1.0, "h1"),
+            FileEntry("b.parquet", 20, 2.0, "h2"),
+        ]
+        await journal.record_file_manifest("orders_flow", "orders", first)
+        await journal.record_file_manifest(
+            "orders_flow", "orders", [FileEntry("b.parquet", 25, 3.0, "h3")]
+        )
+        await journal.record_file_manifest(
+            "orders_flow", "customers", [FileEntry("c.parquet", 5, 1.0, "h4")]
+        )
+
+        manifest = await journal.get_file_manifest("orders_flow", "orders")
+
+        assert journal.journal_path.with_name("manifest.parquet").exists()
+        assert manifest == {
+            "a.parquet": FileEntry("a.parquet", 10, 1.0, "h1"),
+            "b.parquet": FileEntry("b.parquet", 25, 3.0, "h3"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_replace_drops_entity_files_only(self, journal):
+        await journal.record_file_manifest(
+            "orders_flow", "orders", [FileEntry("a.parquet", 10, 1.0, "h1")]
+        )
+        await journal.record_file_manifest(
+            "orders_flow", "customers", [FileEntry("c.parquet", 5, 1.0, "h4")]
+        )
+
+        await journal.record_file_manifest(
+            "orders_flow",
+            "orders",
+            [FileEntry("z.parquet", 1, 1.0, "h9")],
+            replace=True,
+        )
+
+        assert list(await journal.get_file_manifest("orders_flow", "orders")) == [
+            "z.parquet"
+        ]
+        assert list(await journal.get_file_manifest("orders_flow", "customers")) == [
+            "c.parquet"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_manifest(self, journal):
+        assert await journal.get_file_manifest("orders_flow", "orders") == {}
+
 
 class TestJournalAggregations:
     """Test suite for journal aggregations."""
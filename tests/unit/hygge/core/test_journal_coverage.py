@@ -14,6 +14,13 @@ import pytest
 from hygge.core.journal import Journal, JournalConfig
 from hygge.utility.exceptions import ConfigError, JournalWriteError
 
+# Journals written before the adaptive batching columns were added
+JOURNAL_SCHEMA_1_0 = {
+    name: dtype
+    for name, dtype in Journal.JOURNAL_SCHEMA.items()
+    if name not in ("home_batch_size", "store_batch_size")
+}
+
 
 @pytest.fixture
 def temp_journal_dir(temp_dir):
@@ -74,7 +81,7 @@ class TestJournalErrorHandling:
                 "message": [None],
                 "schema_version": ["1.0"],
             },
-            schema=Journal.JOURNAL_SCHEMA,
+            schema=JOURNAL_SCHEMA_1_0,
         )
         existing_df.write_parquet(journal_path)
 
@@ -97,7 +104,9 @@ class TestJournalErrorHandling:
                 "watermark_type": [None],
                 "watermark": [None],
                 "message": [None],
-                "schema_version": ["1.0"],
+                "schema_version": ["1.1"],
+                "home_batch_size": [None],
+                "store_batch_size": [None],
             },
             schema=Journal.JOURNAL_SCHEMA,
         )
@@ -152,7 +161,9 @@ class TestJournalErrorHandling:
                     "watermark_type": [None],
                     "watermark": [None],
                     "message": [None],
-                    "schema_version": ["1.0"],
+                    "schema_version": ["1.1"],
+                    "home_batch_size": [None],
+                    "store_batch_size": [None],
                 },
                 schema=Journal.JOURNAL_SCHEMA,
             )
@@ -204,7 +215,9 @@ class TestJournalErrorHandling:
                     "watermark_type": [None],
                     "watermark": [None],
                     "message": [None],
-                    "schema_version": ["1.0"],
+                    "schema_version": ["1.1"],
+                    "home_batch_size": [None],
+                    "store_batch_size": [None],
                 },
                 schema=Journal.JOURNAL_SCHEMA,
             )
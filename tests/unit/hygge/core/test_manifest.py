@@ -0,0 +1,81 @@
+"""
+Tests for the file manifest used by incremental file loads.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on which files count as new or changed
+- Keep tests clear and maintainable
+"""
+
+import os
+
+from hygge.core.manifest import FileEntry, content_hash, manifest_key, plan_files
+
+
+def _write(path, data: bytes, mtime: float = 1_700_000_000.0):
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestPlanFiles:
+    """Test comparing files on disk with the manifest."""
+
+    def test_everything_is_new_without_a_manifest(self, tmp_path):
+        a = _write(tmp_path / "a.csv", b"1")
+        (tmp_path / "sub").mkdir()
+        b = _write(tmp_path / "sub" / "b.csv", b"2")
+
+        to_read, entries = plan_files([a, b], tmp_path, {})
+
+        assert to_read == [a, b]
+        assert [e.path for e in entries] == ["a.csv", "sub/b.csv"]
+        assert entries[0].content_hash == content_hash(a)
+
+    def test_unchanged_files_are_skipped(self, tmp_path):
+        a = _write(tmp_path / "a.csv", b"1")
+        _, entries = plan_files([a], tmp_path, {})
+        known = {e.path: e for e in entries}
+        new = _write(tmp_path / "new.csv", b"3")
+
+        to_read, entries = plan_files([a, new], tmp_path, known)
+
+        assert to_read == [new]
+        assert len(entries) == 2
+
+    def test_changed_content_is_read_again(self, tmp_path):
+        a = _write(tmp_path / "a.csv", b"1")
+        _, entries = plan_files([a], tmp_path, {})
+        known = {e.path: e for e in entries}
+
+        _write(a, b"changed", mtime=1_700_000_100.0)
+        to_read, entries = plan_files([a], tmp_path, known)
+
+        assert to_read == [a]
+        assert entries[0].size == len(b"changed")
+
+    def test_touched_file_with_same_content_is_not_read(self, tmp_path):
+        a = _write(tmp_path / "a.csv", b"1")
+        _, entries = plan_files([a], tmp_path, {})
+        known = {e.path: e for e in entries}
+
+        os.utime(a, (1_700_000_500.0, 1_700_000_500.0))
+        to_read, entries = plan_files([a], tmp_path, known)
+
+        assert to_read == []
+        # The new mtime is recorded so the file is not hashed next time
+        assert entries[0].mtime == 1_700_000_500.0
+
+    def test_matching_size_and_mtime_skips_hashing(self, tmp_path):
+        a = _write(tmp_path / "a.csv", b"1")
+        stat = a.stat()
+        known = {"a.csv": FileEntry("a.csv", stat.st_size, stat.st_mtime, "old")}
+
+        to_read, entries = plan_files([a], tmp_path, known)
+
+        assert to_read == []
+        assert entries[0].content_hash == "old"
+
+    def test_manifest_key_outside_base_is_absolute(self, tmp_path):
+        assert manifest_key(tmp_path / "x" / "a.csv", tmp_path) == "x/a.csv"
+        assert manifest_key(tmp_path / "a.csv", tmp_path / "y").startswith("/")
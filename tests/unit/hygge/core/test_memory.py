@@ -0,0 +1,96 @@
+"""
+Tests for the coordinator-wide memory budget.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on backpressure without deadlocks
+- Keep tests clear and maintainable
+"""
+
+import asyncio
+
+import pytest
+
+from hygge.core.memory import MemoryBudget, parse_bytes, resolve_memory_budget
+from hygge.utility.exceptions import ConfigError
+
+
+class TestParseBytes:
+    """Test byte sizes from config."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (1024, 1024),
+            ("1024", 1024),
+            ("512MB", 512 * 1024**2),
+            ("8 gb", 8 * 1024**3),
+            ("1.5G", int(1.5 * 1024**3)),
+            ("64K", 64 * 1024),
+        ],
+    )
+    def test_parses_sizes(self, value, expected):
+        assert parse_bytes(value) == expected
+
+    @pytest.mark.parametrize("value", ["lots", "8XB", "0", -5, "MB"])
+    def test_rejects_invalid_sizes(self, value):
+        with pytest.raises(ConfigError):
+            parse_bytes(value)
+
+    def test_disabled_by_default(self):
+        assert resolve_memory_budget(None) is None
+        assert resolve_memory_budget("1GB").limit_bytes == 1024**3
+
+
+class TestMemoryBudget:
+    """Test credit accounting and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_release(self):
+        budget = MemoryBudget(100)
+        account = budget.account("users")
+        await account.acquire(80)
+
+        waiter = asyncio.create_task(account.acquire(40))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        account.release(80)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert budget.used_bytes == 40
+
+    @pytest.mark.asyncio
+    async def test_idle_account_always_progresses(self):
+        """A flow with nothing in flight gets through even on a full budget."""
+        budget = MemoryBudget(100)
+        await budget.account("big").acquire(100)
+
+        small = budget.account("small")
+        await asyncio.wait_for(small.acquire(50), timeout=1)
+        assert budget.used_bytes == 150
+
+    @pytest.mark.asyncio
+    async def test_track_and_close_return_credit(self):
+        budget = MemoryBudget(100)
+        account = budget.account("users")
+        await account.acquire(30)
+        account.track(50)
+        account.track(20)
+        assert budget.used_bytes == 50
+
+        account.close()
+        assert budget.used_bytes == 0
+        assert account.held_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_admission_waits_for_headroom(self):
+        budget = MemoryBudget(100)
+        account = budget.account("users")
+        account.track(100)
+
+        admission = asyncio.create_task(budget.wait_for_headroom())
+        await asyncio.sleep(0.01)
+        assert not admission.done()
+
+        account.track(10)
+        await asyncio.wait_for(admission, timeout=1)
@@ -0,0 +1,102 @@
+"""
+Tests for reading several sources at once.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on batch order, bounded read-ahead and error handling
+- Keep tests clear and maintainable
+"""
+
+import threading
+import time
+
+import pytest
+
+from hygge.core.parallel_read import read_in_parallel
+
+
+def _reader(name: str, batches: int, delay: float = 0.0):
+    """A reader yielding `batches` labelled items, sleeping before each."""
+
+    def read():
+        for i in range(batches):
+            time.sleep(delay)
+            yield f"{name}{i}"
+
+    return read
+
+
+class TestReadInParallel:
+    """Test ordered and unordered parallel reads."""
+
+    @pytest.mark.asyncio
+    async def test_ordered_matches_sequential_order(self):
+        # The first reader is the slowest; order must not change
+        readers = [
+            _reader("a", 3, delay=0.02),
+            _reader("b", 2),
+            _reader("c", 1),
+            _reader("d", 2),
+        ]
+
+        batches = [b async for b in read_in_parallel(readers, workers=3)]
+
+        assert batches == ["a0", "a1", "a2", "b0", "b1", "c0", "d0", "d1"]
+
+    @pytest.mark.asyncio
+    async def test_unordered_yields_everything_as_ready(self):
+        readers = [_reader("slow", 2, delay=0.05), _reader("fast", 2)]
+
+        batches = [b async for b in read_in_parallel(readers, workers=2, ordered=False)]
+
+        assert sorted(batches) == ["fast0", "fast1", "slow0", "slow1"]
+        # The fast reader is not held back behind the slow one
+        assert batches[:2] == ["fast0", "fast1"]
+
+    @pytest.mark.asyncio
+    async def test_readers_run_at_most_workers_at_once(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def reader():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            yield 1
+            with lock:
+                running -= 1
+
+        batches = [b async for b in read_in_parallel([reader] * 6, workers=2)]
+
+        assert len(batches) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_reader_error_is_raised(self):
+        def broken():
+            yield "ok"
+            raise ValueError("bad file")
+
+        with pytest.raises(ValueError, match="bad file"):
+            async for _ in read_in_parallel([broken, _reader("b", 2)], workers=2):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_leaves_readers_bounded(self):
+        produced = []
+
+        def endless():
+            for i in range(1000):
+                produced.append(i)
+                yield i
+
+        async for batch in read_in_parallel([endless], workers=1, prefetch=2):
+            if batch == 0:
+                break
+
+        time.sleep(0.05)
+        # One yielded, a couple queued, at most one more in flight
+        assert len(produced) <= 5
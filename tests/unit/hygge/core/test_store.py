@@ -10,10 +10,12 @@ Following hygge's testing principles:
 
 import asyncio
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
 import polars as pl
 import pytest
 
+from hygge.connections.execution import CpuEngine
 from hygge.core.store import Store
 from hygge.utility.exceptions import StoreError
 
@@ -60,6 +62,12 @@ class SimpleStore(Store, store_type="test"):
         return Path(self.final_dir)
 
 
+class ArrowStore(SimpleStore, store_type="test_arrow"):
+    """SimpleStore whose writers take Arrow tables."""
+
+    accepts_arrow = True
+
+
 class FailingStore(Store, store_type="failing"):
     """Test implementation that fails during save."""
 
@@ -238,6 +246,25 @@ class TestStoreDataCollection:
         assert len(path_store.saved_paths) > 0  # Staging occurred
         assert path_store.current_df is not None  # Should have remaining data
 
+    @pytest.mark.asyncio
+    async def test_store_flushes_exact_batches_across_writes(
+        self, simple_store, sample_data
+    ):
+        """Test Store cuts exact batch_size slices across incoming chunks."""
+        simple_store.batch_size = 40
+
+        # Writes of 30 rows straddle the 40-row batch boundary
+        for offset in range(0, 90, 30):
+            await simple_store.write(sample_data.slice(offset, 30))
+
+        assert [len(df) for df in simple_store.saved_data] == [40, 40]
+        assert simple_store.buffer_size == 10
+        assert simple_store.saved_data[1]["id"].to_list() == list(range(40, 80))
+
+        await simple_store.finish()
+        assert [len(df) for df in simple_store.saved_data] == [40, 40, 10]
+        assert simple_store.current_df is None
+
     @pytest.mark.asyncio
     async def test_store_handles_multiple_writes(self, simple_store, sample_data):
         """Test Store handles multiple data writes."""
@@ -255,6 +282,52 @@ class TestStoreDataCollection:
         assert len(simple_store.current_df) == 100  # Accumulated
         assert simple_store.total_rows == 100
 
+    @pytest.mark.asyncio
+    async def test_store_prepares_each_batch_once(self, simple_store, sample_data):
+        """Test write() prepares batches unless the caller already did."""
+        calls = []
+
+        def prepare_batch(df):
+            calls.append(len(df))
+            return df.with_columns(pl.lit(1).alias("prepared"))
+
+        simple_store.prepare_batch = prepare_batch
+
+        await simple_store.write(sample_data.slice(0, 30))
+        await simple_store.write(
+            prepare_batch(sample_data.slice(30, 30)), prepared=True
+        )
+        await simple_store.finish()
+
+        assert calls == [30, 30]
+        assert simple_store.saved_data[0]["prepared"].to_list() == [1] * 60
+
+    @pytest.mark.asyncio
+    async def test_store_records_stage_timings(self, simple_store, sample_data):
+        """Test write()/finish() record polish and save spans."""
+        simple_store.batch_size = 50
+
+        await simple_store.write(sample_data.slice(0, 60))
+        await simple_store.finish()
+
+        stages = simple_store.timings.as_dict()
+        assert stages["polish"]["count"] == 1
+        assert stages["save"]["count"] == 2  # One full batch, one remainder
+
+    @pytest.mark.asyncio
+    async def test_store_reports_only_finished_saves(self, simple_store, sample_data):
+        """Test completed saves are reported once, and buffered writes not at all."""
+        simple_store.batch_size = 50
+
+        await simple_store.write(sample_data.slice(0, 30))
+        assert simple_store.take_completed_saves() == []
+
+        await simple_store.write(sample_data.slice(30, 30))
+        saves = simple_store.take_completed_saves()
+        assert [(rows, nbytes > 0) for rows, nbytes, _ in saves] == [(50, True)]
+        assert saves[0][2] >= 0
+        assert simple_store.take_completed_saves() == []
+
 
 class TestStoreStaging:
     """Test Store staging functionality."""
@@ -388,6 +461,74 @@ class TestStoreErrorHandling:
         assert "Save failed" in str(exc_info.value)
 
 
+class TestStoreArrowBatches:
+    """Test how Stores handle Arrow batches."""
+
+    @pytest.mark.asyncio
+    async def test_accepting_store_saves_arrow_tables(self, sample_data):
+        """Arrow batches reach _save as Arrow when the store accepts them."""
+        import pyarrow as pa
+
+        store = ArrowStore("arrow", batch_size=40)
+        assert store.arrow_passthrough
+
+        await store.write(sample_data.to_arrow().to_batches()[0])
+        await store.finish()
+
+        assert all(isinstance(saved, pa.Table) for saved in store.saved_data)
+        assert [saved.num_rows for saved in store.saved_data] == [40, 40, 20]
+        assert store.total_rows == 100
+
+    @pytest.mark.asyncio
+    async def test_other_stores_convert_arrow_to_polars(self, sample_data):
+        """Stores without an Arrow path (or with a polisher) get DataFrames."""
+        polished = ArrowStore("polished", batch_size=1000)
+        polished._polisher = Mock(apply=lambda df: df)
+        plain = SimpleStore("plain", batch_size=1000)
+
+        for store in (polished, plain):
+            assert not store.arrow_passthrough
+            await store.write(sample_data.to_arrow())
+            await store.finish()
+
+            assert len(store.saved_data) == 1
+            assert isinstance(store.saved_data[0], pl.DataFrame)
+            assert store.saved_data[0].equals(sample_data)
+
+
+class TestStorePrepareBatch:
+    """Test when batch preparation goes to the CPU pool."""
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_prepare_stays_on_the_loop(self, sample_data):
+        """Without a polisher or override, no batch goes to the CPU pool."""
+        store = SimpleStore("plain", batch_size=1000)
+        assert not store.prepares_batches
+
+        with patch.object(CpuEngine, "execute", new=AsyncMock()) as execute:
+            await store.write(sample_data)
+            await store.finish()
+
+        execute.assert_not_awaited()
+        assert store.saved_data[0].equals(sample_data)
+
+    @pytest.mark.asyncio
+    async def test_polished_batches_go_to_the_cpu_pool(self, sample_data):
+        """A polisher's work runs off the event loop."""
+        store = SimpleStore("polished", batch_size=1000)
+        store._polisher = Mock(apply=lambda df: df.with_columns(pl.lit(1).alias("p")))
+        assert store.prepares_batches
+
+        with patch.object(
+            CpuEngine, "execute", new=AsyncMock(side_effect=lambda f, d: f(d))
+        ) as execute:
+            await store.write(sample_data)
+            await store.finish()
+
+        execute.assert_awaited_once()
+        assert "p" in store.saved_data[0].columns
+
+
 class TestStoreConcurrency:
     """Test Store behavior in concurrent scenarios."""
 
@@ -420,6 +561,74 @@ class TestStoreConcurrency:
         assert True  # Success if we get here
 
 
+class SlowPathStore(PathStore, store_type="slow_path"):
+    """PathStore whose saves finish out of order."""
+
+    def __init__(self, name: str, fail_on: str = None, **kwargs):
+        super().__init__(name, "staging", "final", **kwargs)
+        self.fail_on = fail_on
+
+    async def _save(self, df: pl.DataFrame, path: str) -> None:
+        # Later files finish first to exercise ordering
+        await asyncio.sleep(0.01 if self.filename_count % 2 else 0.001)
+        if self.fail_on and path.endswith(self.fail_on):
+            raise StoreError("Upload failed")
+        self.saved_paths.append(path)
+
+
+class TestStoreWriteBehind:
+    """Test opt-in write-behind pipelining."""
+
+    def test_write_behind_defaults_to_inline(self):
+        store = SimpleStore("test")
+        assert store.max_inflight_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_write_behind_keeps_saves_in_flight(self, sample_data):
+        store = SlowPathStore("test", batch_size=10, max_inflight_writes=4)
+
+        await store.write(sample_data)
+
+        assert 0 < len(store._inflight_writes) <= 4
+        await store.finish()
+        assert store._inflight_writes == []
+        assert len(store.saved_paths) == 10
+
+    @pytest.mark.asyncio
+    async def test_write_behind_restores_filename_order(self, sample_data):
+        store = SlowPathStore("test", batch_size=10, max_inflight_writes=4)
+
+        await store.write(sample_data)
+        await store.finish()
+
+        names = [Path(p).name for p in store.saved_paths]
+        assert names == [f"test_{i}.parquet" for i in range(1, 11)]
+        moved = [Path(final).name for _, final in store.moved_files]
+        assert moved == names
+
+    @pytest.mark.asyncio
+    async def test_write_behind_propagates_errors(self, sample_data):
+        store = SlowPathStore(
+            "test", fail_on="test_3.parquet", batch_size=10, max_inflight_writes=4
+        )
+
+        with pytest.raises(StoreError, match="Upload failed"):
+            await store.write(sample_data)
+            await store.finish()
+
+        assert store._inflight_writes == []
+
+    @pytest.mark.asyncio
+    async def test_reset_cancels_inflight_writes(self, sample_data):
+        store = SlowPathStore("test", batch_size=10, max_inflight_writes=4)
+        await store.write(sample_data)
+
+        await store.reset_retry_sensitive_state()
+
+        assert store._inflight_writes == []
+        assert store.buffer_size == 0
+
+
 class TestStoreOptionalMethods:
     """Test optional store methods with default implementations."""
 
@@ -445,7 +654,6 @@ class TestStoreOptionalMethods:
         store = SimpleStore("test")
         # Set some state
         store.data_buffer = [pl.DataFrame({"a": [1, 2, 3]})]
-        store.buffer_size = 3
         store.total_rows = 3
         store.rows_written = 3
 
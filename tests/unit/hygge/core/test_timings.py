@@ -0,0 +1,77 @@
+"""
+Tests for per-stage timings.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on totals that explain where a run's time went
+- Keep tests clear and maintainable
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from hygge.core.timings import StageTimings, write_timings_report
+
+
+class TestStageTimings:
+    """Test span accumulation."""
+
+    def test_add_accumulates_seconds_and_counts(self):
+        timings = StageTimings()
+        timings.add("read", 1.5)
+        timings.add("read", 0.5)
+        timings.add("save", 2.0)
+
+        assert timings.as_dict() == {
+            "read": {"seconds": 2.0, "count": 2},
+            "save": {"seconds": 2.0, "count": 1},
+        }
+
+    @pytest.mark.asyncio
+    async def test_span_times_async_code(self):
+        timings = StageTimings()
+        with timings.span("upload"):
+            await asyncio.sleep(0.02)
+
+        assert timings.seconds["upload"] >= 0.015
+        assert timings.counts["upload"] == 1
+
+    def test_span_records_on_error(self):
+        timings = StageTimings()
+        with pytest.raises(ValueError):
+            with timings.span("encode"):
+                raise ValueError("bad batch")
+
+        assert timings.counts["encode"] == 1
+
+
+class TestTimingsReport:
+    """Test the machine-readable report."""
+
+    def test_writes_per_entity_stages(self, tmp_path):
+        flow_results = [
+            {
+                "name": "sales.orders",
+                "flow": "sales",
+                "entity": "orders",
+                "status": "pass",
+                "rows": 10,
+                "duration": 1.23456,
+                "timings": {"read": {"seconds": 0.5, "count": 2}},
+            }
+        ]
+
+        path = write_timings_report(
+            tmp_path / "nested" / "timings.json",
+            flow_results,
+            coordinator_run_id="run_1",
+            coordinator_name="project",
+        )
+
+        report = json.loads(path.read_text())
+        assert report["coordinator_run_id"] == "run_1"
+        assert report["flows"][0]["entity"] == "orders"
+        assert report["flows"][0]["duration"] == 1.2346
+        assert report["flows"][0]["stages"] == {"read": {"seconds": 0.5, "count": 2}}
@@ -0,0 +1,47 @@
+"""
+Tests for the consumer Turnstile.
+
+Following hygge's testing principles:
+- Test behavior that matters to users
+- Focus on writes staying in queue order
+- Keep tests clear and maintainable
+"""
+
+import asyncio
+
+import pytest
+
+from hygge.core.flow.turnstile import Turnstile
+
+
+class TestTurnstile:
+    """Test ticket ordering."""
+
+    @pytest.mark.asyncio
+    async def test_serves_in_ticket_order(self):
+        turnstile = Turnstile()
+        served = []
+
+        async def worker(ticket, delay):
+            await asyncio.sleep(delay)
+            await turnstile.wait(ticket)
+            served.append(ticket)
+            turnstile.advance()
+
+        tickets = [turnstile.take() for _ in range(4)]
+        await asyncio.gather(
+            *(worker(t, d) for t, d in zip(tickets, [0.03, 0.0, 0.02, 0.01]))
+        )
+
+        assert served == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_released_ticket_does_not_block_later_ones(self):
+        turnstile = Turnstile()
+        first, second, third = (turnstile.take() for _ in range(3))
+
+        turnstile.release(second)
+        await turnstile.wait(first)
+        turnstile.advance()
+
+        await asyncio.wait_for(turnstile.wait(third), timeout=1)
@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 import polars as pl
 import pytest
 
-from hygge.core.watermark import Watermark
+from hygge.core.watermark import Watermark, watermark_filter
 from hygge.messages import get_logger
 from hygge.utility.exceptions import ConfigError
 
@@ -356,3 +356,59 @@ class TestWatermarkReset:
         watermark.reset()
         assert watermark.get_watermark_value() is None
         assert watermark.get_watermark_type() is None
+
+
+class TestWatermarkFilter:
+    """Test watermark predicates for homes that read through Polars scans."""
+
+    @pytest.mark.parametrize(
+        "watermark,expected",
+        [
+            ({"watermark": "2", "watermark_type": "int"}, [3, 4]),
+            (
+                {"watermark": "2024-01-02T00:00:00", "watermark_type": "datetime"},
+                [3, 4],
+            ),
+            ({"watermark": "b", "watermark_type": "string"}, [3, 4]),
+        ],
+    )
+    def test_filter_selects_rows_past_watermark(self, watermark, expected):
+        df = pl.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "ts": [datetime(2024, 1, d) for d in (1, 2, 3, 4)],
+                "code": ["a", "b", "c", "d"],
+            }
+        )
+        column = {"int": "id", "datetime": "ts", "string": "code"}[
+            watermark["watermark_type"]
+        ]
+        expr = watermark_filter({**watermark, "watermark_column": column}, df.schema)
+
+        assert df.filter(expr)["id"].to_list() == expected
+
+    def test_datetime_filter_matches_column_time_zone(self):
+        df = pl.DataFrame(
+            {"ts": [datetime(2024, 1, d, tzinfo=timezone.utc) for d in (1, 2, 3)]}
+        )
+        watermark = {
+            "watermark": "2024-01-02T00:00:00",
+            "watermark_type": "datetime",
+            "watermark_column": "ts",
+        }
+
+        expr = watermark_filter(watermark, df.schema)
+
+        assert len(df.filter(expr)) == 1
+
+    @pytest.mark.parametrize(
+        "watermark",
+        [
+            {},
+            {"watermark": "5", "watermark_type": "int"},
+            {"watermark": "x", "watermark_type": "int", "watermark_column": "id"},
+            {"watermark": "1", "watermark_type": "float", "watermark_column": "id"},
+        ],
+    )
+    def test_incomplete_or_invalid_watermark_gives_none(self, watermark):
+        assert watermark_filter(watermark) is None
@@ -10,7 +10,7 @@ import pytest
 
 from hygge.core.home import Home
 from hygge.homes import LocalHome, LocalHomeConfig
-from hygge.utility import HomeError
+from hygge.utility import HomeError, HomeReadError
 
 
 class TestLocalHomeConfig:
@@ -50,6 +50,18 @@ class TestLocalHomePathResolution:
             assert len(paths) == 1
             assert paths[0].suffix == ".parquet"
 
+    def test_get_batch_paths_mixes_compressed_files(self, tmp_path):
+        for name in ("a.ndjson", "b.ndjson.gz", "c.ndjson.zst", "d.csv.gz"):
+            (tmp_path / name).write_bytes(b"")
+
+        home = LocalHome("test", LocalHomeConfig(path=str(tmp_path), format="ndjson"))
+
+        assert [p.name for p in home.get_batch_paths()] == [
+            "a.ndjson",
+            "b.ndjson.gz",
+            "c.ndjson.zst",
+        ]
+
     def test_nonexistent_path_raises(self):
         config = LocalHomeConfig(path="/nonexistent/local/home/path.parquet")
         home = LocalHome("test", config)
@@ -77,6 +89,20 @@ class TestLocalHomeRead:
         finally:
             Path(path).unlink(missing_ok=True)
 
+    @pytest.mark.asyncio
+    async def test_read_mixed_compressed_csv_directory(self, tmp_path):
+        import gzip
+
+        pl.DataFrame({"id": [1, 2]}).write_csv(tmp_path / "day1.csv")
+        (tmp_path / "day2.csv.gz").write_bytes(
+            gzip.compress(pl.DataFrame({"id": [3]}).write_csv().encode())
+        )
+
+        home = LocalHome("test", LocalHomeConfig(path=str(tmp_path), format="csv"))
+        combined = pl.concat([b async for b in home.read()])
+
+        assert combined["id"].to_list() == [1, 2, 3]
+
 
 class TestParquetAliasUsesLocalHome:
     """type: parquet in config should create LocalHome (backward compat)."""
@@ -88,3 +114,91 @@ class TestParquetAliasUsesLocalHome:
         home = Home.create("flow_home", config)
         assert type(home).__name__ == "LocalHome"
         assert home._format == "parquet"
+
+
+class TestLocalHomeParallelRead:
+    """read_workers > 1 reads several files of a directory at once."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("preserve_order", [True, False])
+    async def test_reads_every_file(self, tmp_path, preserve_order):
+        for i in range(5):
+            pl.DataFrame({"id": range(i * 30, (i + 1) * 30)}).write_parquet(
+                tmp_path / f"part_{i}.parquet"
+            )
+        config = LocalHomeConfig(
+            path=str(tmp_path),
+            batch_size=20,
+            read_workers=3,
+            preserve_order=preserve_order,
+        )
+        home = LocalHome("test", config)
+
+        ids = pl.concat([b async for b in home.read()])["id"].to_list()
+
+        if preserve_order:
+            assert ids == list(range(150))
+        else:
+            assert sorted(ids) == list(range(150))
+
+    @pytest.mark.asyncio
+    async def test_read_error_is_wrapped(self, tmp_path):
+        pl.DataFrame({"id": [1]}).write_parquet(tmp_path / "a.parquet")
+        (tmp_path / "b.parquet").write_bytes(b"not parquet")
+        config = LocalHomeConfig(path=str(tmp_path), read_workers=2)
+
+        with pytest.raises(HomeReadError):
+            async for _ in LocalHome("test", config).read():
+                pass
+
+
+class TestLocalHomePushdown:
+    """columns, filter and the journal watermark narrow what is read."""
+
+    @pytest.fixture
+    def orders(self, tmp_path):
+        pl.DataFrame(
+            {
+                "id": range(10),
+                "region": ["EU", "US"] * 5,
+                "amount": [i * 1.5 for i in range(10)],
+            }
+        ).write_parquet(tmp_path / "orders.parquet")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_columns_and_filter(self, orders):
+        config = LocalHomeConfig(
+            path=str(orders), columns=["id", "amount"], filter="region = 'EU'"
+        )
+
+        df = pl.concat([b async for b in LocalHome("test", config).read()])
+
+        assert df.columns == ["id", "amount"]
+        assert df["id"].to_list() == [0, 2, 4, 6, 8]
+
+    def test_invalid_filter_rejected(self):
+        with pytest.raises(ValueError, match="Invalid filter"):
+            LocalHomeConfig(path="data", filter="region = = 'EU'")
+
+    @pytest.mark.asyncio
+    async def test_read_with_watermark_reads_only_new_rows(self, orders):
+        config = LocalHomeConfig(path=str(orders), filter="region = 'EU'")
+        watermark = {
+            "watermark": "4",
+            "watermark_type": "int",
+            "watermark_column": "id",
+        }
+
+        home = LocalHome("test", config)
+        df = pl.concat([b async for b in home.read_with_watermark(watermark)])
+
+        assert df["id"].to_list() == [6, 8]
+
+    @pytest.mark.asyncio
+    async def test_read_with_watermark_without_value_reads_everything(self, orders):
+        home = LocalHome("test", LocalHomeConfig(path=str(orders)))
+
+        batches = [b async for b in home.read_with_watermark({"watermark": None})]
+
+        assert sum(len(b) for b in batches) == 10
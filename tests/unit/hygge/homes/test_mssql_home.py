@@ -12,6 +12,7 @@ from hygge.connections.constants import (
     MSSQL_CONNECTION_DEFAULTS,
 )
 from hygge.homes.mssql import MssqlHome, MssqlHomeConfig
+from hygge.utility.exceptions import HomeError
 
 
 class TestMssqlHomeConfig:
@@ -435,3 +436,110 @@ class TestMssqlHomeInitialization:
 
         assert home.options["batch_size"] == 25_000
         assert home.options["custom"] == "value"
+
+
+class TestMssqlHomePartitions:
+    """Test how partitioned reads split a query into key ranges."""
+
+    def _home(self, **config) -> MssqlHome:
+        return MssqlHome(
+            "test",
+            MssqlHomeConfig(
+                type="mssql", connection="test_db", table="dbo.sales", **config
+            ),
+        )
+
+    def test_config_validates_partition_settings(self):
+        with pytest.raises(ValueError, match="Invalid partition_column"):
+            self._home(partition_column="id; DROP TABLE x")
+        with pytest.raises(ValueError, match="strictly ascending"):
+            self._home(partition_column="id", partition_bounds=[10, 5])
+        with pytest.raises(ValueError, match="requires partition_column"):
+            self._home(partition_bounds=[10])
+
+    @pytest.mark.asyncio
+    async def test_unsafe_partition_column_is_rejected_at_build_time(self):
+        home = self._home(partition_column="sale_id", partition_bounds=[100])
+        # Assignment skips the config validator
+        home.config.partition_column = "sale_id) OR (1=1"
+
+        with pytest.raises(HomeError, match="Invalid partition_column"):
+            await home._partition_predicates("SELECT * FROM dbo.sales")
+
+    @pytest.mark.asyncio
+    async def test_no_partition_column_reads_one_query(self):
+        assert await self._home()._partition_predicates("SELECT 1") == [None]
+
+    @pytest.mark.asyncio
+    async def test_explicit_bounds_cover_every_row_once(self):
+        home = self._home(partition_column="sale_id", partition_bounds=[100, 200])
+
+        predicates = await home._partition_predicates("SELECT * FROM dbo.sales")
+
+        assert predicates == [
+            "(sale_id < 100 OR sale_id IS NULL)",
+            "sale_id >= 100 AND sale_id < 200",
+            "sale_id >= 200",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_minmax_discovery_splits_evenly(self, monkeypatch):
+        home = self._home(partition_column="sale_id", partitions=4)
+        queries = []
+
+        def fake_fetch(sql):
+            queries.append(sql)
+            return [(1, 1001)]
+
+        monkeypatch.setattr(home, "_fetch_rows_sync", fake_fetch)
+
+        predicates = await home._partition_predicates("SELECT * FROM dbo.sales;")
+
+        assert "MIN(sale_id), MAX(sale_id)" in queries[0]
+        assert "(SELECT * FROM dbo.sales) AS hygge_source" in queries[0]
+        assert predicates[1:] == [
+            "sale_id >= 251 AND sale_id < 501",
+            "sale_id >= 501 AND sale_id < 751",
+            "sale_id >= 751",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ntile_discovery_drops_repeated_bounds(self, monkeypatch):
+        home = self._home(
+            partition_column="region",
+            partitions=4,
+            partition_discovery="ntile",
+        )
+        queries = []
+
+        def fake_fetch(sql):
+            queries.append(sql)
+            return [("AMER",), ("EMEA",), ("EMEA",), ("O'Hare",)]
+
+        monkeypatch.setattr(home, "_fetch_rows_sync", fake_fetch)
+
+        predicates = await home._partition_predicates("SELECT * FROM dbo.sales")
+
+        assert "NTILE(4) OVER (ORDER BY region)" in queries[0]
+        assert predicates == [
+            "(region < N'EMEA' OR region IS NULL)",
+            "region >= N'EMEA' AND region < N'O''Hare'",
+            "region >= N'O''Hare'",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_source_is_not_partitioned(self, monkeypatch):
+        home = self._home(partition_column="sale_id")
+        monkeypatch.setattr(home, "_fetch_rows_sync", lambda sql: [(None, None)])
+
+        assert await home._partition_predicates("SELECT 1") == [None]
+
+    def test_sql_literals(self):
+        from datetime import date, datetime
+
+        assert MssqlHome._sql_literal(42) == "42"
+        assert MssqlHome._sql_literal(date(2024, 1, 2)) == "'2024-01-02'"
+        assert (
+            MssqlHome._sql_literal(datetime(2024, 1, 2, 3, 4, 5, 678901))
+            == "'2024-01-02T03:04:05.678'"
+        )
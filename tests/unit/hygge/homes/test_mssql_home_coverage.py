@@ -5,6 +5,8 @@ Focuses on error handling, edge cases, and complex methods that are currently
 under-tested. This file supplements test_mssql_home.py.
 """
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import polars as pl
@@ -233,6 +235,165 @@ class TestMssqlHomeErrorHandling:
         assert home._connection is None
 
 
+class TestMssqlHomePartitionedRead:
+    """Test partitions streaming over several connections at once."""
+
+    @pytest.mark.asyncio
+    async def test_partitions_merge_every_row_and_release_connections(self):
+        config = MssqlHomeConfig(
+            type="mssql",
+            connection="test_db",
+            table="dbo.sales",
+            partition_column="sale_id",
+            partition_bounds=[10, 20, 30],
+            partition_workers=2,
+            batch_size=4,
+        )
+        mock_pool = MagicMock()
+        mock_pool.size = 8
+        mock_pool.acquire = AsyncMock(side_effect=lambda: MagicMock())
+        mock_pool.release = AsyncMock()
+        home = MssqlHome("test", config, pool=mock_pool)
+        queries = []
+
+        def fake_extract(query, batch_size, connection=None):
+            queries.append(query)
+            assert connection is not None
+            start = 0 if "IS NULL" in query else int(query.split(">= ")[1][:2])
+            ids = list(range(start, start + 10))
+            for i in range(0, len(ids), batch_size):
+                batch = pl.DataFrame({"sale_id": ids[i : i + batch_size]})
+                yield batch, len(batch)
+
+        with patch.object(home, "_extract_batches_sync", side_effect=fake_extract):
+            batches = [b async for b in home._stream_query(home._build_query())]
+
+        ids = sorted(pl.concat(batches)["sale_id"].to_list())
+        assert ids == list(range(40))
+        assert len(queries) == 4
+        # One connection for the query itself, one per worker
+        assert mock_pool.acquire.await_count == 3
+        assert mock_pool.release.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_partition_error_surfaces_as_read_error(self):
+        config = MssqlHomeConfig(
+            type="mssql",
+            connection="test_db",
+            table="dbo.sales",
+            partition_column="sale_id",
+            partition_bounds=[10],
+        )
+        mock_pool = MagicMock()
+        mock_pool.size = 2
+        mock_pool.acquire = AsyncMock(side_effect=lambda: MagicMock())
+        mock_pool.release = AsyncMock()
+        home = MssqlHome("test", config, pool=mock_pool)
+
+        def failing_extract(query, batch_size, connection=None):
+            raise ValueError("deadlock victim")
+            yield  # Make it a generator
+
+        with patch.object(home, "_extract_batches_sync", side_effect=failing_extract):
+            with pytest.raises(HomeReadError, match="deadlock victim"):
+                async for _ in home._stream_query(home._build_query()):
+                    pass
+
+        assert mock_pool.release.await_count == mock_pool.acquire.await_count
+
+    @pytest.mark.asyncio
+    async def test_partition_error_stops_other_partitions_first(self):
+        config = MssqlHomeConfig(
+            type="mssql",
+            connection="test_db",
+            table="dbo.sales",
+            partition_column="sale_id",
+            partition_bounds=[10],
+        )
+        mock_pool = MagicMock()
+        mock_pool.size = 2
+        mock_pool.acquire = AsyncMock(side_effect=lambda: MagicMock())
+        home = MssqlHome("test", config, pool=mock_pool)
+        closed = threading.Event()
+        endless_connection = []
+        released = {}
+
+        async def release(connection):
+            released[id(connection)] = closed.is_set()
+
+        mock_pool.release = AsyncMock(side_effect=release)
+
+        def extract(query, batch_size, connection=None):
+            if "IS NULL" not in query:
+                raise ValueError("deadlock victim")
+            endless_connection.append(connection)
+            try:
+                while True:
+                    yield pl.DataFrame({"sale_id": [1]}), 1
+            finally:
+                closed.set()
+
+        with patch.object(home, "_extract_batches_sync", side_effect=extract):
+            with pytest.raises(HomeReadError, match="deadlock victim"):
+                async for _ in home._stream_query(home._build_query()):
+                    await asyncio.sleep(0.01)
+
+        # The endless read was stopped before its connection went back
+        assert closed.is_set()
+        assert released[id(endless_connection[0])] is True
+        assert mock_pool.release.await_count == mock_pool.acquire.await_count
+
+
+class TestMssqlHomeArrowReader:
+    """Test the arrow-odbc extraction path."""
+
+    @staticmethod
+    def _pool(reader="pyodbc", batches=()):
+        mock_pool = MagicMock()
+        mock_pool.size = 2
+        mock_pool.acquire = AsyncMock(side_effect=lambda: MagicMock())
+        mock_pool.release = AsyncMock()
+        mock_pool.connection_factory.reader = reader
+        mock_pool.connection_factory.read_arrow_batches.side_effect = (
+            lambda query, batch_size: iter(batches)
+        )
+        return mock_pool
+
+    def test_reader_comes_from_connection_unless_home_overrides(self):
+        config = MssqlHomeConfig(type="mssql", connection="db", table="dbo.t")
+        assert MssqlHome("a", config, pool=self._pool()).supports_arrow is False
+        home = MssqlHome("b", config, pool=self._pool("arrow_odbc"))
+        assert home.supports_arrow is True
+
+        config = MssqlHomeConfig(
+            type="mssql", connection="db", table="dbo.t", reader="pyodbc"
+        )
+        home = MssqlHome("c", config, pool=self._pool("arrow_odbc"))
+        assert home.supports_arrow is False
+
+    @pytest.mark.asyncio
+    async def test_arrow_batches_become_dataframes_or_pass_through(self):
+        pa = pytest.importorskip("pyarrow")
+        batches = [pa.record_batch({"id": [1, 2]}), pa.record_batch({"id": [3]})]
+        config = MssqlHomeConfig(
+            type="mssql", connection="db", table="dbo.t", reader="arrow_odbc"
+        )
+        mock_pool = self._pool(batches=batches)
+        home = MssqlHome("test", config, pool=mock_pool)
+
+        frames = [df async for df in home.read()]
+        arrow = [batch async for batch in home.read_arrow()]
+
+        assert all(isinstance(df, pl.DataFrame) for df in frames)
+        assert pl.concat(frames)["id"].to_list() == [1, 2, 3]
+        assert arrow == batches
+        mock_pool.connection_factory.read_arrow_batches.assert_called_with(
+            "SELECT * FROM dbo.t", config.batch_size
+        )
+        # The pool slot is still held and handed back
+        assert mock_pool.release.await_count == mock_pool.acquire.await_count
+
+
 class TestMssqlHomeWatermarkEdgeCases:
     """Test watermark handling edge cases."""
 
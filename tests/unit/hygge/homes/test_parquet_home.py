@@ -11,10 +11,12 @@ Following hygge's testing principles:
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 
+from hygge.core.parallel_read import read_in_parallel
 from hygge.homes import ParquetHome, ParquetHomeConfig
 from hygge.utility import HomeError
 
@@ -189,6 +191,20 @@ class TestParquetHomeDataReading:
         finally:
             os.unlink(tmp_path)
 
+    @pytest.mark.asyncio
+    async def test_read_yields_batch_size_batches_in_order(self, tmp_path):
+        """Batches are exactly batch_size rows, in file order, across row groups."""
+        path = tmp_path / "rows.parquet"
+        pl.DataFrame({"id": range(1000)}).write_parquet(path, row_group_size=300)
+
+        config = ParquetHomeConfig(path=str(path), batch_size=400)
+        home = ParquetHome("test_home", config)
+
+        batches = [batch async for batch in home.read()]
+
+        assert [len(batch) for batch in batches] == [400, 400, 200]
+        assert pl.concat(batches)["id"].to_list() == list(range(1000))
+
     @pytest.mark.asyncio
     async def test_read_multiple_parquet_files(self):
         """Test reading from multiple parquet files in directory.
@@ -322,6 +338,103 @@ class TestParquetHomeDataReading:
             os.unlink(tmp_path)
 
 
+class TestParquetHomePushdown:
+    """Test columns, filter and watermark pushdown into the scan."""
+
+    @pytest.mark.asyncio
+    async def test_read_with_watermark_and_columns(self, tmp_path):
+        """Only rows past the watermark, and only the configured columns."""
+        path = tmp_path / "events.parquet"
+        pl.DataFrame(
+            {"id": range(100), "kind": ["a", "b"] * 50, "payload": ["x"] * 100}
+        ).write_parquet(path, row_group_size=10)
+        config = ParquetHomeConfig(
+            path=str(path), columns=["id", "kind"], filter="kind = 'a'"
+        )
+        watermark = {
+            "watermark": "89",
+            "watermark_type": "int",
+            "watermark_column": "id",
+        }
+
+        home = ParquetHome("test_home", config)
+        df = pl.concat([b async for b in home.read_with_watermark(watermark)])
+
+        assert df.columns == ["id", "kind"]
+        assert df["id"].to_list() == [90, 92, 94, 96, 98]
+
+    @pytest.mark.asyncio
+    async def test_selected_files_keep_partition_columns(self, tmp_path):
+        """A scan of selected files reads only them, with hive columns kept."""
+        for day in ("2024-01-01", "2024-01-02"):
+            partition = tmp_path / f"day={day}"
+            partition.mkdir()
+            pl.DataFrame({"id": [1, 2]}).write_parquet(partition / "part.parquet")
+
+        home = ParquetHome("test_home", ParquetHomeConfig(path=str(tmp_path)))
+        home.selected_files = [tmp_path / "day=2024-01-02" / "part.parquet"]
+        df = pl.concat([b async for b in home.read()])
+
+        assert df["day"].cast(pl.Utf8).unique().to_list() == ["2024-01-02"]
+
+        home.selected_files = []
+        assert [b async for b in home.read()] == []
+
+
+class TestParquetHomeParallelRead:
+    """read_workers > 1 scans the files of a directory separately, several at once."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("preserve_order", [True, False])
+    async def test_reads_every_file(self, tmp_path, preserve_order):
+        for i in range(5):
+            pl.DataFrame({"id": range(i * 30, (i + 1) * 30)}).write_parquet(
+                tmp_path / f"part_{i}.parquet"
+            )
+        config = ParquetHomeConfig(
+            path=str(tmp_path),
+            batch_size=20,
+            read_workers=3,
+            preserve_order=preserve_order,
+        )
+        home = ParquetHome("test_home", config)
+
+        with patch(
+            "hygge.homes.parquet.home.read_in_parallel", wraps=read_in_parallel
+        ) as reads:
+            ids = pl.concat([b async for b in home.read()])["id"].to_list()
+
+        readers, workers = reads.call_args.args
+        assert (len(readers), workers) == (5, 3)
+        assert reads.call_args.kwargs == {"ordered": preserve_order}
+        if preserve_order:
+            assert ids == list(range(150))
+        else:
+            assert sorted(ids) == list(range(150))
+
+    @pytest.mark.asyncio
+    async def test_file_scans_match_the_directory_scan(self, tmp_path):
+        """Partition columns, types and pushdown match the single scan."""
+        for day in ("2024-01-01", "2024-01-02", "2024-01-03"):
+            partition = tmp_path / f"day={day}"
+            partition.mkdir()
+            pl.DataFrame({"id": [1, 2, 3], "kind": ["a", "b", "a"]}).write_parquet(
+                partition / "part.parquet"
+            )
+
+        async def read(workers):
+            config = ParquetHomeConfig(
+                path=str(tmp_path), filter="kind = 'a'", read_workers=workers
+            )
+            return pl.concat([b async for b in ParquetHome("h", config).read()])
+
+        combined, parallel = await read(1), await read(3)
+
+        assert parallel.schema == combined.schema
+        assert parallel.equals(combined)
+        assert parallel.height == 6
+
+
 class TestParquetHomeConfiguration:
     """Test ParquetHome configuration system integration."""
 
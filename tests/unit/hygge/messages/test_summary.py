@@ -116,3 +116,26 @@ class TestSummary:
 
         # Should handle zero rows gracefully
         summary.generate_summary(flow_results, start_time=time.monotonic())
+
+    def test_generate_summary_shows_stage_timings(self):
+        """Test that the busiest stages are listed per flow."""
+        mock_logger = Mock()
+        summary = Summary(logger=mock_logger)
+
+        flow_results = [
+            {
+                "name": "flow1",
+                "status": "pass",
+                "rows": 100,
+                "duration": 3.0,
+                "timings": {
+                    "read": {"seconds": 2.0, "count": 4},
+                    "save": {"seconds": 0.5, "count": 1},
+                },
+            }
+        ]
+
+        summary.generate_summary(flow_results, start_time=time.monotonic())
+
+        logged = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert "   • flow1: read 2.0s · save 0.5s" in logged
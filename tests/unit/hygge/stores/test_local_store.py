@@ -49,6 +49,25 @@ class TestLocalStoreWrite:
             back = pl.read_csv(files[0])
             assert back.equals(df)
 
+    @pytest.mark.asyncio
+    async def test_write_arrow_round_trips_through_local_home(self, tmp_path):
+        from hygge.homes import LocalHome, LocalHomeConfig
+
+        config = LocalStoreConfig(
+            path=str(tmp_path),
+            format="arrow",
+            format_options={"compression": "zstd"},
+        )
+        store = LocalStore("test", config)
+        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        await store.write(df)
+        await store.finish()
+
+        files = list(tmp_path.glob("*.arrow"))
+        assert len(files) == 1
+        home = LocalHome("test", LocalHomeConfig(path=str(tmp_path), format="arrow"))
+        assert pl.concat([b async for b in home.read()]).equals(df)
+
 
 class TestParquetAliasUsesLocalStore:
     """type: parquet in config should create LocalStore (backward compat)."""
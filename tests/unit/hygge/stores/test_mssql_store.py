@@ -2,14 +2,21 @@
 Unit tests for MS SQL Server store implementation.
 """
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import polars as pl
+import pyodbc
 import pytest
 
 from hygge.connections.pool import ConnectionPool
 from hygge.stores.mssql.store import MssqlStore, MssqlStoreConfig
-from hygge.utility.exceptions import StoreError
+from hygge.utility.exceptions import (
+    StoreConnectionError,
+    StoreError,
+    StoreWriteError,
+)
 
 
 class TestMssqlStoreConfig:
@@ -420,6 +427,7 @@ class TestAtomicTempTableOperations:
         self.store._write_chunk_to_temp = AsyncMock()
 
         await self.store._save(df)
+        await self.store._stop_writers()
 
         # Should create temp table (not production)
         self.store._create_table.assert_called_once_with(
@@ -454,6 +462,484 @@ class TestAtomicTempTableOperations:
         self.store._create_table.assert_called_once()
 
 
+class TestWriterWorkers:
+    """Test persistent writer workers pulling chunks across batches."""
+
+    def setup_method(self):
+        config = MssqlStoreConfig(
+            connection="test_db",
+            table="dbo.Test",
+            if_exists="replace",
+            parallel_workers=2,
+            commit_rows=4,
+        )
+        self.store = MssqlStore("test", config)
+        self.store.pool = MagicMock(spec=ConnectionPool)
+        self.connections = []
+
+        async def acquire():
+            self.connections.append(MagicMock())
+            return self.connections[-1]
+
+        self.store.pool.acquire = AsyncMock(side_effect=acquire)
+        self.store.pool.release = AsyncMock()
+        self.store._ensure_temp_table_exists = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_writers_hold_connections_across_batches(self):
+        inserted = []
+        self.store._insert_batch_to_temp = MagicMock(
+            side_effect=lambda conn, df, commit: inserted.extend(df["id"])
+        )
+
+        for start in range(0, 30, 10):
+            await self.store._save(pl.DataFrame({"id": range(start, start + 10)}))
+        await self.store.finish()
+
+        assert sorted(inserted) == list(range(30))
+        # One connection per writer for the whole run, committed in intervals
+        assert self.store.pool.acquire.await_count == 2
+        assert self.store.pool.release.await_count == 2
+        assert all(
+            not call.args[2] for call in self.store._insert_batch_to_temp.mock_calls
+        )
+        assert sum(conn.commit.call_count for conn in self.connections) >= 6
+
+    @pytest.mark.asyncio
+    async def test_chunks_follow_writer_count_and_writers_are_timed(self):
+        self.store.pool.pool_size = 1  # Caps the two configured writers at one
+        chunks = []
+        self.store._insert_batch_to_temp = MagicMock(
+            side_effect=lambda conn, df, commit: chunks.append(len(df))
+        )
+
+        await self.store._save(pl.DataFrame({"id": range(10)}))
+        await self.store.finish()
+
+        assert len(self.store._writers) == 0
+        assert chunks == [10]
+        stages = self.store.timings.as_dict()
+        assert stages["insert"]["count"] == 1
+        assert stages["commit"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_chunk_does_not_hold_back_the_next_batch(self):
+        release = asyncio.Event()
+        written = []
+
+        async def write_chunk(chunk, connection, arrow_connection=None):
+            if not written:
+                await release.wait()  # The first chunk stalls
+            written.append(len(chunk))
+
+        self.store._write_chunk_to_temp = write_chunk
+
+        await self.store._save(pl.DataFrame({"id": range(10)}))
+        await self.store._save(pl.DataFrame({"id": range(10)}))
+
+        # Both batches were queued while the first chunk was still writing
+        assert written == []
+        release.set()
+        await self.store._stop_writers()
+        assert sum(written) == 20
+
+    @pytest.mark.asyncio
+    async def test_chunk_error_surfaces_in_finish(self):
+        self.store._insert_batch_to_temp = MagicMock(
+            side_effect=RuntimeError("deadlock victim")
+        )
+
+        await self.store._save(pl.DataFrame({"id": range(10)}))
+        with pytest.raises(StoreWriteError, match="deadlock victim"):
+            await self.store.finish()
+
+        assert self.store._writers == []
+        # Failed connections are rolled back and discarded, not pooled again
+        discarded = [call.args[0] for call in self.store.pool.discard.await_args_list]
+        assert discarded
+        assert all(conn.rollback.called for conn in discarded)
+        assert (
+            self.store.pool.release.await_count + len(discarded)
+            == self.store.pool.acquire.await_count
+        )
+        assert not any(conn.commit.called for conn in self.connections)
+
+    @pytest.mark.asyncio
+    async def test_cancel_waits_for_insert_before_discarding(self):
+        started = threading.Event()
+        gate = threading.Event()
+        finished = []
+
+        def insert(conn, df, commit):
+            started.set()
+            gate.wait(5)
+            finished.append(len(df))
+
+        self.store._insert_batch_to_temp = MagicMock(side_effect=insert)
+
+        await self.store._save(pl.DataFrame({"id": range(2)}))
+        await asyncio.to_thread(started.wait, 5)
+        cancelling = asyncio.create_task(self.store._cancel_writes())
+        await asyncio.sleep(0.05)
+
+        # The insert thread still holds its connection
+        assert not cancelling.done()
+        self.store.pool.discard.assert_not_awaited()
+
+        gate.set()
+        await cancelling
+
+        assert finished
+        assert self.store.pool.discard.await_count == len(finished)
+        self.store.pool.release.assert_not_awaited()
+
+
+class TestMergeMode:
+    """Test if_exists='merge' upserts from temp to production."""
+
+    def setup_method(self):
+        config = MssqlStoreConfig(
+            connection="test_db",
+            table="dbo.Test",
+            if_exists="merge",
+            key_columns=["id"],
+            merge_batch_rows=2,
+        )
+        self.store = MssqlStore("test", config)
+        self.store._columns_written = dict.fromkeys(["id", "name"])
+        self.connection = MagicMock()
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.rowcount = 1
+
+    def test_merge_requires_key_columns(self):
+        with pytest.raises(ValueError, match="requires key_columns"):
+            MssqlStoreConfig(connection="test_db", table="dbo.Test", if_exists="merge")
+
+    @pytest.mark.asyncio
+    async def test_swap_merges_into_existing_production(self):
+        self.store.pool = MagicMock(spec=ConnectionPool)
+        self.store.pool.acquire = AsyncMock(return_value=self.connection)
+        self.store.pool.release = AsyncMock()
+        self.store._table_exists_for_name = AsyncMock(return_value=True)
+        self.store._merge_temp_to_production = AsyncMock()
+        self.store._drop_table_atomic = AsyncMock()
+
+        await self.store._swap_temp_to_production()
+
+        self.store._merge_temp_to_production.assert_awaited_once_with(self.connection)
+        self.store._drop_table_atomic.assert_awaited_once_with(
+            self.connection, "dbo.Test_hygge_tmp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_merge_updates_changed_and_inserts_new_per_key_range(self):
+        # No repeated keys; 5 temp rows in ranges of 2 -> NTILE(3)
+        self.cursor.fetchone.side_effect = [None, (5,)]
+        self.cursor.fetchall.return_value = [(1,), (3,), (5,)]
+
+        await self.store._merge_temp_to_production(self.connection)
+
+        statements = [c.args for c in self.cursor.execute.call_args_list]
+        updates = [args for args in statements if args[0].startswith("UPDATE")]
+        inserts = [args for args in statements if args[0].startswith("INSERT")]
+        assert len(updates) == len(inserts) == 3
+        assert "SET [name] = t.[name]" in updates[0][0]
+        assert "EXCEPT SELECT p.[name]" in updates[0][0]
+        assert "WHERE NOT EXISTS (SELECT 1 FROM [dbo].[Test] AS p" in inserts[0][0]
+        assert [args[1] for args in inserts] == [[3], [3, 5], [5]]
+        assert inserts[0][0].endswith("AND (t.[id] < ? OR t.[id] IS NULL)")
+        assert self.connection.commit.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_merge_rejects_repeated_keys(self):
+        self.cursor.fetchone.side_effect = [(1,)]
+
+        with pytest.raises(StoreError, match="repeat"):
+            await self.store._merge_temp_to_production(self.connection)
+
+        self.connection.rollback.assert_called_once()
+        self.connection.commit.assert_not_called()
+
+
+class TestTableLayout:
+    """Test created table indexes and append paths into production."""
+
+    def setup_method(self):
+        self.connection = MagicMock()
+        self.cursor = self.connection.cursor.return_value
+
+    def _store(self, **kwargs):
+        config = MssqlStoreConfig(connection="test_db", table="dbo.Test", **kwargs)
+        store = MssqlStore("test", config)
+        store.pool = MagicMock(spec=ConnectionPool)
+        return store
+
+    def test_rowstore_requires_clustered_index(self):
+        with pytest.raises(ValueError, match="requires clustered_index"):
+            MssqlStoreConfig(
+                connection="test_db", table="dbo.Test", table_index="rowstore"
+            )
+
+    @pytest.mark.asyncio
+    async def test_created_table_index(self):
+        df = pl.DataFrame({"id": [1], "name": ["A"]})
+
+        store = self._store(table_index="rowstore", clustered_index=["id"])
+        await store._create_table(self.connection, df)
+        ddl = self.cursor.execute.call_args[0][0]
+        assert "INDEX CIX_Test CLUSTERED ([id])" in ddl
+        assert "COLUMNSTORE" not in ddl
+
+        store = self._store(table_index="heap")
+        await store._create_table(self.connection, df)
+        ddl = self.cursor.execute.call_args[0][0]
+        assert "INDEX" not in ddl
+        assert "[name] NVARCHAR(4000) NULL\n);" in ddl
+
+    @pytest.mark.asyncio
+    async def test_append_insert_uses_append_hints(self):
+        store = self._store(if_exists="append", append_hints="TABLOCK")
+
+        await store._append_temp_to_production(self.connection)
+
+        sql = self.cursor.execute.call_args[0][0]
+        assert sql == (
+            "INSERT INTO [dbo].[Test] WITH (TABLOCK) "
+            "SELECT * FROM [dbo].[Test_hygge_tmp]"
+        )
+
+    @pytest.mark.asyncio
+    async def test_switch_moves_partitions_into_production(self):
+        store = self._store(if_exists="append", append_method="switch")
+        self.cursor.fetchall.side_effect = [
+            [("CLUSTERED COLUMNSTORE",)],  # Production indexes
+            [(4,), (3,)],  # Partitions the new rows fall in
+        ]
+        self.cursor.fetchone.side_effect = [("ps_month", "pf_month", "month"), (0,)]
+
+        assert await store._switch_temp_into_production(self.connection) is True
+
+        statements = [c.args[0] for c in self.cursor.execute.call_args_list]
+        assert statements[-3:] == [
+            "CREATE CLUSTERED COLUMNSTORE INDEX [CCI_Test_hygge_tmp] "
+            "ON [dbo].[Test_hygge_tmp] ON [ps_month]([month])",
+            "ALTER TABLE [dbo].[Test_hygge_tmp] SWITCH PARTITION 3 "
+            "TO [dbo].[Test] PARTITION 3",
+            "ALTER TABLE [dbo].[Test_hygge_tmp] SWITCH PARTITION 4 "
+            "TO [dbo].[Test] PARTITION 4",
+        ]
+        self.connection.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_switch_falls_back_to_insert(self):
+        store = self._store(if_exists="append", append_method="switch")
+        store.pool.acquire = AsyncMock(return_value=self.connection)
+        store.pool.release = AsyncMock()
+        store._table_exists_for_name = AsyncMock(return_value=True)
+        store._append_temp_to_production = AsyncMock()
+        store._drop_table_atomic = AsyncMock()
+        # Not partitioned: nothing switched, nothing committed
+        self.cursor.fetchall.return_value = [("CLUSTERED COLUMNSTORE",)]
+        self.cursor.fetchone.return_value = None
+
+        await store._swap_temp_to_production()
+
+        store._append_temp_to_production.assert_awaited_once_with(self.connection)
+        store._drop_table_atomic.assert_awaited_once()
+        self.connection.commit.assert_not_called()
+
+
+class TestInsertPlan:
+    """Test the INSERT statement and parameter bindings cache."""
+
+    def setup_method(self):
+        config = MssqlStoreConfig(
+            connection="test_db", table="dbo.Test", table_hints="TABLOCK"
+        )
+        self.store = MssqlStore("test", config)
+
+    def test_bindings_follow_created_column_types(self):
+        schema = pl.Schema(
+            {
+                "name": pl.String,
+                "id": pl.Int64,
+                "amount": pl.Decimal(18, 2),
+                "at": pl.Datetime("us"),
+                "blob": pl.Binary,
+                "took": pl.Duration("us"),
+            }
+        )
+
+        sql, input_sizes = self.store._insert_plan(schema)
+
+        assert sql == (
+            "INSERT INTO [dbo].[Test_hygge_tmp] WITH (TABLOCK) "
+            "([name],[id],[amount],[at],[blob],[took]) VALUES (?,?,?,?,?,?)"
+        )
+        assert input_sizes == [
+            (pyodbc.SQL_WVARCHAR, 4000, 0),
+            (pyodbc.SQL_BIGINT, 19, 0),
+            (pyodbc.SQL_DECIMAL, 38, 10),
+            (pyodbc.SQL_TYPE_TIMESTAMP, 27, 7),
+            (pyodbc.SQL_VARBINARY, 0, 0),
+            None,
+        ]
+
+    def test_plan_is_built_once_per_schema(self):
+        df = pl.DataFrame({"id": [1, 2], "name": ["A", "B"]})
+        connection = MagicMock()
+        cursor = connection.cursor.return_value
+
+        with patch.object(
+            self.store,
+            "_map_polars_type_to_sql",
+            wraps=self.store._map_polars_type_to_sql,
+        ) as mapper:
+            self.store._insert_batch_to_temp(connection, df)
+            self.store._insert_batch_to_temp(connection, df.slice(1))
+
+        assert mapper.call_count == 2  # One per column, on the first chunk only
+        cursor.setinputsizes.assert_called_with(
+            [(pyodbc.SQL_BIGINT, 19, 0), (pyodbc.SQL_WVARCHAR, 4000, 0)]
+        )
+        assert cursor.executemany.call_args[0][1] == [(2, "B")]
+
+    def test_long_string_binds_to_max_column(self):
+        """Test strings over 4000 characters bind as (MAX) for MAX columns."""
+        self.store._temp_columns = {
+            "id": {"length": None, "precision": 19, "scale": 0},
+            "notes": {"length": -1, "precision": None, "scale": None},
+        }
+        notes = "x" * 5000
+        df = pl.DataFrame({"id": [1], "notes": [notes]})
+        connection = MagicMock()
+        cursor = connection.cursor.return_value
+
+        self.store._insert_batch_to_temp(connection, df)
+
+        cursor.setinputsizes.assert_called_with(
+            [(pyodbc.SQL_BIGINT, 19, 0), (pyodbc.SQL_WVARCHAR, 0, 0)]
+        )
+        assert cursor.executemany.call_args[0][1] == [(1, notes)]
+
+    def test_decimal_binds_to_column_scale(self):
+        """Test decimals bind with the column's scale instead of rounding to 10."""
+        from decimal import Decimal
+
+        self.store._temp_columns = {
+            "rate": {"length": None, "precision": 38, "scale": 18},
+            "ratio": {"length": None, "precision": 53, "scale": None},
+        }
+        rate = Decimal("0.123456789012345678")
+        df = pl.DataFrame(
+            {"rate": [rate], "ratio": [Decimal("1.5")]},
+            schema={"rate": pl.Decimal(38, 18), "ratio": pl.Decimal(18, 2)},
+        )
+        connection = MagicMock()
+        cursor = connection.cursor.return_value
+
+        self.store._insert_batch_to_temp(connection, df)
+
+        # FLOAT columns report no scale, so they keep the default binding
+        cursor.setinputsizes.assert_called_with(
+            [(pyodbc.SQL_DECIMAL, 38, 18), (pyodbc.SQL_DECIMAL, 38, 10)]
+        )
+        assert cursor.executemany.call_args[0][1][0][0] == rate
+
+    @pytest.mark.asyncio
+    async def test_column_sizes_read_when_temp_table_created(self):
+        """Test the temp table's declared sizes are read once it exists."""
+        connection = MagicMock()
+        connection.cursor.return_value.fetchall.return_value = [
+            ("name", -1, None, None)
+        ]
+        self.store.pool = MagicMock(spec=ConnectionPool)
+        self.store.pool.acquire = AsyncMock(return_value=connection)
+        self.store.pool.release = AsyncMock()
+        self.store._table_exists_for_name = AsyncMock(return_value=False)
+        self.store._create_table = AsyncMock()
+        self.store._insert_plan(pl.Schema({"name": pl.String}))
+
+        await self.store._ensure_temp_table_exists(pl.DataFrame({"name": ["A"]}))
+
+        assert self.store._temp_columns == {
+            "name": {"length": -1, "precision": None, "scale": None}
+        }
+        _, input_sizes = self.store._insert_plan(pl.Schema({"name": pl.String}))
+        assert input_sizes == [(pyodbc.SQL_WVARCHAR, 0, 0)]
+
+
+class TestArrowLoadMethod:
+    """Test the arrow-odbc load method for temp table writes."""
+
+    def setup_method(self):
+        """Setup test store with mock pool."""
+        config = MssqlStoreConfig(
+            connection="test_db",
+            table="dbo.Test",
+            if_exists="replace",
+            load_method="arrow_odbc",
+            batch_size=5000,
+        )
+        self.store = MssqlStore("test", config)
+        self.store.pool = MagicMock(spec=ConnectionPool)
+        self.store.pool.connection_factory = MagicMock()
+        self.store.pool.acquire = AsyncMock(return_value=MagicMock())
+        self.store.pool.release = AsyncMock()
+
+    def test_load_method_defaults_to_executemany(self):
+        config = MssqlStoreConfig(connection="test_db", table="dbo.Test")
+        assert MssqlStore("test", config).load_method == "executemany"
+
+    @pytest.mark.asyncio
+    async def test_chunk_goes_through_arrow_insert(self):
+        df = pl.DataFrame({"id": [1, 2], "name": ["A", None]})
+        self.store._insert_batch_to_temp = MagicMock()
+
+        await self.store._write_chunk_to_temp(df)
+
+        insert = self.store.pool.connection_factory.insert_arrow
+        table, data, chunk_size, arrow_connection = insert.call_args[0]
+        assert table == "[dbo].[Test_hygge_tmp]"
+        assert data.column("name").to_pylist() == ["A", None]
+        assert str(data.schema.field("name").type) == "string"
+        assert chunk_size == 5000
+        assert arrow_connection is None
+        self.store._insert_batch_to_temp.assert_not_called()
+        # The pooled connection still bounds concurrent loads
+        self.store.pool.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_writers_reuse_one_arrow_connection(self):
+        factory = self.store.pool.connection_factory
+        factory.connect_arrow.side_effect = lambda: MagicMock()
+        self.store.parallel_workers = 2
+        self.store.commit_rows = 4
+        self.store._ensure_temp_table_exists = AsyncMock()
+
+        for start in range(0, 30, 10):
+            await self.store._save(pl.DataFrame({"id": range(start, start + 10)}))
+        await self.store.finish()
+
+        # One arrow-odbc login per writer, however many chunks it loads
+        assert factory.insert_arrow.call_count > 2
+        assert factory.connect_arrow.call_count == 2
+        used = {call.args[3] for call in factory.insert_arrow.call_args_list}
+        assert len(used) == 2 and None not in used
+
+    @pytest.mark.asyncio
+    async def test_arrow_connect_failure_is_a_connection_error(self):
+        self.store.pool.connection_factory.connect_arrow.side_effect = RuntimeError(
+            "Login timeout expired"
+        )
+        self.store._ensure_temp_table_exists = AsyncMock()
+
+        await self.store._save(pl.DataFrame({"id": range(10)}))
+        with pytest.raises(StoreConnectionError, match="arrow-odbc connection"):
+            await self.store.finish()
+        self.store.pool.connection_factory.insert_arrow.assert_not_called()
+
+
 class TestSchemaValidationForAppend:
     """Test schema validation and adaptation for append mode."""
 